@@ -0,0 +1,177 @@
+"""
+background.py
+=============
+Statické vesmírné pozadí menu — generování v NumPy a cache na disku.
+
+Pozadí se dřív při každém startu kreslilo po řádcích (pygame.draw.line
+pro každý řádek gradientu) a pak se blitovalo pět průhledných kruhů
+mlhovin; výsledek byl navíc při každém spuštění jiný. Teď:
+
+  - gradient i mlhoviny se složí v jednom poli NumPy a do povrchu se
+    přenesou jedním surfarray blitem,
+  - náhoda je dána seedem (config.json → "background_seed"), takže
+    stejné (rozlišení, seed) dá vždy stejný obrázek,
+  - hotové pozadí se uloží do BACKGROUND_CACHE_DIR a při dalším startu
+    se jen načte. Ukládá se nekomprimované BMP (~6 MB pro 1920×1080):
+    načte se zhruba 3× rychleji než PNG.
+
+Změna rozlišení v GraphicsState se projeví až po restartu; stav proto
+pozadí pro nové rozlišení předpeče hned (bake_space_background ve vlákně),
+aby další start našel obrázek v cache.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pygame
+from settings import BACKGROUND_CACHE_DIR
+
+
+# Verze generátoru — součást názvu souboru; změna algoritmu zneplatní cache
+GENERATOR_VERSION = 1
+
+TOP_COLOR    = (0, 0, 0)        # Horní okraj gradientu: černá
+BOTTOM_COLOR = (20, 0, 40)      # Dolní okraj gradientu: tmavě fialová
+NEBULA_COLORS = [(100, 0, 150), (50, 0, 100), (20, 10, 60)]
+NEBULA_COUNT = 5
+
+
+def cache_path(width: int, height: int, seed: int) -> str:
+    """Vrátí cestu k předpečenému pozadí pro dané rozlišení a seed."""
+    name = f"space_v{GENERATOR_VERSION}_{width}x{height}_{seed}.bmp"
+    return os.path.join(BACKGROUND_CACHE_DIR, name)
+
+
+def render_space_background(width: int, height: int, seed: int) -> np.ndarray:
+    """
+    Vygeneruje pixely vesmírného pozadí.
+
+    Skládá se ze dvou vrstev:
+      1. Gradientní přechod TOP_COLOR (nahoře) → BOTTOM_COLOR (dole).
+      2. Mlhoviny jako průhledné barevné kruhy (alpha 30–80) skládané
+         přes sebe v pořadí vzniku.
+
+    Args:
+        width, height: Rozměry pozadí (px).
+        seed: Seed náhodného rozmístění mlhovin.
+
+    Returns:
+        np.ndarray: Pole tvaru (width, height, 3), dtype uint8 (osy jako surfarray).
+    """
+    rng = np.random.default_rng(seed)
+
+    # Gradient: barva řádku interpolovaná mezi top a bottom (0.0 nahoře, 1.0 dole)
+    ratio = np.arange(height) / height
+    top = np.array(TOP_COLOR, dtype=np.float64)
+    bottom = np.array(BOTTOM_COLOR, dtype=np.float64)
+    rows = np.floor(top * (1 - ratio[:, None]) + bottom * ratio[:, None]).astype(np.float32)
+    pixels = np.broadcast_to(rows, (width, height, 3)).copy()
+
+    # Mlhoviny: alpha blending jen uvnitř ohraničujícího obdélníku kruhu
+    for _ in range(NEBULA_COUNT):
+        cx = int(rng.integers(0, width + 1))
+        cy = int(rng.integers(0, height + 1))
+        radius = int(rng.integers(150, 401))
+        color = np.array(NEBULA_COLORS[rng.integers(len(NEBULA_COLORS))], dtype=np.float32)
+        alpha = int(rng.integers(30, 81)) / 255   # Nízká alpha = jemný efekt
+
+        x0, x1 = max(0, cx - radius), min(width, cx + radius)
+        y0, y1 = max(0, cy - radius), min(height, cy + radius)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        # Polovina výšky kruhu v každém sloupci → váha alpha uvnitř, 0 venku
+        dx = np.arange(x0, x1) - cx
+        half = np.sqrt(radius * radius - dx * dx)
+        dy = np.abs(np.arange(y0, y1) - cy)
+        weight = (dy[None, :] <= half[:, None]) * np.float32(alpha)
+        region = pixels[x0:x1, y0:y1]
+        region += (color - region) * weight[:, :, None]
+
+    pixels += 0.5   # Zaokrouhlení při převodu na uint8
+    return pixels.astype(np.uint8)
+
+
+def create_space_background(width: int, height: int, seed: int) -> pygame.Surface:
+    """
+    Vytvoří povrch vesmírného pozadí (bez cache).
+
+    Returns:
+        pygame.Surface: Hotové pozadí připravené k blit().
+    """
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, render_space_background(width, height, seed))
+    return surface
+
+
+def bake_space_background(width: int, height: int, seed: int) -> str:
+    """
+    Vygeneruje pozadí a uloží ho do cache, pokud tam ještě není.
+
+    Nepoužívá displej a chyby zápisu jen vypíše, takže se dá volat
+    i z vedlejšího vlákna (i víckrát souběžně pro stejný soubor).
+
+    Returns:
+        str | None: Cesta k souboru v cache, None = uložení selhalo.
+    """
+    path = cache_path(width, height, seed)
+    if not os.path.exists(path):
+        try:
+            _save(create_space_background(width, height, seed), path)
+        except (OSError, pygame.error) as e:
+            print(f"Pozadí nelze uložit do cache: {e}")
+            return None
+    return path
+
+
+def _save(surface: pygame.Surface, path: str) -> None:
+    """
+    Uloží pozadí do cache přes dočasný soubor.
+
+    Přerušený zápis nenechá poškozený soubor a každý zápis má vlastní
+    dočasný soubor, takže dva souběžné zápisy stejného pozadí si
+    nepřepíšou rozpracovaná data (vyhraje poslední os.replace).
+    """
+    os.makedirs(BACKGROUND_CACHE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=".tmp.bmp", dir=BACKGROUND_CACHE_DIR)
+    os.close(fd)
+    try:
+        pygame.image.save(surface, tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_space_background(width: int, height: int, seed: int) -> pygame.Surface:
+    """
+    Vrátí vesmírné pozadí z cache na disku; při chybě ho vygeneruje a uloží.
+
+    Args:
+        width, height: Rozměry pozadí (px).
+        seed: Seed mlhovin (config.json → "background_seed").
+
+    Returns:
+        pygame.Surface: Pozadí ve formátu displeje (pokud existuje okno).
+    """
+    path = cache_path(width, height, seed)
+    surface = None
+    if os.path.exists(path):
+        try:
+            surface = pygame.image.load(path)
+            if surface.get_size() != (width, height):
+                surface = None
+        except pygame.error as e:
+            print(f"Poškozené pozadí v cache ({path}): {e}")
+            surface = None
+
+    if surface is None:
+        surface = create_space_background(width, height, seed)
+        try:
+            _save(surface, path)
+        except (OSError, pygame.error) as e:
+            print(f"Pozadí nelze uložit do cache: {e}")
+
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
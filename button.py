@@ -34,6 +34,11 @@ class Button:
         was_hovered (bool): Stav z minulého snímku — detekce vstupu kurzoru.
         rect (pygame.Rect): Bounding box textu — aktualizuje se při vykreslení.
         enabled (bool): False = tlačítko je neaktivní (nezajímá hover ani kliknutí).
+
+    Text se vykreslí jednou za krok velikosti (font_cache.render) jako
+    maska — černá barva, vyhlazení v alfa kanálu. Šedá barva pulzu se
+    pak aplikuje jedním blitem masky s BLEND_RGBA_ADD do pomocného
+    povrchu vyplněného (šedá, alfa 0) — bez font.render() v každém snímku.
     """
 
     def __init__(self, text: str, center: tuple, action=None, base_size: int = 48):
@@ -59,6 +64,9 @@ class Button:
         self.rect = pygame.Rect(0, 0, 0, 0)  # Inicializuje se při prvním render()
         self.enabled = True
 
+        self._tinted = None      # Pomocný povrch s textem v aktuální barvě
+        self._tint_key = None    # (bílý text, jas) posledního obarvení
+
     def update(self, dt: float, mouse_pos: tuple) -> bool:
         """
         Aktualizuje animační stav tlačítka na základě pozice myši.
@@ -131,14 +139,35 @@ class Button:
 
         display_color = int(max(0, min(255, self.color_value + pulse)))
 
-        font = font_cache.get(self.font_size)
-        text_surface = font.render(self.text, True, (display_color,) * 3)
+        text_surface = self._tint(
+            font_cache.render(self.text, self.font_size, (0, 0, 0)),
+            display_color
+        )
 
         self.rect = text_surface.get_rect(center=self.center)
         surface.blit(text_surface, self.rect)
 
         return self.rect
 
+    def _tint(self, mask: pygame.Surface, value: int) -> pygame.Surface:
+        """
+        Vrátí masku textu obarvenou na šedou (value, value, value).
+
+        Maska má RGB 0 a v alfa kanálu pokrytí písmem; přičtením ke
+        (value, value, value, 0) vznikne přesně povrch, jaký by vrátil
+        font.render() v šedé barvě.
+        """
+        if self._tint_key == (mask, value):
+            return self._tinted
+
+        if self._tinted is None or self._tinted.get_size() != mask.get_size():
+            self._tinted = pygame.Surface(mask.get_size(), pygame.SRCALPHA)
+        tinted = self._tinted
+        tinted.fill((value, value, value, 0))
+        tinted.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        self._tint_key = (mask, value)
+        return tinted
+
 
 # =============================================================================
 # VSTUPNÍ POLE
@@ -157,6 +186,8 @@ class InputBox:
         text (str): Aktuální obsah pole.
         active (bool): True = pole přijímá klávesové vstupy.
         is_password (bool): True = zobrazuje hvězdičky místo znaků.
+
+    Vykreslený text se drží v cache a znovu se vykreslí jen při změně obsahu.
     """
 
     def __init__(self, x: int, y: int, w: int, h: int,
@@ -177,6 +208,9 @@ class InputBox:
         self.active = False
         self.is_password = is_password
 
+        self._text_surface = None
+        self._rendered_text = None
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """
         Zpracuje pygame událost relevantní pro vstupní pole.
@@ -197,18 +231,24 @@ class InputBox:
             elif event.key != pygame.K_RETURN:
                 self.text += event.unicode
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """
         Vykreslí vstupní pole na zadaný povrch.
 
         Args:
             surface: Cílový pygame povrch.
+
+        Returns:
+            pygame.Rect: Oblast pole včetně textu, který může přesahovat.
         """
         display_text = "*" * len(self.text) if self.is_password else self.text
 
-        txt_surface = self.font.render(display_text, True, (255, 255, 255))
-        surface.blit(txt_surface, (self.rect.x + 10, self.rect.y + 8))
+        if display_text != self._rendered_text:
+            self._text_surface = self.font.render(display_text, True, (255, 255, 255))
+            self._rendered_text = display_text
+        text_rect = surface.blit(self._text_surface, (self.rect.x + 10, self.rect.y + 8))
         pygame.draw.rect(surface, self.color, self.rect, 2)
+        return self.rect.union(text_rect)
 
 
 # =============================================================================
@@ -0,0 +1,183 @@
+"""
+compositor.py
+=============
+Skládání snímku menu a hry — pozadí, meteory, hvězdy a aktuální stav.
+
+Hlavní smyčka dřív každý snímek zkopírovala celé statické pozadí
+(1920×1080), vykreslila meteory, hvězdy i stav a zavolala
+pygame.display.flip(), i když se na statické obrazovce (např. login)
+mění jen pár pixelů. Compositor umí dva režimy:
+
+  - "full"  — celé překreslení a flip() (původní chování),
+  - "dirty" — obnoví se jen oblasti, kde se minulý snímek kreslilo,
+              vykreslí se nový obsah a na displej se pošlou jen změněné
+              obdélníky přes pygame.display.update(rects).
+
+Dirty režim stojí na invariantu: mimo obdélníky minulého snímku je
+na obrazovce čisté pozadí. Každá vrstva proto vrací obdélníky, kam
+kreslila — meteory, hvězdy i stav (render() vrací seznam obdélníků).
+Stav, který obdélníky neumí určit (render() vrátí None), dostane
+celý flip() a celé překreslení i v dalším snímku.
+
+Vrstvy pod stavem určuje stav sám (viz BaseState):
+
+  - opaque = True      — stav každý snímek pokryje celou obrazovku
+                         (PlayingState s vlastním obrázkem pozadí);
+                         žádná sdílená vrstva se neaktualizuje ani nekreslí,
+  - background_color   — RGB = obrazovku vyplní Compositor touto barvou,
+                         None = obnovuje se statické vesmírné pozadí,
+  - backdrop_layers    — které animované vrstvy ("meteors", "stars")
+                         stav potřebuje; ostatní se přeskočí včetně update.
+"""
+
+import time
+
+import pygame
+from config import MenuConfig
+from visuals import starfield
+from profiler import profiler
+
+
+SPACE = "space"     # Výplň pozadí statickým vesmírným pozadím (ne barvou)
+
+
+class Compositor:
+    """
+    Skládá snímek z pozadí, sdílených vrstev (meteory, hvězdy) a stavu.
+
+    Attributes:
+        screen (pygame.Surface): Okno, do kterého se kreslí.
+        background (pygame.Surface): Statické vesmírné pozadí.
+        layers (dict): Sdílené vrstvy {název: vrstva} v pořadí kreslení;
+                       vrstva má update(dt, hyperspace) a draw(surface,
+                       hyperspace) vracející seznam obdélníků.
+        dirty (bool): True = dirty-rect režim, False = vždy celé překreslení.
+        full_frames (int): Počet snímků vykreslených celé (pro ladění).
+        dirty_frames (int): Počet snímků vykreslených po obdélnících.
+    """
+
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface,
+                 meteors, dirty: bool = MenuConfig.DIRTY_RECTS):
+        self.screen = screen
+        self.background = background
+        self.layers = {"meteors": meteors, "stars": starfield}
+        self.dirty = dirty
+        self.full_frames = 0
+        self.dirty_frames = 0
+
+        self._prev_rects = []     # Obdélníky, kam se kreslilo v minulém snímku
+        self._full = True         # Příští snímek se musí vykreslit celý
+        self._state = None
+        self._backdrop = None
+
+    def invalidate(self) -> None:
+        """Vynutí celé překreslení v příštím snímku (např. po odkrytí okna)."""
+        self._full = True
+
+    def set_dirty(self, dirty: bool) -> None:
+        """Přepne dirty-rect režim (změna se projeví celým snímkem)."""
+        self.dirty = dirty
+        self._full = True
+
+    # =========================================================================
+    # VRSTVY
+    # =========================================================================
+
+    def backdrop(self, state) -> tuple:
+        """
+        Vrátí výplň pozadí a sdílené vrstvy, které stav potřebuje.
+
+        Returns:
+            tuple: (výplň, názvy vrstev). Výplň je SPACE (vesmírné pozadí),
+                   RGB barva stavu, nebo None u neprůhledného stavu —
+                   pak se pod stavem nekreslí nic.
+        """
+        if state is None:
+            return SPACE, tuple(self.layers)
+        if state.opaque:
+            return None, ()
+        layers = tuple(name for name in self.layers if name in state.backdrop_layers)
+        return state.background_color or SPACE, layers
+
+    def update(self, state, dt: float, hyperspace: bool) -> None:
+        """Aktualizuje jen vrstvy, které jsou pod aktuálním stavem vidět."""
+        for name in self.backdrop(state)[1]:
+            self.layers[name].update(dt, hyperspace)
+
+    # =========================================================================
+    # SNÍMEK
+    # =========================================================================
+
+    def render(self, state, hyperspace: bool) -> None:
+        """
+        Vykreslí snímek a pošle ho na displej.
+
+        Args:
+            state: Aktuální stav (BaseState) nebo None.
+            hyperspace: True = hvězdy v hyperspace režimu.
+        """
+        screen = self.screen
+        backdrop = self.backdrop(state)
+        fill, layers = backdrop
+
+        # Změna stavu nebo jeho vrstev — minulý snímek neodpovídá invariantu
+        if state is not self._state or backdrop != self._backdrop:
+            self._state = state
+            self._backdrop = backdrop
+            self._full = True
+        full = self._full or not self.dirty
+
+        if profiler.enabled:
+            profiler.mark()
+
+        # ── Obnova pozadí ─────────────────────────────────────────────────────
+        prev = self._prev_rects
+        if fill is None:
+            pass    # Neprůhledný stav překreslí celou obrazovku sám
+        elif fill == SPACE:
+            if full:
+                screen.blit(self.background, (0, 0))
+            else:
+                background = self.background
+                screen.blits([(background, r, r) for r in prev], doreturn=False)
+        else:
+            if full:
+                screen.fill(fill)
+            else:
+                for r in prev:
+                    screen.fill(fill, r)
+
+        # ── Sdílené vrstvy, které stav potřebuje ──────────────────────────────
+        rects = []
+        for name in layers:
+            rects += self.layers[name].draw(screen, hyperspace)
+        if profiler.enabled:
+            profiler.lap("render.backdrop")
+            t0 = time.perf_counter_ns()
+
+        # ── Stav ──────────────────────────────────────────────────────────────
+        state_rects = state.render(screen) if state else []
+        if profiler.enabled:
+            profiler.record("render.state", t0)
+            profiler.mark()
+
+        # ── Zobrazení ─────────────────────────────────────────────────────────
+        if state_rects is None:
+            # Stav neumí hlásit obdélníky — celý flip i v příštím snímku
+            pygame.display.flip()
+            self._full = True
+            self._prev_rects = []
+            self.full_frames += 1
+        else:
+            rects += state_rects
+            if full:
+                pygame.display.flip()
+                self.full_frames += 1
+            else:
+                pygame.display.update(prev + rects)
+                self.dirty_frames += 1
+            self._full = False
+            self._prev_rects = rects
+
+        if profiler.enabled:
+            profiler.lap("flip")
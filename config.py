@@ -26,6 +26,24 @@ class GameConfig:
     WIDTH, HEIGHT = 1920, 1080      # Rozměry herního okna v pixelech
     GROUND_LEVEL = HEIGHT * 0.8     # Y-souřadnice podlahy (80 % výšky obrazovky)
     FPS = 144                       # Cílový počet snímků za sekundu
+    FIXED_TIMESTEP = True           # True = simulace v pevných krocích nezávislých na FPS vykreslování
+    SIMULATION_HZ = 120             # Frekvence simulace při pevném kroku (kroky/s)
+    MAX_CATCHUP_STEPS = 5           # Max. počet simulačních kroků za snímek (zbytek času se zahodí)
+    RECORD_REPLAYS = False          # True = každá hra se nahraje do složky REPLAY_DIR (viz replay.py)
+    PROFILER_FRAMES = 600           # Kolik posledních snímků drží profiler fází (F9 zapnout, F10 uložit)
+    FRAME_HISTORY = 2048            # Kapacita bufferu délek snímků pro F1 HUD
+    FRAME_STATS_SECONDS = 5         # Okno percentilů délky snímku v F1 HUD (s)
+    RENDER_SCALE = 1.0              # Měřítko vnitřního rozlišení herní scény (1.0 = plné, config.json)
+    RENDER_SCALES = (1.0, 0.75, 0.5)  # Volby měřítka v Settings → Graphics
+
+    # ── Regulátor kvality (quality.py) ───────────────────────────────────────
+    QUALITY_GOVERNOR = True         # True = kvalita efektů se přizpůsobuje délce snímku
+    QUALITY_WINDOW = 60             # Počet snímků klouzavého průměru práce na snímek
+    QUALITY_DOWN_RATIO = 0.9        # Průměr nad 90 % rozpočtu (1000 / FPS ms) = tlak → snížit kvalitu
+    QUALITY_UP_RATIO = 0.5          # Průměr pod 50 % rozpočtu = rezerva → zvýšit kvalitu
+    QUALITY_DOWN_HOLD = 0.5         # Jak dlouho (s) musí tlak trvat před snížením
+    QUALITY_UP_HOLD = 3.0           # Jak dlouho (s) musí rezerva trvat před zvýšením (hystereze)
+    DAMAGE_TEXT_COALESCE_RADIUS = 40  # Dosah slučování textů poškození při nižší kvalitě (px)
 
     # ── Fyzika ───────────────────────────────────────────────────────────────
     GRAVITY = 800                   # Gravitační zrychlení hráče i nepřátel (px/s²)
@@ -60,6 +78,7 @@ class GameConfig:
     PROJECTILE_RADIUS = 5           # Poloměr kolizní kružnice projektilu (px)
     PROJECTILE_DAMAGE = 20          # Základní poškození jednoho zásahu
     PROJECTILE_DELAY = 300          # Minimální interval mezi výstřely (ms) — brání spamu
+    PROJECTILE_TRAIL_LENGTH = 8     # Počet historických pozic ve vizuální stopě projektilu
     # Dostupné barvy projektilů; barva zároveň určuje typ efektu (viz utils.py)
     PROJECTILE_COLORS = [
         (254, 0, 246),   # Fialová  → pierce (průstřelný)
@@ -81,6 +100,8 @@ class GameConfig:
     PARTICLE_COUNT = 12             # Výchozí počet částic při výbuchu/zásahu
     PARTICLE_LIFETIME = 0.5         # Životnost jedné částice (s)
     PARTICLE_SPEED = 200            # Maximální rychlost částice (px/s)
+    MAX_PARTICLES = 1500            # Rozpočet částic — při překročení se zahodí nejstarší
+    PARTICLE_ADDITIVE = False       # True = částice se sčítají se scénou (BLEND_RGB_ADD) místo alfa míchání
 
     # ── Vizuální efekty ──────────────────────────────────────────────────────
     VIGNETTE_DECAY = 120            # Rychlost mizení vignette efektu při zásahu (px/s)
@@ -92,6 +113,16 @@ class GameConfig:
     DOT_DURATION = 2.0              # Délka trvání damage over time efektu (s)
     DOT_DAMAGE_FACTOR = 0.25        # Poškození DoT za sekundu jako násobek základního dmg projektilu
 
+    # ── Pooly objektů (recyklace místo alokace) ──────────────────────────────
+    POOL_ENEMIES = 128              # Předalokovaní nepřátelé (pohledy + kapacita polí roje)
+    POOL_PROJECTILES = 64           # Předalokované projektily (pohledy + kapacita polí dávky)
+    POOL_DAMAGE_TEXTS = 128         # Předalokované záznamy plovoucích textů poškození
+
+    # ── Detekce kolizí ───────────────────────────────────────────────────────
+    USE_SPATIAL_GRID = True         # True = broadphase přes mřížku (spatial.py), False = brute-force O(P×E)
+    SPATIAL_CELL_SIZE = 64          # Velikost buňky mřížky (px) — zhruba průměr nepřítele s rezervou
+    EXPLOSION_RADIUS = 50           # Dosah plošného poškození explozivního projektilu (px)
+
 
 # =============================================================================
 # MENU KONFIGURACE
@@ -104,9 +135,10 @@ class MenuConfig:
     a má vlastní smyčku i FPS nastavení.
     """
 
-    MENU_FPS = 144                  # FPS menu smyčky
+    MENU_FPS = 60                   # Limit FPS menu a intra (hra má GameConfig.FPS)
     MENU_NUM_STARS = 150            # Celkový počet hvězd na pozadí (rozděleny do 3 vrstev)
     MENU_HYPERSPACE_DURATION = 1.0  # Délka hyperspace animace při přechodu z Intra do Menu (s)
+    DIRTY_RECTS = True              # True = menu posílá na displej jen změněné obdélníky (compositor.py)
 
     # Barvy hvězd — shodné s barvami projektilů pro vizuální konzistenci hry
     MENU_STAR_COLORS = [
@@ -123,6 +155,17 @@ class MenuConfig:
     # Cesta k vlastnímu fontu Orbitron — sci-fi styl odpovídající vesmírnému tématu hry
     MENU_FONT_PATH = "Assets/font/Orbitron/static/Orbitron-Regular.ttf"
 
+    # ── Tempo snímků (pacing.py) ─────────────────────────────────────────────
+    PACING_IDLE_FPS = 10            # Limit FPS bez fokusu, při minimalizaci a na nečinné statické obrazovce
+    PACING_IDLE_TIMEOUT = 15.0      # Nečinnost (s), po které stav bez backdrop_layers přejde na idle
+    PACING_BUSY_LOOP = False        # True = tick_busy_loop (přesnější tempo, vytížené jádro)
+    PACING_HISTORY = 600            # Počet rozestupů snímků pro měření jitteru
+
+    # ── Cache fontů ──────────────────────────────────────────────────────────
+    FONT_SIZE_STEP = 2              # Velikosti písma se zaokrouhlí na násobek kroku (animace hoveru)
+    FONT_CACHE_SIZE = 16            # Max. počet fontů v cache (LRU)
+    TEXT_CACHE_SIZE = 256           # Max. počet vykreslených textů v cache (LRU)
+
 
 # =============================================================================
 # SÍŤOVÁ KONFIGURACE
@@ -6,13 +6,24 @@ Třída Enemy reprezentující nepřátelský objekt.
 Nepřátelé se spawnují na okrajích obrazovky a pohybují se přímo
 k hráči. Podporují efekty slow (zpomalení pohybu) a dot (damage
 over time). Při zásahu vizuálně blikají interpolací barvy.
+
+Stav všech nepřátel ve hře drží EnemySwarm jako souvislá NumPy pole
+(pozice, zdraví, časovače efektů, příznak života). Pohyb, DoT, odpočet
+časovačů i detekce smrti proběhnou jednou vektorizovanou operací pro
+celý roj. Třída Enemy je tenký pohled (view) na jeden slot roje —
+zachovává původní API pro vykreslování, kolize a testy.
 """
 
-import math
+import itertools
 
+import numpy as np
 import pygame
-from visuals import Colors
 from config import GameConfig
+from soa import ViewStore, store_field
+from sprites import sprite_cache, flash_level, pulse_level, scaled_radius
+
+# Globální čítač identifikátorů — uid zůstává unikátní i po recyklaci pohledu
+_enemy_uids = itertools.count(1)
 
 
 class Enemy:
@@ -35,39 +46,67 @@ class Enemy:
         dot_timer (float): Zbývající čas DoT efektu (s).
         dot_damage (float): Poškození DoT za sekundu.
         is_alive (bool): False = nepřítel je mrtvý a čeká na odstranění ze seznamu.
+        uid (int): Unikátní identifikátor nepřítele — na rozdíl od objektu
+                   pohledu (recyklovaného přes pool) se nikdy neopakuje.
+
+    Všechny atributy kromě radius, flash_time a aoe_effects jsou property
+    čtoucí z polí EnemySwarm. pos vrací kopii — změna se uloží jen přiřazením
+    (enemy.pos = ..., enemy.pos += ...), nikoli úpravou enemy.pos.x.
+
+    Samostatný Enemy(x, y) není tenký pohled: založí vlastní jednoslotový
+    EnemySwarm (sada polí NumPy + ObjectPool, ~50 µs oproti ~15 µs za
+    EnemySwarm.spawn()). Je určený jen pro testy a jednotlivé použití —
+    hra spawnuje přímo do roje (spawn_enemy_improved(swarm)). Sdílený
+    záložní roj by držel odkazy na všechny zahozené samostatné nepřátele,
+    jednoslotový roj zanikne i s pohledem.
     """
 
     def __init__(self, x: float, y: float, hp: int = 60):
         """
-        Inicializuje nepřítele na zadané pozici.
+        Inicializuje samostatného nepřítele na zadané pozici.
+
+        Samostatný nepřítel má vlastní jednoslotový roj; do herního roje
+        se přesune voláním EnemySwarm.add().
 
         Args:
             x: Počáteční X souřadnice (px).
             y: Počáteční Y souřadnice — obvykle GROUND_LEVEL.
             hp: Počáteční zdraví. Výchozí hodnota 60, max 100 (viz GameConfig).
         """
-        self.pos = pygame.Vector2(x, y)
-        self.radius = GameConfig.ENEMY_RADIUS
-        self.health = hp
-        self.max_health = hp
+        EnemySwarm(capacity=1).spawn(x, y, hp, view=self)
 
-        # ── Vizuální efekty ────────────────────────────────────────────────
-        self.hurt_timer = 0.0           # Odpočítává zbývající čas bliknutí po zásahu
+    def _reset(self) -> None:
+        """Nastaví atributy, které nejsou uložené v polích roje."""
+        self.radius = GameConfig.ENEMY_RADIUS
         self.flash_time = GameConfig.HURT_FLASH_TIME  # Celková délka bliknutí
 
-        # ── Efekt zpomalení (slow) ─────────────────────────────────────────
-        self.slow_timer = 0             # Zbývající čas zpomalení (s)
-        self.slow_factor = 1            # 1.0 = plná rychlost, 0.5 = polovina
-
-        # ── Efekt DoT (damage over time) ──────────────────────────────────
-        self.dot_timer = 0              # Zbývající čas DoT efektu (s)
-        self.dot_damage = 0             # HP odečtená za každou sekundu DoT
-
-        # Rezerva pro budoucí AoE efekty
-        self.aoe_effects = []
-
-        # Příznak life — herní smyčka na základě toho odstraní nepřítele
-        self.is_alive = True
+        # Rezerva pro budoucí AoE efekty (seznam se při recyklaci znovu použije)
+        if not hasattr(self, "aoe_effects"):
+            self.aoe_effects = []
+
+        # Fáze pulzování jádra se počítá od prvního vykreslení
+        self.__dict__.pop("_last_time", None)
+
+    # ── Atributy uložené v polích roje ─────────────────────────────────────
+    health      = store_field("health", "Aktuální zdraví.")
+    max_health  = store_field("max_health", "Maximální zdraví.")
+    hurt_timer  = store_field("hurt_timer", "Zbývající čas bliknutí po zásahu (s).")
+    slow_timer  = store_field("slow_timer", "Zbývající čas zpomalení (s).")
+    slow_factor = store_field("slow_factor", "Multiplikátor rychlosti (1.0 = plná rychlost).")
+    dot_timer   = store_field("dot_timer", "Zbývající čas DoT efektu (s).")
+    dot_damage  = store_field("dot_damage", "HP odečtená za každou sekundu DoT.")
+    is_alive    = store_field("alive", "False = nepřítel je mrtvý a čeká na odstranění.")
+    uid         = store_field("uid", "Unikátní identifikátor nepřítele.")
+
+    @property
+    def pos(self) -> pygame.Vector2:
+        """Kopie aktuální pozice středu nepřítele."""
+        p = self._store.pos[self._index]
+        return pygame.Vector2(float(p[0]), float(p[1]))
+
+    @pos.setter
+    def pos(self, value) -> None:
+        self._store.pos[self._index] = (value[0], value[1])
 
     # =========================================================================
     # AKTUALIZACE
@@ -77,6 +116,9 @@ class Enemy:
         """
         Aktualizuje pozici a všechny aktivní efekty nepřítele.
 
+        Skalární varianta pro samostatné nepřátele a testy — herní smyčka
+        aktualizuje celý roj najednou přes EnemySwarm.update().
+
         Pořadí operací:
           1. Pohyb směrem k hráči (s aplikací slow faktoru).
           2. Odečtení DoT poškození.
@@ -122,63 +164,43 @@ class Enemy:
     # VYKRESLOVÁNÍ
     # =========================================================================
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def render_pos(self, alpha: float = 1.0) -> pygame.Vector2:
+        """
+        Pozice pro vykreslení interpolovaná mezi posledními dvěma kroky simulace.
+
+        Args:
+            alpha: 0.0 = pozice před posledním krokem, 1.0 = aktuální pozice.
+        """
+        p = self._store.pos[self._index]
+        q = self._store.prev_pos[self._index]
+        return pygame.Vector2(
+            float(q[0] + (p[0] - q[0]) * alpha),
+            float(q[1] + (p[1] - q[1]) * alpha)
+        )
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, scale: float = 1.0) -> None:
         """
         Vykreslí nepřítele jako stylizovaný energetický kruh s červenou tématikou.
 
         Pokud je aktivní hurt_timer (nedávný zásah), barva se interpoluje
         od normální červené k bílé — vytváří efekt bliknutí.
         Intenzita bliknutí klesá lineárně s ubývajícím hurt_timerem.
+        Sprite se bere z sprite_cache (sprites.py) — kreslení je jeden blit.
 
         Args:
             screen: Cílový pygame povrch.
+            alpha: Interpolační faktor pevného kroku (viz render_pos()).
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
         """
         if not self.is_alive:
             return
 
-        center = (int(self.pos.x), int(self.pos.y))
-        r = self.radius
+        pos = self.render_pos(alpha) * scale
 
-        # Výpočet aktuální barvy podle hurt_timeru (blikání)
-        if self.hurt_timer > 0:
-            t = max(0.0, min(1.0, self.hurt_timer / self.flash_time))
-            # Interpolace: základní červená → bílá
-            base_color = Colors.ENEMY  # předpokládám, že Colors.ENEMY je červená
-            flash_col = (
-                int(base_color[0] + (255 - base_color[0]) * t),
-                int(base_color[1] + (255 - base_color[1]) * t),
-                int(base_color[2] + (255 - base_color[2]) * t),
-            )
-        else:
-            base_color = Colors.ENEMY
-            flash_col = base_color
-
-        # 1. Vnější záře (jemně průhledná)
-        glow_radius = r + 4
-        glow_surf = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-        glow_color = (*flash_col[:3], 50)  # použijeme aktuální barvu s alfa 50
-        pygame.draw.circle(glow_surf, glow_color, (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surf, (center[0] - glow_radius, center[1] - glow_radius))
-
-        # 2. Hlavní tělo (tmavší varianta aktuální barvy)
-        dark_body = (
-            max(flash_col[0] - 50, 20),
-            max(flash_col[1] - 50, 20),
-            max(flash_col[2] - 50, 20)
-        )
-        pygame.draw.circle(screen, dark_body, center, r)
-
-        # 3. Vnitřní prstenec (světlejší okraj)
-        ring_radius = r - 3
-        ring_width = 3
-        ring_color = (
-            min(flash_col[0] + 40, 255),
-            min(flash_col[1] + 40, 255),
-            min(flash_col[2] + 40, 255)
-        )
-        pygame.draw.circle(screen, ring_color, center, ring_radius, ring_width)
+        # Úroveň bliknutí: barva se interpoluje od červené k bílé podle hurt_timeru
+        flash = flash_level(self.hurt_timer / self.flash_time) if self.hurt_timer > 0 else 0
 
-        # 4. Pulzující jádro (velikost se mění v čase)
+        # Pulzující jádro (fáze se posouvá v čase)
         if not hasattr(self, '_last_time'):
             self._last_time = pygame.time.get_ticks()
             self._pulse_phase = 0
@@ -187,21 +209,10 @@ class Enemy:
         dt = current_time - self._last_time
         self._last_time = current_time
         self._pulse_phase += dt * 0.005  # rychlost pulzování
-        core_radius = int(r * (0.5 + 0.2 * (1 + math.sin(self._pulse_phase)) / 2))
-
-        # Středové jádro – sytá, zářivá barva (při blikání bílá)
-        core_color = flash_col
-        pygame.draw.circle(screen, core_color, center, core_radius)
-
-        # 5. Odlesk (malý bílý bod)
-        highlight_radius = max(1, r // 6)
-        highlight_offset = r // 3
-        highlight_pos = (center[0] - highlight_offset, center[1] - highlight_offset)
-        pygame.draw.circle(screen, (255, 255, 255), highlight_pos, highlight_radius)
 
-        # 6. Obrys pro kontrast (použijeme světlejší verzi barvy)
-        outline_color = ring_color
-        pygame.draw.circle(screen, outline_color, center, r, width=1)
+        sprite = sprite_cache.enemy(scaled_radius(self.radius, scale), flash, pulse_level(self._pulse_phase))
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(pos.x) - half, int(pos.y) - half))
 
     # =========================================================================
     # EFEKTY — VOLÁNY Z HERNÍ SMYČKY
@@ -243,4 +254,147 @@ class Enemy:
             damage_per_second: HP odečtená za každou sekundu.
         """
         self.dot_timer = duration
-        self.dot_damage = damage_per_second
\ No newline at end of file
+        self.dot_damage = damage_per_second
+
+
+# =============================================================================
+# ROJ NEPŘÁTEL (structure-of-arrays)
+# =============================================================================
+class EnemySwarm(ViewStore):
+    """
+    Kontejner všech nepřátel ve hře uložený jako souvislá NumPy pole.
+
+    Chová se jako seznam pohledů Enemy (iterace, len, indexování) v pořadí
+    spawnu. Hromadná aktualizace update() provede pohyb k hráči, DoT,
+    odpočet časovačů a detekci smrti jedinou vektorizovanou operací.
+
+    Attributes:
+        pos (np.ndarray): Pozice středů, tvar (capacity, 2).
+        prev_pos (np.ndarray): Pozice před posledním krokem simulace (interpolace).
+        health, max_health (np.ndarray): Aktuální a maximální zdraví.
+        hurt_timer, slow_timer, dot_timer (np.ndarray): Časovače efektů (s).
+        slow_factor (np.ndarray): Multiplikátor rychlosti.
+        dot_damage (np.ndarray): Poškození DoT za sekundu.
+        alive (np.ndarray): Příznak života (bool).
+        views (list): Pohledy Enemy pro sloty [0, count) (viz ViewStore).
+    """
+
+    FIELDS = {
+        "pos":         ((2,), np.float64, 0.0),
+        "prev_pos":    ((2,), np.float64, 0.0),
+        "health":      ((),   np.float64, 0.0),
+        "max_health":  ((),   np.float64, 0.0),
+        "hurt_timer":  ((),   np.float64, 0.0),
+        "slow_timer":  ((),   np.float64, 0.0),
+        "slow_factor": ((),   np.float64, 1.0),
+        "dot_timer":   ((),   np.float64, 0.0),
+        "dot_damage":  ((),   np.float64, 0.0),
+        "alive":       ((),   np.bool_,   True),
+        "uid":         ((),   np.int64,   0),
+    }
+
+    def __init__(self, capacity: int = GameConfig.POOL_ENEMIES,
+                 pool_size: int = 0):
+        super().__init__(Enemy, capacity, pool_size)
+
+    def _release_view(self, view: Enemy) -> None:
+        view.aoe_effects.clear()
+
+    # =========================================================================
+    # PŘIDÁVÁNÍ A ODEBÍRÁNÍ
+    # =========================================================================
+
+    def spawn(self, x: float, y: float, hp: float, view: Enemy = None) -> Enemy:
+        """
+        Vytvoří nového nepřítele v novém slotu roje.
+
+        Args:
+            x, y: Počáteční pozice (px).
+            hp: Počáteční (a maximální) zdraví.
+            view: Existující objekt Enemy k navázání (jinak se vezme z poolu).
+
+        Returns:
+            Enemy: Pohled na nový slot.
+        """
+        i = self._alloc()
+        self.pos[i] = (x, y)
+        self.prev_pos[i] = (x, y)
+        self.health[i] = hp
+        self.max_health[i] = hp
+        self.uid[i] = next(_enemy_uids)
+        if view is None:
+            view = self.view_pool.acquire()
+        else:
+            self.view_pool.adopt(view)
+        view._reset()
+        self._attach(view, i)
+        return view
+
+    def snapshot(self) -> None:
+        """Uloží aktuální pozice jako předchozí (před krokem simulace)."""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def positions(self) -> list:
+        """Vrátí pozice živých slotů jako seznam [x, y] (pro SpatialGrid)."""
+        return self.pos[:self.count].tolist()
+
+    # =========================================================================
+    # HROMADNÁ AKTUALIZACE
+    # =========================================================================
+
+    def update(self, dt: float, player_pos: pygame.Vector2) -> list:
+        """
+        Aktualizuje všechny živé nepřátele jedním vektorizovaným krokem.
+
+        Pořadí operací odpovídá Enemy.update():
+          1. Pohyb směrem k hráči (s aplikací slow faktoru).
+          2. Odečtení DoT poškození.
+          3. Odpočítání slow timeru (reset faktoru po vypršení).
+          4. Odpočítání hurt timeru (vizuální blikání).
+          5. Kontrola smrti (health <= 0).
+
+        Mrtví nepřátelé zůstávají v roji, dokud se nezavolá remove_dead()
+        — volající tak může mezitím použít jejich pozici (částice smrti).
+
+        Args:
+            dt: Delta time v sekundách.
+            player_pos: Aktuální pozice hráče pro výpočet směru pohybu.
+
+        Returns:
+            list: Pohledy Enemy, které v tomto kroku zemřely.
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        alive = self.alive[:n]
+        pos = self.pos[:n]
+
+        # ── Pohyb k hráči ─────────────────────────────────────────────────
+        direction = np.array((player_pos.x, player_pos.y)) - pos
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        moving = alive & (length > 0)
+        if moving.any():
+            step = direction[moving] / length[moving, None]
+            step *= (GameConfig.ENEMY_SPEED * self.slow_factor[:n][moving])[:, None]
+            step *= dt
+            pos[moving] += step
+
+        # ── Damage over Time ──────────────────────────────────────────────
+        dot = alive & (self.dot_timer[:n] > 0)
+        self.health[:n][dot] -= self.dot_damage[:n][dot] * dt
+        self.dot_timer[:n][dot] -= dt
+
+        # ── Zpomalení ─────────────────────────────────────────────────────
+        slowed = self.slow_timer[:n] > 0
+        self.slow_timer[:n][alive & slowed] -= dt
+        self.slow_factor[:n][alive & ~slowed] = 1.0
+
+        # ── Hurt timer (blikání) ──────────────────────────────────────────
+        hurt = alive & (self.hurt_timer[:n] > 0)
+        self.hurt_timer[:n][hurt] -= dt
+
+        # ── Kontrola smrti ────────────────────────────────────────────────
+        died = np.flatnonzero(alive & (self.health[:n] <= 0))
+        alive[died] = False
+        return [self.views[i] for i in died]
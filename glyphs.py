@@ -0,0 +1,150 @@
+"""
+glyphs.py
+=========
+Atlas předkreslených znaků pro čísla a krátké popisky v HUD.
+
+Renderer dřív každý snímek volal font.render() pro každý řetězec
+statistik, FPS panelu, odpočtu dashe i každý plovoucí text poškození,
+přestože jde skoro jen o číslice a pár písmen. GlyphAtlas vykreslí
+každý znak jednou pro danou barvu (a úroveň průhlednosti) a řetězec
+pak složí z blitů uložených znaků — bez alokace povrchů za snímek.
+
+Atlas patří tomu, kdo drží jeho font, a zanikne spolu s ním. Renderer
+má vlastní atlas pro svůj malý font a PlayingState drží jeden Renderer
+po celou dobu běhu, takže se znaky vykreslí jednou za běh, ne za hru.
+Znaky mimo předkreslenou sadu se vykreslí líně při prvním použití.
+
+Řetězce se skládají po znacích bez kerningu, takže delší řetězec
+může vyjít o pár pixelů širší či užší než z font.render().
+"""
+
+import pygame
+from sprites import alpha_level, level_alpha, ALPHA_LEVELS
+
+
+# Znaky předkreslené při prvním použití barvy a úrovně (ostatní se doplní líně)
+PRELOAD = "0123456789.:%/-+ s"
+
+
+class GlyphAtlas:
+    """
+    Cache povrchů jednotlivých znaků jednoho fontu.
+
+    Attributes:
+        font (pygame.font.Font): Font, ze kterého se znaky kreslí.
+        height (int): Výška řádku fontu (px).
+        tables (dict): Slovník {(barva, úroveň alpha): {znak: pygame.Surface}}.
+        hits (int): Počet vrácení již vykresleného znaku.
+        misses (int): Počet nově vykreslených znaků.
+    """
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.height = font.get_height()
+        self.tables = {}
+        self.hits = 0
+        self.misses = 0
+        self._widths = {}
+
+    # =========================================================================
+    # ZNAKY
+    # =========================================================================
+
+    def _table(self, color: tuple, level: int) -> dict:
+        """Vrátí tabulku {znak: povrch} pro barvu a úroveň (nová = s PRELOAD)."""
+        table = self.tables.get((color, level))
+        if table is None:
+            table = self.tables[(color, level)] = {}
+            for char in PRELOAD:
+                self._render(table, char, color, level)
+        return table
+
+    def _render(self, table: dict, char: str, color: tuple, level: int) -> pygame.Surface:
+        """Vykreslí znak do tabulky (cache miss)."""
+        if level == ALPHA_LEVELS - 1:
+            surf = self.font.render(char, True, color)
+        else:
+            # Vyblednutá varianta — alfa kanál plného znaku vynásobený úrovní
+            # (plný znak se bere bez započtení do hits, patří k tomuto missu)
+            opaque = self._table(color, ALPHA_LEVELS - 1)
+            base = opaque.get(char)
+            if base is None:
+                base = self._render(opaque, char, color, ALPHA_LEVELS - 1)
+            surf = base.copy()
+            surf.fill((255, 255, 255, level_alpha(level)), special_flags=pygame.BLEND_RGBA_MULT)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        table[char] = surf
+        self._widths[char] = surf.get_width()
+        self.misses += 1
+        return surf
+
+    def glyph(self, char: str, color: tuple, level: int = ALPHA_LEVELS - 1) -> pygame.Surface:
+        """
+        Vrátí povrch znaku v dané barvě a úrovni průhlednosti.
+
+        Args:
+            char: Jeden znak.
+            color: RGB barva.
+            level: Úroveň průhlednosti (sprites.alpha_level); max = neprůhledný.
+        """
+        table = self._table(color, level)
+        surf = table.get(char)
+        if surf is None:
+            return self._render(table, char, color, level)
+        self.hits += 1
+        return surf
+
+    # =========================================================================
+    # ŘETĚZCE
+    # =========================================================================
+
+    def blits(self, text: str, pos: tuple, color: tuple,
+              alpha: int = 255, out: list = None) -> list:
+        """
+        Připraví dvojice (znak, pozice) pro Surface.blits().
+
+        Args:
+            text: Řetězec k vykreslení.
+            pos: Levý horní roh (x, y).
+            color: RGB barva.
+            alpha: Průhlednost 0–255 (kvantuje se na ALPHA_LEVELS úrovní).
+            out: Seznam, do kterého se dvojice přidají (None = nový).
+
+        Returns:
+            list: Sekvence pro Surface.blits().
+        """
+        if out is None:
+            out = []
+        level = alpha_level(alpha)
+        table = self._table(color, level)
+        widths = self._widths
+        append = out.append
+        x, y = pos
+        hits = 0
+        for char in text:
+            surf = table.get(char)
+            if surf is None:
+                surf = self._render(table, char, color, level)   # Počítá se jako miss
+            else:
+                hits += 1
+            append((surf, (x, y)))
+            x += widths[char]
+        self.hits += hits
+        return out
+
+    def draw(self, surface: pygame.Surface, text: str, pos: tuple,
+             color: tuple, alpha: int = 255) -> None:
+        """Vykreslí řetězec na povrch."""
+        surface.blits(self.blits(text, pos, color, alpha), doreturn=False)
+
+    def stats(self) -> dict:
+        """
+        Vrátí velikost atlasu.
+
+        Returns:
+            dict: Klíče 'glyphs', 'hits', 'misses'.
+        """
+        glyphs = sum(len(table) for table in self.tables.values())
+        return {"glyphs": glyphs, "hits": self.hits, "misses": self.misses}
+
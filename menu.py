@@ -13,30 +13,40 @@ Spuštění:
 Architektura:
     StateManager drží aktuální stav (Intro, MainMenu, Playing atd.)
     a deleguje události, update a render na jeho implementaci.
-    Pozadí (hvězdy, meteory) se vykresluje vždy — nezávisle na stavu.
+    Pozadí (hvězdy, meteory) a stav skládá Compositor (compositor.py),
+    který v dirty-rect režimu posílá na displej jen změněné obdélníky.
 
     Rozlišení okna se načítá z config.json a přepisuje výchozí hodnoty
     GameConfig.WIDTH/HEIGHT i MenuConfig.MENU_SCREEN_WIDTH/HEIGHT,
     takže všechny moduly pracují s aktuálně nastaveným rozlišením.
 """
 
+import os
+import time
+
+import numpy as np
 import pygame
 import random
 from config import GameConfig, MenuConfig
-from visuals import update_stars, draw_stars
+from compositor import Compositor
+from visuals import streak
 from states import GameState
 from states_menu import IntroState, LoginState, MainMenuState, SettingsState, GraphicsState
 from states_game import PlayingState
-from settings import load_config
+from settings import load_config, save_config, PROFILE_DIR
+from background import load_space_background
+from profiler import profiler
+from pacing import FramePacer
 
 # ── Načtení konfigurace a synchronizace rozlišení ────────────────────────────
 config = load_config()
 width, height = config["resolution"]
 
 # Přepsání GameConfig na rozlišení uložené v config.json
-# (uživatel mohl změnit rozlišení v Settings → Graphics)
+# (uživatel mohl změnit rozlišení a měřítko vykreslování v Settings → Graphics)
 GameConfig.WIDTH = width
 GameConfig.HEIGHT = height
+GameConfig.RENDER_SCALE = config["render_scale"]
 
 # Poznámka: pygame.display.set_mode() se volá až uvnitř main() po pygame.init()
 
@@ -49,12 +59,19 @@ class MeteorSystem:
     Generuje a vykresluje náhodné meteory padající přes menu obrazovku.
 
     Meteory jsou jednoduché svislé čáry pohybující se shora dolů.
-    Přidávají atmosféru vesmírného prostředí menu.
+    Přidávají atmosféru vesmírného prostředí menu. Stav je v polích
+    NumPy s pevnou kapacitou MAX_METEORS; živé meteory jsou na
+    indexech 0..count-1. Kreslí se sprity čar z visuals.streak().
 
     Attributes:
-        meteors (list): Seznam aktivních meteorů jako slovníky {x, y, length, speed}.
+        x, y (np.ndarray): Pozice horního konce meteoru.
+        length (np.ndarray): Délka čáry (px).
+        speed (np.ndarray): Rychlost pádu (px/s).
+        count (int): Počet aktivních meteorů.
     """
 
+    MAX_METEORS = 3     # Maximální počet meteorů současně
+
     def __init__(self, width: int, height: int):
         """
         Args:
@@ -62,48 +79,59 @@ class MeteorSystem:
         """
         self.width = width
         self.height = height
-        self.meteors = []
+        self.x = np.zeros(self.MAX_METEORS, dtype=np.int64)
+        self.y = np.zeros(self.MAX_METEORS)
+        self.length = np.zeros(self.MAX_METEORS, dtype=np.int64)
+        self.speed = np.zeros(self.MAX_METEORS)
+        self.count = 0
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, hyperspace: bool = False) -> None:
         """
         Posunuje meteory dolů a generuje nové s náhodnou pravděpodobností.
 
         Nový meteor vznikne s pravděpodobností 1 % za snímek,
-        ale maximálně 3 meteory mohou existovat současně.
+        ale maximálně MAX_METEORS meteorů může existovat současně.
 
         Args:
             dt: Delta time v sekundách.
+            hyperspace: Nepoužito (signatura vrstvy Compositoru).
         """
         # Generuj nový meteor s 1% pravděpodobností (max 3 najednou)
-        if random.random() < 0.01 and len(self.meteors) < 3:
-            self.meteors.append({
-                "x":      random.randint(0, self.width),
-                "y":      0,                               # Začíná na vrcholu obrazovky
-                "length": random.randint(10, 30),          # Délka čáry
-                "speed":  random.uniform(500, 800),        # Rychlost pádu (px/s)
-            })
-
-        # Posuň každý meteor dolů; mrtvé (pod obrazovkou) odstraň
-        for m in self.meteors[:]:
-            m["y"] += m["speed"] * dt
-            if m["y"] > self.height:
-                self.meteors.remove(m)
-
-    def draw(self, surface: pygame.Surface) -> None:
+        if random.random() < 0.01 and self.count < self.MAX_METEORS:
+            i = self.count
+            self.x[i] = random.randint(0, self.width)
+            self.y[i] = 0                               # Začíná na vrcholu obrazovky
+            self.length[i] = random.randint(10, 30)     # Délka čáry
+            self.speed[i] = random.uniform(500, 800)    # Rychlost pádu (px/s)
+            self.count += 1
+
+        # Posuň meteory dolů; mrtvé (pod obrazovkou) odstraň se zachováním pořadí
+        n = self.count
+        self.y[:n] += self.speed[:n] * dt
+        alive = self.y[:n] <= self.height
+        if not alive.all():
+            self.count = k = int(alive.sum())
+            for field in (self.x, self.y, self.length, self.speed):
+                field[:k] = field[:n][alive]
+
+    def draw(self, surface: pygame.Surface, hyperspace: bool = False) -> list:
         """
         Vykreslí každý meteor jako bílou svislou čáru.
 
         Args:
             surface: Cílový pygame povrch.
+            hyperspace: Nepoužito (signatura vrstvy Compositoru).
+
+        Returns:
+            list: Obdélníky vykreslených meteorů (pro dirty-rect překreslení).
         """
-        for m in self.meteors:
-            pygame.draw.line(
-                surface,
-                (255, 255, 255),
-                (m["x"], m["y"]),
-                (m["x"], m["y"] + m["length"]),
-                2   # Tloušťka čáry
-            )
+        n = self.count
+        return surface.blits([
+            (streak((255, 255, 255), length), (x, y))
+            for x, y, length in zip(self.x[:n].tolist(),
+                                    np.floor(self.y[:n]).astype(np.int64).tolist(),
+                                    self.length[:n].tolist())
+        ])
 
 
 # =============================================================================
@@ -175,58 +203,30 @@ class StateManager:
         if self.current:
             self.current.update(dt)
 
-    def render(self, surface: pygame.Surface) -> None:
-        """Vykreslí aktuální stav na zadaný povrch."""
+    def render(self, surface: pygame.Surface):
+        """Vykreslí aktuální stav na zadaný povrch (vrací obdélníky z render() stavu)."""
         if self.current:
-            self.current.render(surface)
+            return self.current.render(surface)
+        return []
+
+    def entity_counts(self) -> dict:
+        """Vrátí počty entit aktuálního stavu (pro profiler)."""
+        return self.current.entity_counts() if self.current else {}
 
 
 # =============================================================================
-# VESMÍRNÉ POZADÍ MENU
+# PROFILER
 # =============================================================================
-def create_space_background(width: int, height: int) -> pygame.Surface:
-    """
-    Vytvoří statické vesmírné pozadí pro menu obrazovku.
-
-    Skládá se ze dvou vrstev:
-      1. Gradientní přechod černá (nahoře) → tmavě fialová (dole).
-      2. Náhodné mlhoviny jako průhledné barevné kruhy (nebulae).
-
-    Pozadí se vytvoří jednou při startu — není potřeba ho generovat každý snímek.
-
-    Args:
-        width, height: Rozměry výsledného povrchu (px).
-
-    Returns:
-        pygame.Surface: Hotové pozadí připravené k blit().
-    """
-    surface = pygame.Surface((width, height))
-
-    top_color    = (0, 0, 0)       # Horní okraj: černá
-    bottom_color = (20, 0, 40)     # Dolní okraj: tmavě fialová
-
-    # Gradient: každý řádek má jinou barvu interpolovanou mezi top a bottom
-    for y in range(height):
-        ratio = y / height  # 0.0 nahoře, 1.0 dole
-        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-
-    # Mlhoviny: 5 náhodně umístěných průhledných kruhů
-    nebula_colors = [(100, 0, 150), (50, 0, 100), (20, 10, 60)]
-    for _ in range(5):
-        pos    = (random.randint(0, width), random.randint(0, height))
-        radius = random.randint(150, 400)
-        color  = random.choice(nebula_colors)
-        alpha  = random.randint(30, 80)   # Nízká alpha = jemný efekt
-
-        # Povrch s alfa kanálem pro průhlednou mlhovinu
-        nebula = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(nebula, (*color, alpha), (radius, radius), radius)
-        surface.blit(nebula, (pos[0] - radius, pos[1] - radius))
-
-    return surface
+def dump_profile() -> None:
+    """Uloží buffer profileru do PROFILE_DIR jako Chrome trace JSON a CSV souhrn."""
+    base = os.path.join(PROFILE_DIR, time.strftime("profile_%Y%m%d_%H%M%S"))
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        profiler.dump_chrome_trace(base + ".json")
+        profiler.dump_csv(base + ".csv")
+        print("Profil uložen:", base + ".json,", base + ".csv")
+    except Exception as e:
+        print("Chyba při ukládání profilu:", e)
 
 
 # =============================================================================
@@ -239,11 +239,11 @@ def main() -> None:
     Postup:
       1. Inicializace Pygame.
       2. Synchronizace MenuConfig s rozlišením z config.json.
-      3. Vytvoření okna a hodin.
-      4. Generování statického pozadí a systému meteorů.
+      3. Vytvoření okna a FramePaceru (hodiny s limitem FPS podle situace).
+      4. Načtení statického pozadí (cache na disku) a systému meteorů.
       5. Vytvoření StateManageru, registrace všech stavů.
       6. Spuštění stavu INTRO.
-      7. Hlavní smyčka: events → update → render → flip.
+      7. Hlavní smyčka: events → update → render (Compositor).
     """
     pygame.init()
 
@@ -257,11 +257,16 @@ def main() -> None:
     MenuConfig.MENU_SCREEN_HEIGHT = height
     screen = pygame.display.set_mode((width, height))
     pygame.display.set_caption("Bubble Shooter")
-    clock = pygame.time.Clock()
-
-    # Statické pozadí (gradient + mlhoviny) — generuje se jednou
-    background = create_space_background(width, height)
+    pacer = FramePacer()
+
+    # Statické pozadí (gradient + mlhoviny) — z cache na disku podle
+    # (rozlišení, seed); seed se vylosuje při prvním startu a uloží
+    if config["background_seed"] is None:
+        config["background_seed"] = random.SystemRandom().getrandbits(32)
+        save_config(config)
+    background = load_space_background(width, height, config["background_seed"])
     meteors = MeteorSystem(width, height)
+    compositor = Compositor(screen, background, meteors)
 
     # ── Inicializace StateManageru ────────────────────────────────────────────
     manager = StateManager()
@@ -288,15 +293,37 @@ def main() -> None:
 
     # ── Hlavní smyčka ─────────────────────────────────────────────────────────
     while manager.running:
-        # Delta time: čas od posledního snímku v sekundách
-        dt = clock.tick(MenuConfig.MENU_FPS) / 1000.0
+        # Delta time: čas od posledního snímku v sekundách; limit FPS podle
+        # stavu, fokusu okna a nečinnosti (pacing.py)
+        dt = pacer.tick(manager.current)
+
+        # Regulátor kvality ve hře — práce minulého snímku bez čekání v tick()
+        if manager.current is playing:
+            playing.report_frame_time(pacer.clock.get_rawtime(), dt)
+
+        # Profiler fází snímku (F9 zapnout/vypnout, F10 uložit) — viz profiler.py
+        profiler.begin_frame()
 
         # ── Zpracování událostí ───────────────────────────────────────────────
         for event in pygame.event.get():
+            pacer.handle_event(event)
             if event.type == pygame.QUIT:
                 manager.running = False
                 continue
 
+            # Okno bylo odkryto/obnoveno — obsah displeje mohl být ztracen
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                compositor.invalidate()
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                enabled = not profiler.enabled
+                profiler.set_enabled(enabled)
+                print("Profiler:", "zapnut" if enabled else "vypnut")
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                dump_profile()
+                continue
+
             # Deleguj událost na aktuální stav
             manager.handle_event(event)
 
@@ -313,19 +340,27 @@ def main() -> None:
             and getattr(intro, "hyperspace", False)
         )
 
+        if profiler.enabled:
+            profiler.lap("events")
+
         # ── Update ────────────────────────────────────────────────────────────
-        meteors.update(dt)
-        update_stars(dt, hyperspace)   # Hvězdy z visuals.py (globální instance)
+        # Meteory a hvězdy jen pod stavy, které je potřebují (viz Compositor)
+        compositor.update(manager.current, dt, hyperspace)
+        if profiler.enabled:
+            profiler.lap("update.background")
+            t0 = time.perf_counter_ns()
         manager.update(dt)
+        if profiler.enabled:
+            profiler.record("update.state", t0)
 
         # ── Render ────────────────────────────────────────────────────────────
-        screen.blit(background, (0, 0))   # Statické pozadí jako první vrstva
-        meteors.draw(screen)              # Animované meteory
-        draw_stars(screen, hyperspace)    # Parallax hvězdy
-        manager.render(screen)            # Aktuální stav (menu, hra, login...)
+        # Pozadí, meteory, hvězdy a stav; na displej jen změněné obdélníky
+        compositor.render(manager.current, hyperspace)
 
-        pygame.display.flip()             # Zobraz vykreslený snímek
+        if profiler.enabled:
+            profiler.end_frame(manager.entity_counts())
 
+    pacer.report()
     pygame.quit()
 
 
@@ -0,0 +1,191 @@
+"""
+pacing.py
+=========
+Tempo snímků — limit FPS podle stavu, aktivity a okna.
+
+Hlavní smyčka dřív volala clock.tick(MenuConfig.MENU_FPS) se 144 FPS
+pořád stejně: i v menu, kde se skoro nic nehýbe, i s oknem na pozadí
+nebo minimalizovaným. FramePacer volí limit podle situace:
+
+  - "game" — hra (stav s pacing = "game"): GameConfig.FPS,
+  - "menu" — menu a intro: MenuConfig.MENU_FPS,
+  - "idle" — minimalizované okno, okno bez fokusu, nebo statická obrazovka
+             menu (bez animovaných vrstev, backdrop_layers = ()) bez
+             vstupu déle než MenuConfig.PACING_IDLE_TIMEOUT s: PACING_IDLE_FPS.
+
+Menu s hvězdami a meteory (hlavní menu, nastavení, intro) při nečinnosti
+limit nesnižuje — animace pozadí by při 10 FPS viditelně trhala.
+
+Hra na pozadí klesne jen na limit menu (ne na idle) — simulace dohání
+nejvýš GameConfig.MAX_CATCHUP_STEPS kroků za snímek a při 10 FPS by
+zpomalila. Minimalizovaná hra klesne na idle, protože ji nikdo nevidí.
+
+Vstup i okenní události hlásí smyčka přes handle_event(); první vstup
+po nečinnosti vrátí plný limit hned v dalším snímku.
+
+Při PACING_BUSY_LOOP se čeká přes clock.tick_busy_loop() — přesnější
+rozestupy snímků za cenu vytíženého jádra. Odchylky skutečných
+rozestupů od cíle (jitter) se měří a vypisují při změně limitu
+a na konci běhu (report()).
+"""
+
+import time
+
+import numpy as np
+import pygame
+from config import GameConfig, MenuConfig
+from profiler import FrameTimeRing
+
+
+# Události, které znamenají aktivitu uživatele
+INPUT_EVENTS = frozenset((
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+    pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION, pygame.JOYHATMOTION,
+))
+
+
+class FramePacer:
+    """
+    Čeká na další snímek s limitem FPS podle situace a měří jitter.
+
+    Attributes:
+        clock (pygame.time.Clock): Hodiny hlavní smyčky.
+        caps (dict): Limity FPS {"game", "menu", "idle": FPS}.
+        busy_loop (bool): True = clock.tick_busy_loop() místo clock.tick().
+        mode (str): Aktuální režim ("game", "menu" nebo "idle").
+        focused (bool): Okno má fokus klávesnice.
+        minimized (bool): Okno je minimalizované.
+        intervals (FrameTimeRing): Skutečné rozestupy snímků v aktuálním režimu.
+    """
+
+    def __init__(self, busy_loop: bool = MenuConfig.PACING_BUSY_LOOP):
+        self.clock = pygame.time.Clock()
+        self.caps = {
+            "game": GameConfig.FPS,
+            "menu": MenuConfig.MENU_FPS,
+            "idle": MenuConfig.PACING_IDLE_FPS,
+        }
+        self.busy_loop = busy_loop
+        self.mode = "menu"
+        self.focused = True
+        self.minimized = False
+        self.intervals = FrameTimeRing(MenuConfig.PACING_HISTORY)
+
+        self._last_input = time.perf_counter()
+        self._last_frame = None
+
+    # =========================================================================
+    # UDÁLOSTI
+    # =========================================================================
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Zaznamená vstup uživatele a změny okna (fokus, minimalizace)."""
+        kind = event.type
+        if kind in INPUT_EVENTS:
+            self._last_input = time.perf_counter()
+        elif kind == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+            self._last_input = time.perf_counter()
+        elif kind == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif kind in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif kind in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED):
+            self.minimized = False
+
+    # =========================================================================
+    # TEMPO
+    # =========================================================================
+
+    def select(self, state) -> str:
+        """
+        Určí režim pro aktuální stav.
+
+        Args:
+            state: Aktuální stav (BaseState) nebo None.
+
+        Returns:
+            str: "game", "menu" nebo "idle".
+        """
+        game = state is not None and state.pacing == "game"
+        if self.minimized:
+            return "idle"
+        if game:
+            return "game" if self.focused else "menu"
+        if not self.focused:
+            return "idle"
+        # Nečinnost zpomalí jen statické obrazovky bez animovaného pozadí
+        static = state is not None and not state.backdrop_layers
+        if static and time.perf_counter() - self._last_input > MenuConfig.PACING_IDLE_TIMEOUT:
+            return "idle"
+        return "menu"
+
+    def tick(self, state) -> float:
+        """
+        Počká na další snímek s limitem podle stavu.
+
+        Args:
+            state: Aktuální stav (BaseState) nebo None.
+
+        Returns:
+            float: Delta time v sekundách (jako clock.tick() / 1000).
+        """
+        mode = self.select(state)
+        if mode != self.mode:
+            old = self.mode
+            print(f"Tempo snímků: {old} ({self.caps[old]} FPS) → {mode} ({self.caps[mode]} FPS)"
+                  f" — {self.describe()}")
+            self.mode = mode
+            self.intervals = FrameTimeRing(MenuConfig.PACING_HISTORY)
+            self._last_frame = None
+
+        fps = self.caps[mode]
+        ms = self.clock.tick_busy_loop(fps) if self.busy_loop else self.clock.tick(fps)
+
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self.intervals.push(now - self._last_frame)
+        self._last_frame = now
+        return ms / 1000.0
+
+    # =========================================================================
+    # JITTER
+    # =========================================================================
+
+    def jitter(self) -> dict:
+        """
+        Odchylky rozestupů snímků od cíle 1000 / limit ms v aktuálním režimu.
+
+        Returns:
+            dict: Klíče frames, target, mean (ms) a std, p99, max — směrodatná
+                  odchylka rozestupů a percentil / maximum absolutní odchylky
+                  od cíle (ms).
+        """
+        target = 1000.0 / self.caps[self.mode]
+        samples = self.intervals.latest()
+        if len(samples) == 0:
+            return {"frames": 0, "target": target, "mean": 0.0,
+                    "std": 0.0, "p99": 0.0, "max": 0.0}
+        deviation = np.abs(samples - target)
+        return {
+            "frames": len(samples),
+            "target": target,
+            "mean":   float(samples.mean()),
+            "std":    float(samples.std()),
+            "p99":    float(np.percentile(deviation, 99)),
+            "max":    float(deviation.max()),
+        }
+
+    def describe(self) -> str:
+        """Vrátí jitter aktuálního režimu jako jeden řádek textu."""
+        j = self.jitter()
+        if not j["frames"]:
+            return "bez měření"
+        return (f"{j['frames']} snímků, cíl {j['target']:.2f} ms, průměr {j['mean']:.2f} ms, "
+                f"jitter σ {j['std']:.2f} ms, p99 {j['p99']:.2f} ms, max {j['max']:.2f} ms")
+
+    def report(self) -> None:
+        """Vypíše jitter aktuálního režimu (volá se na konci běhu)."""
+        wait = "tick_busy_loop" if self.busy_loop else "tick"
+        print(f"Tempo snímků [{self.mode}, {wait}]: {self.describe()}")
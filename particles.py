@@ -0,0 +1,213 @@
+"""
+particles.py
+============
+Částicový systém nad předalokovanými NumPy poli.
+
+Původně byla každá částice slovník s vlastními pygame.Vector2 a mrtvé
+částice se mazaly přes list.remove() — při hromadných výbuších (20 částic
+na smrt nepřítele) kvadratická operace. ParticleSystem drží všechny
+částice v polích pevné kapacity:
+
+  - update() posune všechny částice a aplikuje tření jednou operací,
+  - mrtvé částice se odstraní v O(1) přesunem poslední částice na jejich místo,
+  - při překročení limitu max_particles se zahodí nejstarší částice.
+
+Rozhraní zůstává kompatibilní s HelperFunctions.spawn_hit_particles():
+spawn() má stejné parametry, extend() přijme seznam slovníků částic
+a iterace vrací slovníky se stejnými klíči jako dřív.
+"""
+
+import math
+
+import numpy as np
+import pygame
+from config import GameConfig
+from soa import ArrayStore
+
+
+class ParticleSystem(ArrayStore):
+    """
+    Kontejner částic s pevnou kapacitou (rozpočtem) a swap-remove mazáním.
+
+    Pořadí částic v polích není stabilní — po odstranění mrtvé částice
+    se na její místo přesune poslední. Na pořadí vykreslování částic
+    nezáleží, proto to nevadí.
+
+    Attributes:
+        pos, vel (np.ndarray): Pozice a rychlosti, tvar (capacity, 2).
+        life, max_life (np.ndarray): Zbývající a počáteční životnost (s).
+        color (np.ndarray): Index barvy do palette.
+        radius (np.ndarray): Poloměr částice (px).
+        birth (np.ndarray): Pořadové číslo vzniku — nižší = starší částice.
+        palette (list): RGB barvy použité částicemi.
+        max_particles (int): Maximální počet současně živých částic.
+        dropped (int): Počet částic zahozených kvůli překročení rozpočtu.
+        burst_scale (float): Násobek počtu částic v jednom výbuchu (regulátor
+                             kvality ho snižuje, viz quality.py).
+        rng (np.random.Generator): Zdroj náhody pro směr, rychlost a velikost.
+    """
+
+    FIELDS = {
+        "pos":      ((2,), np.float64, 0.0),
+        "vel":      ((2,), np.float64, 0.0),
+        "life":     ((),   np.float64, 0.0),
+        "max_life": ((),   np.float64, 0.0),
+        "color":    ((),   np.int16,   0),
+        "radius":   ((),   np.float64, 0.0),
+        "birth":    ((),   np.int64,   0),
+    }
+
+    def __init__(self, max_particles: int = GameConfig.MAX_PARTICLES):
+        """
+        Args:
+            max_particles: Rozpočet částic — pole se předalokují na tuto
+                           kapacitu a nikdy nerostou.
+        """
+        super().__init__(max_particles)
+        self.max_particles = self.capacity
+        self.palette = []
+        self._palette_index = {}
+        self._serial = 0
+        self.dropped = 0
+        self.burst_scale = 1.0
+        self.rng = np.random.default_rng()
+
+    def color_index(self, color: tuple) -> int:
+        """Vrátí index barvy v palette (při prvním použití ji přidá)."""
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    # =========================================================================
+    # VZNIK ČÁSTIC
+    # =========================================================================
+
+    def spawn(self, pos: pygame.Vector2, color: tuple,
+              count: int = GameConfig.PARTICLE_COUNT,
+              speed: float = GameConfig.PARTICLE_SPEED,
+              lifetime: float = GameConfig.PARTICLE_LIFETIME) -> None:
+        """
+        Vytvoří shluk částic explodujících z dané pozice.
+
+        Parametry i rozdělení náhodných hodnot odpovídají
+        HelperFunctions.spawn_hit_particles().
+
+        Args:
+            pos: Pozice středu výbuchu.
+            color: RGB barva částic.
+            count: Počet vygenerovaných částic.
+            speed: Maximální rychlost částice (px/s).
+            lifetime: Životnost každé částice (s).
+        """
+        if self.burst_scale != 1.0 and count > 0:
+            count = max(1, round(count * self.burst_scale))
+        if count > self.max_particles:
+            self.dropped += count - self.max_particles
+            count = self.max_particles
+        if count <= 0:
+            return
+
+        i = self._make_room(count)
+        s = slice(i, i + count)
+
+        angle = self.rng.uniform(0, math.pi * 2, count)
+        magnitude = self.rng.uniform(speed * 0.3, speed, count)
+        self.pos[s] = (pos[0], pos[1])
+        self.vel[s, 0] = np.cos(angle) * magnitude
+        self.vel[s, 1] = np.sin(angle) * magnitude
+        self.life[s] = lifetime
+        self.max_life[s] = lifetime
+        self.color[s] = self.color_index(color)
+        self.radius[s] = self.rng.uniform(2, 5, count)
+        self.birth[s] = np.arange(self._serial, self._serial + count)
+        self._serial += count
+
+    def extend(self, particles) -> None:
+        """
+        Přidá částice ve formátu slovníků z HelperFunctions.spawn_hit_particles().
+
+        Args:
+            particles: Iterovatelná kolekce slovníků s klíči
+                       'pos', 'vel', 'life', 'max_life', 'color', 'radius'.
+        """
+        particles = list(particles)[-self.max_particles:]
+        if not particles:
+            return
+
+        i = self._make_room(len(particles))
+        for j, p in enumerate(particles, start=i):
+            self.pos[j] = (p['pos'][0], p['pos'][1])
+            self.vel[j] = (p['vel'][0], p['vel'][1])
+            self.life[j] = p['life']
+            self.max_life[j] = p['max_life']
+            self.color[j] = self.color_index(p['color'])
+            self.radius[j] = p['radius']
+            self.birth[j] = self._serial
+            self._serial += 1
+
+    def _make_room(self, n: int) -> int:
+        """
+        Zajistí místo pro n nových částic a vrátí index prvního slotu.
+
+        Pokud by se překročil rozpočet, zahodí nejstarší částice.
+        """
+        overflow = self.count + n - self.max_particles
+        if overflow > 0:
+            self.dropped += overflow
+            oldest = np.argpartition(self.birth[:self.count], overflow - 1)[:overflow]
+            for i in np.sort(oldest)[::-1]:
+                self._swap_remove(int(i))
+        return self._alloc(n)
+
+    # =========================================================================
+    # AKTUALIZACE
+    # =========================================================================
+
+    def update(self, dt: float) -> None:
+        """
+        Sníží životnost, odstraní mrtvé částice a posune zbylé.
+
+        Pořadí odpovídá původní smyčce: nejprve odečet životnosti a
+        odstranění mrtvých, pak pohyb a tření (1 - 3·dt) u živých.
+
+        Args:
+            dt: Delta time v sekundách.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        life = self.life[:n]
+        life -= dt
+
+        # Odstranění od nejvyššího indexu — přesouvaná poslední částice
+        # je tak vždy živá (mrtvé za ní už byly odstraněny)
+        for i in np.flatnonzero(life <= 0)[::-1]:
+            self._swap_remove(int(i))
+
+        n = self.count
+        self.pos[:n] += self.vel[:n] * dt
+        self.vel[:n] *= 1 - 3 * dt
+
+    def clear(self) -> None:
+        """Odstraní všechny částice."""
+        self.count = 0
+
+    # =========================================================================
+    # KOMPATIBILITA SE SLOVNÍKOVÝM FORMÁTEM
+    # =========================================================================
+
+    def __iter__(self):
+        """Vrací částice jako slovníky (formát HelperFunctions.spawn_hit_particles)."""
+        palette = self.palette
+        for i in range(self.count):
+            yield {
+                'pos':      pygame.Vector2(float(self.pos[i, 0]), float(self.pos[i, 1])),
+                'vel':      pygame.Vector2(float(self.vel[i, 0]), float(self.vel[i, 1])),
+                'life':     float(self.life[i]),
+                'max_life': float(self.max_life[i]),
+                'color':    palette[self.color[i]],
+                'radius':   float(self.radius[i]),
+            }
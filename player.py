@@ -13,6 +13,7 @@ import math
 import pygame
 from config import GameConfig
 from visuals import Colors
+from sprites import sprite_cache, pulse_level, scaled_radius
 
 
 class Player:
@@ -21,6 +22,7 @@ class Player:
 
     Attributes:
         pos (pygame.Vector2): Aktuální pozice středu hráče (px).
+        prev_pos (pygame.Vector2): Pozice před posledním krokem simulace (interpolace).
         velocity (pygame.Vector2): Aktuální rychlost — používá se hlavně pro osu Y (gravitace).
         health (int): Aktuální zdraví.
         max_health (int): Maximální zdraví.
@@ -31,7 +33,7 @@ class Player:
         dashing (bool): True = hráč právě provádí dash.
         dash_direction (int): Směr dashe: +1 vpravo, -1 vlevo, 0 = žádný.
         dash_time (float): Jak dlouho aktuální dash probíhá (s).
-        last_dash_time (int): Pygame timestamp posledního dashe (ms) — pro cooldown.
+        last_dash_time (float): Čas posledního dashe (ms, hodiny simulace) — pro cooldown.
         dash_trail (list): Seznam bodů [pozice, zbývající_čas, alpha] tvořících stopu.
         stamina (float): Aktuální stamina pro létání (0–MAX_STAMINA).
     """
@@ -43,6 +45,7 @@ class Player:
         """
         # Pozice: horizontální střed obrazovky, vertikálně na podlaze
         self.pos = pygame.Vector2(GameConfig.WIDTH // 2, GameConfig.GROUND_LEVEL)
+        self.prev_pos = pygame.Vector2(self.pos)
         self.velocity = pygame.Vector2(0, 0)
 
         # Zdraví
@@ -58,7 +61,7 @@ class Player:
         self.dashing = False
         self.dash_direction = 0     # +1 = vpravo, -1 = vlevo
         self.dash_time = 0          # Počitadlo délky probíhajícího dashe (s)
-        self.last_dash_time = 0     # Pygame ticks posledního dashe — pro cooldown
+        self.last_dash_time = -math.inf     # Čas posledního dashe (ms) — -inf = dash hned připraven
         self.dash_trail = []        # [pygame.Vector2 pos, float life, float alpha]
 
         # Stamina pro létání
@@ -92,7 +95,7 @@ class Player:
         # Aktualizuj body vizuální stopy dashe
         self.update_dash_trail(dt)
 
-    def move(self, dt: float, keys) -> None:
+    def move(self, dt: float, keys, current_time: float = None) -> None:
         """
         Zpracuje horizontální pohyb a dash dle stisknutých kláves.
 
@@ -104,6 +107,7 @@ class Player:
         Args:
             dt: Delta time v sekundách.
             keys: Výsledek pygame.key.get_pressed() — stav všech kláves.
+            current_time: Čas pro cooldown dashe (ms). None = pygame.time.get_ticks().
         """
         if not self.dashing:
             # Standardní horizontální pohyb
@@ -114,7 +118,8 @@ class Player:
 
         # ── Spuštění dashe ────────────────────────────────────────────────────
         if keys[pygame.K_LCTRL] and not self.dashing:
-            current_time = pygame.time.get_ticks()
+            if current_time is None:
+                current_time = pygame.time.get_ticks()
             cooldown_elapsed = current_time - self.last_dash_time
 
             if cooldown_elapsed >= GameConfig.DASH_COOLDOWN:
@@ -210,35 +215,25 @@ class Player:
     # VYKRESLOVÁNÍ
     # =========================================================================
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def snapshot(self) -> None:
+        """Uloží aktuální pozici jako předchozí (před krokem simulace)."""
+        self.prev_pos.update(self.pos)
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, scale: float = 1.0) -> None:
         """
         Vykreslí hráče jako energetický kruh s vnitřním prstencem a pulzujícím jádrem.
+
+        Sprite se bere z sprite_cache (sprites.py) — kreslení je jeden blit.
+
+        Args:
+            screen: Cílový pygame povrch.
+            alpha: Interpolační faktor pevného kroku — 0.0 = pozice před
+                   posledním krokem simulace, 1.0 = aktuální pozice.
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
         """
-        center = (int(self.pos.x), int(self.pos.y))
-        r = self.radius
-
-        # 1. Základní vnější záře (použijeme průhledný surface)
-        glow_radius = r + 4
-        glow_surf = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-        # Vnější záře – světle modrá s nízkou alfa
-        glow_color = (100, 150, 255, 50)
-        pygame.draw.circle(glow_surf, glow_color, (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surf, (center[0] - glow_radius, center[1] - glow_radius))
-
-        # 2. Hlavní tělo – tmavší odstín s průhledností pro podklad
-        body_color = (30, 40, 80)  # tmavě modrá
-        pygame.draw.circle(screen, body_color, center, r)
-
-        # 3. Vnitřní prstenec (kruhová výseč)
-        ring_radius = r - 3
-        ring_width = 3
-        # Barva prstence – světle modrá
-        ring_color = (80, 180, 255)
-        pygame.draw.circle(screen, ring_color, center, ring_radius, ring_width)
-
-        # 4. Pulzující jádro – velikost se mění v čase (např. podle pygame.time.get_ticks())
-        # Pro jednoduchost použijeme časové proměnné, které byste měli inicializovat ve třídě
-        # (např. self.last_time = pygame.time.get_ticks())
+        pos = self.prev_pos.lerp(self.pos, alpha) * scale
+
+        # Pulzující jádro – fáze se posouvá v čase
         if not hasattr(self, 'last_time'):
             self.last_time = pygame.time.get_ticks()
             self.pulse_phase = 0
@@ -247,23 +242,12 @@ class Player:
         dt = current_time - self.last_time
         self.last_time = current_time
         self.pulse_phase += dt * 0.005  # rychlost pulzování
-        # Velikost jádra se mění sinusově mezi 0.4 a 0.8 poloměru
-        core_radius = int(r * (0.6 + 0.2 * (1 + math.sin(self.pulse_phase)) / 2))
-
-        # Středové jádro – světlé, zářivé
-        core_color = (200, 220, 255)
-        pygame.draw.circle(screen, core_color, center, core_radius)
-
-        # 5. Dodatečný lesklý bod (odlesk)
-        highlight_radius = max(1, r // 6)
-        highlight_offset = r // 3
-        highlight_pos = (center[0] - highlight_offset, center[1] - highlight_offset)
-        pygame.draw.circle(screen, (255, 255, 255), highlight_pos, highlight_radius)
-
-        # 6. Obrys pro kontrast
-        outline_color = (200, 200, 255)
-        pygame.draw.circle(screen, outline_color, center, r, width=1)
-    def draw_dash_trail(self, screen: pygame.Surface) -> None:
+
+        sprite = sprite_cache.player(scaled_radius(self.radius, scale), pulse_level(self.pulse_phase))
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(pos.x) - half, int(pos.y) - half))
+
+    def draw_dash_trail(self, screen: pygame.Surface, scale: float = 1.0) -> None:
         """
         Vykreslí průhledné kruhy tvořící stopu za dashem.
 
@@ -273,7 +257,9 @@ class Player:
 
         Args:
             screen: Cílový pygame povrch.
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
         """
+        radius = scaled_radius(self.radius, scale)
         for point in self.dash_trail:
             pos, life, alpha = point
 
@@ -281,14 +267,14 @@ class Player:
             current_alpha = int(alpha * (life / GameConfig.DASH_TRAIL_LIFETIME))
 
             # Vytvoř malý povrch s alfa kanálem a nakresli průhledný kruh
-            s = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+            s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(
                 s,
                 (*Colors.WHITE, current_alpha),
-                (self.radius, self.radius),
-                self.radius
+                (radius, radius),
+                radius
             )
-            screen.blit(s, (pos.x - self.radius, pos.y - self.radius))
+            screen.blit(s, (pos.x * scale - radius, pos.y * scale - radius))
 
     # =========================================================================
     # ZDRAVÍ A POŠKOZENÍ
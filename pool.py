@@ -0,0 +1,98 @@
+"""
+pool.py
+=======
+Obecný pool (zásobník) opakovaně používaných objektů.
+
+Každý výstřel, spawn nepřítele i zásah dřív vytvářel nové objekty,
+které po chvíli zanikly. Při 144 FPS tato alokační "vřava" spouští
+garbage collector a způsobuje záseky. ObjectPool vrácené objekty
+uchová a při dalším požadavku je vydá znovu místo vytvoření nových.
+
+Statistiky (hits, misses, high_water) ukazují, zda je pool dostatečně
+velký — po zahřátí by měly přibývat jen hits.
+"""
+
+
+class ObjectPool:
+    """
+    Zásobník recyklovaných objektů s volitelným resetem při vrácení.
+
+    Objekt se z poolu vydá v takovém stavu, v jakém byl vrácen (po resetu);
+    inicializaci pro konkrétní použití provádí volající.
+
+    Attributes:
+        name (str): Název poolu (pro výpis statistik).
+        factory (callable): Vytvoří nový objekt při prázdném poolu.
+        reset (callable | None): Zavolá se na objektu při vrácení do poolu
+                                 — uvolní reference, vyprázdní seznamy.
+        free (list): Objekty připravené k vydání.
+        hits (int): Počet vydání z recyklovaných objektů.
+        misses (int): Počet vydání, kdy se musel vytvořit nový objekt.
+        in_use (int): Počet aktuálně vydaných objektů.
+        high_water (int): Nejvyšší současný počet vydaných objektů.
+    """
+
+    def __init__(self, factory, reset=None, capacity: int = 0, name: str = ""):
+        """
+        Args:
+            factory: Funkce bez argumentů vytvářející nový objekt.
+            reset: Funkce volaná s objektem při jeho vrácení (reset hook).
+            capacity: Počet objektů vytvořených předem (zahřátí poolu).
+            name: Název poolu pro statistiky.
+        """
+        self.name = name
+        self.factory = factory
+        self.reset = reset
+        self.free = [factory() for _ in range(capacity)]
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self):
+        """Vydá objekt z poolu; pokud je prázdný, vytvoří nový."""
+        if self.free:
+            obj = self.free.pop()
+            self.hits += 1
+        else:
+            obj = self.factory()
+            self.misses += 1
+
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def adopt(self, obj) -> None:
+        """
+        Započítá objekt vytvořený mimo pool jako vydaný.
+
+        Volá se, když kontejner převezme cizí objekt, který později
+        vrátí do poolu přes release() — udrží statistiky konzistentní.
+        """
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+
+    def release(self, obj) -> None:
+        """Vrátí objekt do poolu (zavolá reset hook)."""
+        if self.reset is not None:
+            self.reset(obj)
+        self.free.append(obj)
+        self.in_use -= 1
+
+    def stats(self) -> dict:
+        """
+        Vrátí statistiky poolu.
+
+        Returns:
+            dict: Klíče 'name', 'hits', 'misses', 'in_use', 'free', 'high_water'.
+        """
+        return {
+            "name":       self.name,
+            "hits":       self.hits,
+            "misses":     self.misses,
+            "in_use":     self.in_use,
+            "free":       len(self.free),
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,298 @@
+"""
+profiler.py
+===========
+Lehký profiler fází snímku s exportem do Chrome trace a CSV.
+
+Kód hry označí hranice fází voláním lap(); profiler si zapíše délku
+fáze do kruhového bufferu událostí. Na konci snímku se k němu uloží
+počty entit. Buffer drží posledních PROFILER_FRAMES snímků a na
+požádání se vypíše:
+
+  - do Chrome trace-event JSON (otevřít v chrome://tracing nebo Perfetto),
+  - do CSV souhrnu po fázích (volání, součet, průměr, p50/p95/p99, max).
+
+Vypnutý profiler stojí v místě měření jedinou podmínku:
+
+    if profiler.enabled:
+        profiler.lap("sim.player")
+
+V menu.py profiler přepíná F9 a F10 uloží aktuální buffer do PROFILE_DIR.
+
+FrameTimeRing je samostatný levný buffer délek snímků pro F1 HUD
+(percentily a graf), který běží i bez zapnutého profileru.
+"""
+
+import csv
+import json
+import time
+
+import numpy as np
+from config import GameConfig
+
+
+# Počty entit ukládané ke každému snímku (klíče slovníku pro end_frame)
+COUNT_FIELDS = ("enemies", "projectiles", "particles", "damage_texts")
+
+
+class FrameProfiler:
+    """
+    Kruhový buffer časovaných fází a počtů entit po snímcích.
+
+    Fáze se měří „lapy": mark() nastaví začátek, každé lap(name)
+    zapíše úsek od předchozí značky a značku posune. Vnější úseky,
+    uvnitř kterých se lapuje (např. celé update()), se zapíší přes
+    record(name, start) s vlastním začátkem.
+
+    Attributes:
+        enabled (bool): True = měří se. Přepíná se přes set_enabled()
+                        (změna platí od dalšího snímku).
+        frame_capacity (int): Počet snímků v bufferu.
+        event_capacity (int): Počet událostí (fází) v bufferu.
+        frame (int): Pořadové číslo aktuálního snímku.
+        names (list): Názvy fází; index = id fáze v bufferu.
+    """
+
+    def __init__(self, frames: int = GameConfig.PROFILER_FRAMES, events_per_frame: int = 64):
+        """
+        Args:
+            frames: Kolik posledních snímků se uchovává.
+            events_per_frame: Odhad počtu fází na snímek (velikost bufferu událostí).
+        """
+        self.enabled = False
+        self._pending = False
+        self.frame_capacity = frames
+        self.event_capacity = frames * events_per_frame
+
+        self.names = []
+        self._name_ids = {}
+
+        # Buffer událostí (fází)
+        self.ev_name = np.zeros(self.event_capacity, dtype=np.int16)
+        self.ev_frame = np.zeros(self.event_capacity, dtype=np.int64)
+        self.ev_start = np.zeros(self.event_capacity, dtype=np.int64)
+        self.ev_dur = np.zeros(self.event_capacity, dtype=np.int64)
+        self.events = 0
+
+        # Buffer snímků
+        self.fr_start = np.zeros(frames, dtype=np.int64)
+        self.fr_dur = np.zeros(frames, dtype=np.int64)
+        self.fr_counts = np.zeros((frames, len(COUNT_FIELDS)), dtype=np.int32)
+        self.frame = 0
+        self._frame_start = 0
+        self._mark = 0
+
+    # =========================================================================
+    # MĚŘENÍ
+    # =========================================================================
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Zapne/vypne měření od začátku dalšího snímku."""
+        self._pending = enabled
+
+    def begin_frame(self) -> None:
+        """Začne nový snímek (volá se vždy — aplikuje přepnutí enabled)."""
+        self.enabled = self._pending
+        if self.enabled:
+            self._frame_start = self._mark = time.perf_counter_ns()
+
+    def mark(self) -> None:
+        """Nastaví začátek další fáze bez zápisu události."""
+        self._mark = time.perf_counter_ns()
+
+    def lap(self, name: str) -> None:
+        """Zapíše fázi name od poslední značky do teď a posune značku."""
+        now = time.perf_counter_ns()
+        self._push(name, self._mark, now - self._mark)
+        self._mark = now
+
+    def record(self, name: str, start: int) -> None:
+        """Zapíše úsek name od start (perf_counter_ns) do teď."""
+        self._push(name, start, time.perf_counter_ns() - start)
+
+    def _push(self, name: str, start: int, dur: int) -> None:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        i = self.events % self.event_capacity
+        self.ev_name[i] = name_id
+        self.ev_frame[i] = self.frame
+        self.ev_start[i] = start
+        self.ev_dur[i] = dur
+        self.events += 1
+
+    def end_frame(self, counts: dict = None) -> None:
+        """
+        Uzavře snímek a uloží k němu počty entit.
+
+        Args:
+            counts: Slovník s klíči z COUNT_FIELDS (chybějící = 0).
+        """
+        i = self.frame % self.frame_capacity
+        self.fr_start[i] = self._frame_start
+        self.fr_dur[i] = time.perf_counter_ns() - self._frame_start
+        counts = counts or {}
+        self.fr_counts[i] = [counts.get(k, 0) for k in COUNT_FIELDS]
+        self.frame += 1
+
+    # =========================================================================
+    # VÝSTUP
+    # =========================================================================
+
+    def _retained(self):
+        """Vrátí indexy uchovaných snímků a událostí v chronologickém pořadí."""
+        n_frames = min(self.frame, self.frame_capacity)
+        frames = np.arange(self.frame - n_frames, self.frame) % self.frame_capacity
+
+        n_events = min(self.events, self.event_capacity)
+        events = np.arange(self.events - n_events, self.events) % self.event_capacity
+        # Jen události ze snímků, které jsou v bufferu celé
+        first_frame = self.frame - n_frames
+        events = events[(self.ev_frame[events] >= first_frame)
+                        & (self.ev_frame[events] < self.frame)]
+        return frames, events
+
+    def dump_chrome_trace(self, path: str) -> None:
+        """
+        Uloží buffer jako Chrome trace-event JSON.
+
+        Snímky a fáze jsou "complete" události (ph: X), počty entit
+        čítače (ph: C). Časy jsou v mikrosekundách.
+        """
+        frames, events = self._retained()
+        trace = []
+        for i in frames:
+            start = int(self.fr_start[i]) / 1000
+            trace.append({"name": "frame", "ph": "X", "pid": 1, "tid": 1,
+                          "ts": start, "dur": int(self.fr_dur[i]) / 1000})
+            trace.append({"name": "entities", "ph": "C", "pid": 1, "ts": start,
+                          "args": dict(zip(COUNT_FIELDS, self.fr_counts[i].tolist()))})
+        for i in events:
+            trace.append({"name": self.names[self.ev_name[i]], "ph": "X", "pid": 1, "tid": 1,
+                          "ts": int(self.ev_start[i]) / 1000, "dur": int(self.ev_dur[i]) / 1000})
+
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+    def summary(self) -> list:
+        """
+        Souhrn po fázích přes uchované snímky.
+
+        Percentily a max se počítají ze součtu fáze za snímek (fáze
+        simulace může ve snímku proběhnout víckrát).
+
+        Returns:
+            list: Slovníky s klíči phase, calls, total_ms, mean_ms,
+                  p50_ms, p95_ms, p99_ms, max_ms, frame_share.
+        """
+        frames, events = self._retained()
+        if len(frames) == 0:
+            return []
+        first_frame = self.frame - len(frames)
+        frame_total = self.fr_dur[frames].sum()
+
+        rows = []
+        names = self.ev_name[events]
+        for name_id, name in enumerate(self.names):
+            sel = events[names == name_id]
+            if len(sel) == 0:
+                continue
+            per_frame = np.zeros(len(frames), dtype=np.int64)
+            np.add.at(per_frame, self.ev_frame[sel] - first_frame, self.ev_dur[sel])
+            total = per_frame.sum()
+            p50, p95, p99 = np.percentile(per_frame, (50, 95, 99)) / 1e6
+            rows.append({
+                "phase":       name,
+                "calls":       len(sel),
+                "total_ms":    round(total / 1e6, 3),
+                "mean_ms":     round(total / 1e6 / len(frames), 4),
+                "p50_ms":      round(p50, 4),
+                "p95_ms":      round(p95, 4),
+                "p99_ms":      round(p99, 4),
+                "max_ms":      round(per_frame.max() / 1e6, 4),
+                "frame_share": round(total / frame_total, 4) if frame_total else 0.0,
+            })
+        return rows
+
+    def dump_csv(self, path: str) -> None:
+        """Uloží summary() jako CSV."""
+        rows = self.summary()
+        fields = ["phase", "calls", "total_ms", "mean_ms", "p50_ms",
+                  "p95_ms", "p99_ms", "max_ms", "frame_share"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+# =============================================================================
+# DÉLKY SNÍMKŮ
+# =============================================================================
+class FrameTimeRing:
+    """
+    Kruhový buffer délek snímků (ms) pro HUD s percentily.
+
+    Zápis je O(1) bez alokace, takže se může volat každý snímek i při
+    skrytém HUD; statistiky se počítají jen při vykreslení.
+
+    Attributes:
+        samples (np.ndarray): Buffer pevné délky.
+        head (int): Index, kam se zapíše další vzorek.
+        count (int): Počet platných vzorků (nejvýše len(samples)).
+    """
+
+    def __init__(self, capacity: int = GameConfig.FRAME_HISTORY):
+        self.samples = np.zeros(capacity, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def push(self, dt: float) -> None:
+        """Zapíše délku snímku v sekundách."""
+        self.samples[self.head] = dt * 1000.0
+        self.head = (self.head + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+
+    def clear(self) -> None:
+        """Zahodí všechny vzorky (např. na začátku nové hry)."""
+        self.head = 0
+        self.count = 0
+
+    def latest(self, n: int = None) -> np.ndarray:
+        """Vrátí posledních n vzorků (ms) v chronologickém pořadí."""
+        n = self.count if n is None else min(n, self.count)
+        idx = np.arange(self.head - n, self.head) % len(self.samples)
+        return self.samples[idx]
+
+    def window(self, seconds: float) -> np.ndarray:
+        """Vrátí poslední vzorky, jejichž součet pokrývá zadaný čas."""
+        samples = self.latest()
+        covered = np.cumsum(samples[::-1])
+        n = int(np.searchsorted(covered, seconds * 1000.0)) + 1
+        return samples[-n:]
+
+    def stats(self, seconds: float, budget_ms: float) -> dict:
+        """
+        Percentily délky snímku za posledních seconds sekund.
+
+        Returns:
+            dict: Klíče frames, p50, p95, p99, max (ms) a over_budget
+                  (počet snímků delších než budget_ms).
+        """
+        window = self.window(seconds)
+        if len(window) == 0:
+            return {"frames": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0,
+                    "max": 0.0, "over_budget": 0}
+        p50, p95, p99 = np.percentile(window, (50, 95, 99))
+        return {
+            "frames":      len(window),
+            "p50":         float(p50),
+            "p95":         float(p95),
+            "p99":         float(p99),
+            "max":         float(window.max()),
+            "over_budget": int(np.count_nonzero(window > budget_ms)),
+        }
+
+
+# Globální profiler — jedna instance pro celou aplikaci
+profiler = FrameProfiler()
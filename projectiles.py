@@ -6,12 +6,24 @@ Třída Projectile pro střely vystřelené hráčem.
 Každý projektil má fyzikální simulaci (gravitace + vzdušný odpor),
 vizuální stopu a typ efektu určující speciální chování při zásahu.
 Barva projektilu odpovídá jeho efektu (mapování viz utils.py).
+
+Fyzikální stav všech letících projektilů drží ProjectileBatch jako
+souvislá NumPy pole — gravitace, vzdušný odpor, integrace pozice, úhel,
+zápis do stopy i kontrola hranic proběhnou jedním vektorizovaným
+průchodem. Projectile je tenký pohled na jeden slot dávky.
+
+Stopa je kruhový buffer pevné délky v polích dávky; vykresluje se
+předkreslenými průhlednými kruhy z sprite_cache jedním Surface.blits().
 """
 
 import pygame
 import math
+
+import numpy as np
 from config import GameConfig
 from visuals import Colors
+from soa import ViewStore, store_field
+from sprites import sprite_cache, scaled_radius
 
 
 class Projectile:
@@ -35,17 +47,30 @@ class Projectile:
         damage (int): Základní poškození při zásahu.
         angle (float): Aktuální úhel pohybu ve stupních (pro vykreslení čárky).
         color (tuple): RGB barva — určuje vizuál i typ efektu.
-        trail (list): Posledních 8 pozic pro stopu.
+        trail (list): Posledních 8 pozic pro stopu (od nejstarší, čteno z kruhového bufferu).
         effect_type (str): Typ speciálního efektu: 'none','explosive','slow','dot','pierce','heal'.
-        hit_targets (list): Seznam Enemy zasažených tímto projektilem.
+        hit_targets (list): uid nepřátel zasažených tímto projektilem.
                             Pro 'pierce' typ — zabrání dvojitému zásahu téhož nepřítele.
+                            Ukládá se uid, ne objekt — pohledy Enemy se recyklují přes pool.
         is_alive (bool): False = projektil opustil obrazovku nebo zasáhl cíl.
+
+    pos, vel, angle, trail a is_alive jsou property čtoucí z polí
+    ProjectileBatch. pos a vel vrací kopie — změna se uloží jen přiřazením.
+
+    Samostatný Projectile(...) není tenký pohled: založí vlastní
+    jednoslotovou ProjectileBatch (sada polí NumPy včetně stopy
+    + ObjectPool, ~40 µs). Hra střílí přímo do dávky simulace
+    (spawn_projectile_instance(batch=...)); samostatný projektil je jen
+    pro testy a jednotlivé použití a zanikne i se svou dávkou.
     """
 
     def __init__(self, pos: pygame.Vector2, vel: pygame.Vector2,
                  color: tuple, effect_type: str = "none"):
         """
-        Inicializuje projektil na dané pozici s danou rychlostí.
+        Inicializuje samostatný projektil na dané pozici s danou rychlostí.
+
+        Samostatný projektil má vlastní jednoslotovou dávku; do herní
+        dávky se přesune voláním ProjectileBatch.add().
 
         Args:
             pos: Počáteční pozice (obvykle pozice hráče).
@@ -53,16 +78,56 @@ class Projectile:
             color: RGB barva — vizuál i identifikátor efektu.
             effect_type: Typ efektu ('none', 'explosive', 'slow', 'dot', 'pierce', 'heal').
         """
-        self.pos = pygame.Vector2(pos)   # Kopie, ne reference
-        self.vel = pygame.Vector2(vel)
+        ProjectileBatch(capacity=1).spawn(pos, vel, color, effect_type, view=self)
+
+    def _reset(self, color: tuple, effect_type: str) -> None:
+        """Nastaví atributy, které nejsou uložené v polích dávky."""
         self.radius = GameConfig.PROJECTILE_RADIUS
         self.damage = GameConfig.PROJECTILE_DAMAGE
-        self.angle = 0                   # Aktualizuje se v update() pro směrovou čárku
         self.color = color
-        self.trail = []                  # Fronta posledních poloh pro vizuální stopu
         self.effect_type = effect_type
-        self.hit_targets = []            # Zasažení nepřátelé (pro pierce typ)
-        self.is_alive = True
+        # uid zasažených nepřátel (pro pierce typ) — seznam se při recyklaci znovu použije
+        if hasattr(self, "hit_targets"):
+            self.hit_targets.clear()
+        else:
+            self.hit_targets = []
+
+    # ── Atributy uložené v polích dávky ────────────────────────────────────
+    angle    = store_field("angle", "Úhel pohybu ve stupních (pro směrovou čárku).")
+    is_alive = store_field("alive", "False = projektil opustil obrazovku nebo zasáhl cíl.")
+
+    @property
+    def pos(self) -> pygame.Vector2:
+        """Kopie aktuální pozice."""
+        p = self._store.pos[self._index]
+        return pygame.Vector2(float(p[0]), float(p[1]))
+
+    @pos.setter
+    def pos(self, value) -> None:
+        self._store.pos[self._index] = (value[0], value[1])
+
+    @property
+    def vel(self) -> pygame.Vector2:
+        """Kopie aktuálního rychlostního vektoru (px/s)."""
+        v = self._store.vel[self._index]
+        return pygame.Vector2(float(v[0]), float(v[1]))
+
+    @vel.setter
+    def vel(self, value) -> None:
+        self._store.vel[self._index] = (value[0], value[1])
+
+    @property
+    def trail(self) -> list:
+        """Pozice stopy od nejstarší po nejnovější jako seznam Vector2."""
+        store, i = self._store, self._index
+        length = int(store.trail_len[i])
+        head = int(store.trail_head[i])
+        size = store.trail.shape[1]
+        points = store.trail[i]
+        return [
+            pygame.Vector2(float(points[k % size][0]), float(points[k % size][1]))
+            for k in range(head - length, head)
+        ]
 
     # =========================================================================
     # AKTUALIZACE FYZIKY
@@ -72,6 +137,9 @@ class Projectile:
         """
         Simuluje pohyb projektilu jedním krokem fyzikální integrace.
 
+        Skalární varianta pro samostatné projektily — herní smyčka počítá
+        všechny projektily najednou přes ProjectileBatch.update().
+
         Postup výpočtu (Eulerova metoda):
           1. Zvětši vertikální složku rychlosti o gravitaci.
           2. Zmenši celkovou rychlost o vzdušný odpor.
@@ -88,39 +156,46 @@ class Projectile:
 
         # ── Fyzika ────────────────────────────────────────────────────────
         # Gravitace: zvyšuje vertikální rychlost (kladná Y = dolů)
-        self.vel.y += GameConfig.PROJECTILE_GRAVITY * dt
+        vel = self.vel
+        vel.y += GameConfig.PROJECTILE_GRAVITY * dt
 
         # Vzdušný odpor: každý snímek zmenší rychlost o malé procento
         # Faktor (1 - c*dt) je aproximace e^(-c*t) — exponenciální útlum
-        self.vel *= (1 - GameConfig.AIR_RESISTANCE * dt)
+        vel *= (1 - GameConfig.AIR_RESISTANCE * dt)
+        self.vel = vel
 
         # Eulerova integrace: posun = rychlost × čas
-        self.pos += self.vel * dt
+        pos = self.pos + vel * dt
+        self.pos = pos
 
         # Úhel pohybu — pro vykreslení čárky ve směru letu
-        self.angle = math.degrees(math.atan2(self.vel.y, self.vel.x))
+        self.angle = math.degrees(math.atan2(vel.y, vel.x))
 
         # ── Stopa (trail) ─────────────────────────────────────────────────
-        self.trail.append(self.pos.copy())
-        if len(self.trail) > 8:
-            self.trail.pop(0)  # Udržuj maximálně 8 historických pozic (FIFO)
+        # Zápis do kruhového bufferu — nejstarší bod se přepíše (FIFO)
+        store, i = self._store, self._index
+        size = store.trail.shape[1]
+        store.trail[i, store.trail_head[i]] = (pos.x, pos.y)
+        store.trail_head[i] = (store.trail_head[i] + 1) % size
+        store.trail_len[i] = min(store.trail_len[i] + 1, size)
 
         # ── Kontrola hranic ───────────────────────────────────────────────
         # Margin 100 px zabrání předčasnému zániku projektilu na okraji obrazovky
-        if (self.pos.x < -100 or self.pos.x > GameConfig.WIDTH + 100 or
-                self.pos.y < -100 or self.pos.y > GameConfig.HEIGHT + 100):
+        if (pos.x < -100 or pos.x > GameConfig.WIDTH + 100 or
+                pos.y < -100 or pos.y > GameConfig.HEIGHT + 100):
             self.is_alive = False
 
     # =========================================================================
     # VYKRESLOVÁNÍ
     # =========================================================================
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, scale: float = 1.0) -> None:
         """
         Vykreslí vizuální stopu a samotný projektil.
 
         Stopa:
-          - Každý historický bod se vykreslí jako průhledný kruh.
+          - Každý historický bod se vykreslí jako průhledný kruh
+            (předkreslený sprite z sprite_cache, jedno volání blits()).
           - Alpha (průhlednost) roste s indexem — starší body jsou průhledné,
             novější (blíže k projektilu) jsou více viditelné.
           - Zelené projektily (dot efekt) mají větší stopu (size=6 vs size=4).
@@ -131,28 +206,191 @@ class Projectile:
 
         Args:
             screen: Cílový pygame povrch.
+            alpha: Interpolační faktor pevného kroku — čárka se vykreslí mezi
+                   pozicí před posledním krokem (0.0) a aktuální pozicí (1.0).
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
         """
         if not self.is_alive:
             return
 
-        # ── Stopa ─────────────────────────────────────────────────────────
-        for i, pos in enumerate(self.trail):
-            # Alpha narůstá s pozicí v seznamu (0 = nejstarší = průhledný)
-            alpha = int(200 * (i / len(self.trail)))
+        screen.blits(self.trail_blits(scale=scale), doreturn=False)
+        self.draw_body(screen, alpha, scale)
 
-            # Zelené projektily mají větší stopu pro zdůraznění DoT efektu
-            size = 6 if self.color == Colors.GREEN else 4
+    def trail_blits(self, blits: list = None, scale: float = 1.0) -> list:
+        """
+        Připraví dvojice (sprite, pozice) pro vykreslení stopy.
 
-            # Povrch s alfa kanálem pro průhledný kruh
-            s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*self.color, alpha), (size, size), size)
-            screen.blit(s, (pos.x - size, pos.y - size))
+        Kruhy stopy se berou z sprite_cache podle (barva, velikost, alpha),
+        takže se za snímek nevytváří žádný nový povrch.
 
-        # ── Projektil (čárka ve směru pohybu) ─────────────────────────────
-        start = self.pos
+        Args:
+            blits: Seznam, do kterého se dvojice přidají (None = nový).
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
+
+        Returns:
+            list: Sekvence pro Surface.blits().
+        """
+        if blits is None:
+            blits = []
+
+        store, i = self._store, self._index
+        length = min(int(store.trail_len[i]), store.trail_draw)
+        if length == 0:
+            return blits
+        head = int(store.trail_head[i])
+        points = store.trail[i].tolist()
+        ring = len(points)
+
+        # Zelené projektily mají větší stopu pro zdůraznění DoT efektu
+        size = scaled_radius(6 if self.color == Colors.GREEN else 4, scale)
+        for j in range(length):
+            x, y = points[(head - length + j) % ring]
+            # Alpha narůstá k projektilu (0 = nejstarší = průhledný)
+            dot = sprite_cache.trail_dot(self.color, size, int(200 * (j / length)))
+            blits.append((dot, (x * scale - size, y * scale - size)))
+        return blits
+
+    def draw_body(self, screen: pygame.Surface, alpha: float = 1.0, scale: float = 1.0) -> None:
+        """Vykreslí samotný projektil jako čárku ve směru pohybu."""
+        prev = self._store.prev_pos[self._index]
+        start = pygame.Vector2(float(prev[0]), float(prev[1])).lerp(self.pos, alpha) * scale
         # Koncový bod: posun 12 px ve směru pohybu
         end = start + pygame.Vector2(
             math.cos(math.radians(self.angle)),
             math.sin(math.radians(self.angle))
-        ) * 12
-        pygame.draw.line(screen, self.color, start, end, 3)
\ No newline at end of file
+        ) * (12 * scale)
+        pygame.draw.line(screen, self.color, start, end, scaled_radius(3, scale))
+
+
+# =============================================================================
+# DÁVKA PROJEKTILŮ (structure-of-arrays)
+# =============================================================================
+class ProjectileBatch(ViewStore):
+    """
+    Kontejner všech letících projektilů uložený jako souvislá NumPy pole.
+
+    Chová se jako seznam pohledů Projectile v pořadí výstřelu. update()
+    provede fyzikální krok pro všechny živé projektily najednou;
+    remove_dead() je pak hromadně odstraní jedinou maskovanou kopií polí.
+
+    Attributes:
+        pos, vel (np.ndarray): Pozice a rychlosti, tvar (capacity, 2).
+        prev_pos (np.ndarray): Pozice před posledním krokem simulace (interpolace).
+        angle (np.ndarray): Úhel pohybu ve stupních.
+        alive (np.ndarray): Příznak života (bool).
+        trail (np.ndarray): Kruhový buffer stopy, tvar (capacity, TRAIL, 2).
+        trail_head (np.ndarray): Index, kam se zapíše další bod stopy.
+        trail_len (np.ndarray): Počet platných bodů stopy.
+        trail_draw (int): Kolik nejnovějších bodů stopy se vykreslí
+                          (regulátor kvality ho zkracuje, viz quality.py).
+    """
+
+    TRAIL = GameConfig.PROJECTILE_TRAIL_LENGTH
+
+    FIELDS = {
+        "pos":        ((2,),        np.float64, 0.0),
+        "prev_pos":   ((2,),        np.float64, 0.0),
+        "vel":        ((2,),        np.float64, 0.0),
+        "angle":      ((),          np.float64, 0.0),
+        "alive":      ((),          np.bool_,   True),
+        "trail":      ((TRAIL, 2),  np.float64, 0.0),
+        "trail_head": ((),          np.int32,   0),
+        "trail_len":  ((),          np.int32,   0),
+    }
+
+    def __init__(self, capacity: int = GameConfig.POOL_PROJECTILES,
+                 pool_size: int = 0):
+        super().__init__(Projectile, capacity, pool_size)
+        self.trail_draw = self.TRAIL
+
+    def _release_view(self, view: Projectile) -> None:
+        view.hit_targets.clear()
+
+    def spawn(self, pos, vel, color: tuple, effect_type: str = "none",
+              view: Projectile = None) -> Projectile:
+        """
+        Vytvoří nový projektil v novém slotu dávky.
+
+        Args:
+            pos: Počáteční pozice.
+            vel: Počáteční rychlostní vektor (px/s).
+            color: RGB barva projektilu.
+            effect_type: Typ efektu (viz Projectile).
+            view: Existující objekt Projectile k navázání (jinak z poolu).
+
+        Returns:
+            Projectile: Pohled na nový slot.
+        """
+        i = self._alloc()
+        self.pos[i] = (pos[0], pos[1])
+        self.prev_pos[i] = (pos[0], pos[1])
+        self.vel[i] = (vel[0], vel[1])
+        if view is None:
+            view = self.view_pool.acquire()
+        else:
+            self.view_pool.adopt(view)
+        view._reset(color, effect_type)
+        self._attach(view, i)
+        return view
+
+    def snapshot(self) -> None:
+        """Uloží aktuální pozice jako předchozí (před krokem simulace)."""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def update(self, dt: float) -> None:
+        """
+        Provede jeden krok fyzikální integrace pro všechny živé projektily.
+
+        Postup je shodný s Projectile.update(): gravitace, vzdušný odpor,
+        Eulerova integrace, úhel (atan2), zápis do stopy, kontrola hranic.
+
+        Args:
+            dt: Delta time v sekundách.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        alive = np.flatnonzero(self.alive[:n])
+        if len(alive) == 0:
+            return
+
+        # ── Fyzika ────────────────────────────────────────────────────────
+        vel = self.vel[alive]
+        vel[:, 1] += GameConfig.PROJECTILE_GRAVITY * dt
+        vel *= (1 - GameConfig.AIR_RESISTANCE * dt)
+        pos = self.pos[alive] + vel * dt
+        self.vel[alive] = vel
+        self.pos[alive] = pos
+        self.angle[alive] = np.degrees(np.arctan2(vel[:, 1], vel[:, 0]))
+
+        # ── Stopa (kruhový buffer) ────────────────────────────────────────
+        head = self.trail_head[alive]
+        self.trail[alive, head] = pos
+        self.trail_head[alive] = (head + 1) % self.TRAIL
+        self.trail_len[alive] = np.minimum(self.trail_len[alive] + 1, self.TRAIL)
+
+        # ── Kontrola hranic (margin 100 px) ───────────────────────────────
+        out = ((pos[:, 0] < -100) | (pos[:, 0] > GameConfig.WIDTH + 100) |
+               (pos[:, 1] < -100) | (pos[:, 1] > GameConfig.HEIGHT + 100))
+        self.alive[alive[out]] = False
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, scale: float = 1.0) -> None:
+        """
+        Vykreslí všechny živé projektily — stopy jedním Surface.blits().
+
+        Stopy všech projektilů se posbírají do jedné sekvence a vykreslí
+        najednou, pak se přes ně nakreslí čárky projektilů.
+
+        Args:
+            screen: Cílový pygame povrch.
+            alpha: Interpolační faktor pevného kroku (viz Projectile.draw()).
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
+        """
+        live = [view for view in self.views if view.is_alive]
+        blits = []
+        for view in live:
+            view.trail_blits(blits, scale)
+        screen.blits(blits, doreturn=False)
+        for view in live:
+            view.draw_body(screen, alpha, scale)
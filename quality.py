@@ -0,0 +1,142 @@
+"""
+quality.py
+==========
+Regulátor kvality efektů řízený délkou snímku.
+
+Na slabších strojích nejde ručně ladit počty částic a efekty pro každý
+počítač zvlášť. QualityGovernor sleduje klouzavý průměr práce na snímek
+(čas bez čekání clock.tick) proti rozpočtu 1000 / GameConfig.FPS ms
+a podle něj posouvá úroveň kvality z QUALITY_LEVELS:
+
+  - tlak (průměr > QUALITY_DOWN_RATIO × rozpočet) trvající
+    QUALITY_DOWN_HOLD s → o úroveň níž,
+  - rezerva (průměr < QUALITY_UP_RATIO × rozpočet) trvající
+    QUALITY_UP_HOLD s → o úroveň výš.
+
+Mezi prahy je pásmo, ve kterém se nic nemění, a zvýšení čeká déle než
+snížení — úroveň tak nekmitá. Po každé změně se průměr měří znovu od
+začátku, aby se nová úroveň posuzovala jen podle svých snímků. Každá
+změna se vypíše a uloží do changes.
+
+Úroveň se projeví přes PlayingState.apply_quality() (states_game.py).
+"""
+
+import numpy as np
+from config import GameConfig
+
+
+# Úrovně od nejvyšší kvality; particles a trail jsou násobky počtu částic
+# v burstu a délky stopy, render_scale je horní mez měřítka
+# (uživatelské GameConfig.RENDER_SCALE se nikdy nezvýší)
+QUALITY_LEVELS = (
+    {"name": "high",    "particles": 1.0,  "trail": 1.0, "glow": True,  "coalesce": False, "render_scale": 1.0},
+    {"name": "medium",  "particles": 0.6,  "trail": 0.75, "glow": True,  "coalesce": True,  "render_scale": 1.0},
+    {"name": "low",     "particles": 0.4,  "trail": 0.5, "glow": False, "coalesce": True,  "render_scale": 1.0},
+    {"name": "minimal", "particles": 0.25, "trail": 0.25, "glow": False, "coalesce": True,  "render_scale": 0.5},
+)
+
+
+class QualityGovernor:
+    """
+    Volí úroveň kvality podle klouzavého průměru práce na snímek.
+
+    Attributes:
+        enabled (bool): False = úroveň se nemění (zůstává aktuální).
+        level (int): Index aktuální úrovně v QUALITY_LEVELS (0 = nejvyšší).
+        budget_ms (float): Rozpočet snímku (ms).
+        samples (np.ndarray): Kruhový buffer práce na snímek (ms).
+        changes (list): Záznamy změn (čas hry s, z úrovně, na úroveň, průměr ms).
+    """
+
+    def __init__(self, fps: int = GameConfig.FPS, window: int = GameConfig.QUALITY_WINDOW):
+        """
+        Args:
+            fps: Cílové FPS — rozpočet snímku je 1000 / fps ms.
+            window: Počet snímků klouzavého průměru.
+        """
+        self.enabled = GameConfig.QUALITY_GOVERNOR
+        self.level = 0
+        self.budget_ms = 1000.0 / fps
+        self.samples = np.zeros(window, dtype=np.float64)
+        self.changes = []
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._pressure = 0.0    # Jak dlouho (s) trvá tlak
+        self._headroom = 0.0    # Jak dlouho (s) trvá rezerva
+        self._time = 0.0
+
+    @property
+    def settings(self) -> dict:
+        """Nastavení aktuální úrovně (slovník z QUALITY_LEVELS)."""
+        return QUALITY_LEVELS[self.level]
+
+    def average(self) -> float:
+        """Klouzavý průměr práce na snímek (ms); 0 bez vzorků."""
+        return float(self._sum / self._count) if self._count else 0.0
+
+    def reset(self) -> None:
+        """Zahodí naměřené snímky (úroveň zůstává — stroj je pořád stejný)."""
+        self.samples[:] = 0.0
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._pressure = 0.0
+        self._headroom = 0.0
+
+    def push(self, work_ms: float, dt: float) -> bool:
+        """
+        Zapíše práci jednoho snímku a případně změní úroveň.
+
+        Args:
+            work_ms: Čas práce snímku bez čekání na limit FPS (ms),
+                     např. pygame.time.Clock.get_rawtime().
+            dt: Délka snímku (s) — pro měření, jak dlouho trvá tlak/rezerva.
+
+        Returns:
+            bool: True = úroveň se změnila.
+        """
+        self._time += dt
+        if not self.enabled:
+            return False
+
+        # Klouzavý součet — O(1) za snímek
+        window = len(self.samples)
+        self._sum += work_ms - self.samples[self._head]
+        self.samples[self._head] = work_ms
+        self._head = (self._head + 1) % window
+        if self._count < window:
+            self._count += 1
+            return False    # Průměr se posuzuje až z plného okna
+
+        avg = self.average()
+        if avg > self.budget_ms * GameConfig.QUALITY_DOWN_RATIO:
+            self._pressure += dt
+            self._headroom = 0.0
+        elif avg < self.budget_ms * GameConfig.QUALITY_UP_RATIO:
+            self._headroom += dt
+            self._pressure = 0.0
+        else:
+            self._pressure = 0.0
+            self._headroom = 0.0
+
+        if self._pressure >= GameConfig.QUALITY_DOWN_HOLD and self.level < len(QUALITY_LEVELS) - 1:
+            self._change(self.level + 1, avg)
+            return True
+        if self._headroom >= GameConfig.QUALITY_UP_HOLD and self.level > 0:
+            self._change(self.level - 1, avg)
+            return True
+        return False
+
+    def _change(self, level: int, avg: float) -> None:
+        """Přepne úroveň, zaloguje změnu a začne měřit znovu."""
+        old = QUALITY_LEVELS[self.level]["name"]
+        new = QUALITY_LEVELS[level]["name"]
+        print(f"Kvalita: {old} → {new} (průměr {avg:.2f} ms, rozpočet {self.budget_ms:.2f} ms)")
+        self.changes.append((round(self._time, 3), self.level, level, round(avg, 3)))
+        self.level = level
+        self.reset()
+
+
+# Globální regulátor — jedna instance pro celou aplikaci
+quality = QualityGovernor()
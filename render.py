@@ -12,9 +12,13 @@ GameState(Enum) v states.py, který řídí přechody mezi obrazovkami.
 
 import pygame
 import math
+import numpy as np
 from config import GameConfig
 from visuals import Colors
 from utils import calculate_hit_accuracy
+from particles import ParticleSystem
+from sprites import sprite_cache, alpha_level, ALPHA_LEVELS
+from glyphs import GlyphAtlas
 
 
 # =============================================================================
@@ -46,10 +50,20 @@ class Renderer:
         font (pygame.font.Font): Malý font (24 pt) pro statistiky a popisky.
         large_font (pygame.font.Font): Velký font (72 pt) pro overlay texty.
         medium_font (pygame.font.Font): Střední font (36 pt) pro restart text.
+        glyphs (GlyphAtlas): Atlas znaků malého fontu pro čísla a popisky HUD.
         smooth_hp (float): Interpolovaná hodnota zdraví pro plynulý health bar.
         smooth_st (float): Interpolovaná hodnota staminy pro plynulý stamina bar.
+        hud_stats_rect (pygame.Rect): Oblast panelu statistik (podle šířky screen).
+        hud_redraws (int): Počet překreslení widgetů retained HUD.
     """
 
+    FRAME_PANEL_WIDTH = 320     # Šířka panelu délek snímků = počet vzorků v grafu
+
+    # Oblasti retained panelů HUD na obrazovce
+    HUD_BARS_RECT = pygame.Rect(20, 50, 220, 48)    # Health + stamina bar
+    HUD_STATS_SIZE = (200, 150)                     # Šest řádků statistik u pravého okraje
+    HUD_LINE_HEIGHT = 25
+
     def __init__(self, screen: pygame.Surface):
         pygame.font.init()
         self.screen = screen
@@ -57,44 +71,100 @@ class Renderer:
         self.font        = pygame.font.SysFont(None, 24)
         self.large_font  = pygame.font.SysFont(None, 72)
         self.medium_font = pygame.font.SysFont(None, 36)
+        self.glyphs      = GlyphAtlas(self.font)
+
+        self._frame_panel = None    # Poloprůhledné pozadí panelu délek snímků
 
+        # Retained HUD — panely se překreslí jen při změně svých hodnot
+        self._hud_bars = pygame.Surface(self.HUD_BARS_RECT.size, pygame.SRCALPHA)
+        # Panel statistik u pravého okraje — podle skutečné šířky okna, ne
+        # podle GameConfig.WIDTH v době importu (rozlišení z config.json)
+        self.hud_stats_rect = pygame.Rect((screen.get_width() - self.HUD_STATS_SIZE[0], 50),
+                                          self.HUD_STATS_SIZE)
+        self._hud_stats = pygame.Surface(self.HUD_STATS_SIZE, pygame.SRCALPHA)
+        self.hud_redraws = 0        # Počet překreslení widgetů HUD (pro ladění)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Připraví HUD na novou hru — bary se znovu plynule naplní od nuly
+        a retained panely se překreslí. Fonty a atlas znaků zůstávají.
+        """
         self.smooth_hp = 0.0
         self.smooth_st = 0.0
+        self._hud_keys = {}         # Poslední vykreslená hodnota každého widgetu
+        self._accuracy_key = None   # (hits, shots) poslední spočtené přesnosti
+        self._accuracy = 0.0
 
     # =========================================================================
     # ČÁSTICE A TEXTY POŠKOZENÍ
     # =========================================================================
 
-    def draw_particles(self, particles: list) -> None:
+    def draw_particles(self, particles: list,
+                       additive: bool = GameConfig.PARTICLE_ADDITIVE,
+                       surface: pygame.Surface = None, scale: float = 1.0) -> None:
         """
-        Vykreslí všechny aktivní částice.
+        Vykreslí všechny aktivní částice jedním voláním Surface.blits().
+
+        Kruhy částic se berou z sprite_cache podle (barva, poloměr,
+        úroveň průhlednosti). Pro ParticleSystem se poloměry, úrovně
+        a pozice spočítají vektorově nad jeho poli.
 
         Args:
-            particles: Seznam slovníků částic z HelperFunctions.spawn_hit_particles().
+            particles: ParticleSystem nebo seznam slovníků částic
+                       z HelperFunctions.spawn_hit_particles().
+            additive: True = aditivní míchání (BLEND_RGB_ADD) místo alfa.
+            surface: Cílový povrch (None = self.screen).
+            scale: Měřítko vnitřního rozlišení (GameConfig.RENDER_SCALE).
         """
-        for p in particles:
-            alpha = int(255 * (p['life'] / p['max_life']))
-            s = pygame.Surface((p['radius'] * 2, p['radius'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                s,
-                p['color'] + (alpha,),
-                (int(p['radius']), int(p['radius'])),
-                int(p['radius'])
-            )
-            self.screen.blit(s, (p['pos'].x - p['radius'], p['pos'].y - p['radius']))
+        if isinstance(particles, ParticleSystem):
+            n = particles.count
+            if n == 0:
+                return
+            radius = particles.radius[:n] * scale
+            alpha = (255 * (particles.life[:n] / particles.max_life[:n])).astype(np.int64)
+            levels = np.rint(alpha * (ALPHA_LEVELS - 1) / 255).astype(np.int64).tolist()
+            colors = [particles.palette[c] for c in particles.color[:n].tolist()]
+            sizes = np.maximum(radius.astype(np.int64), 1).tolist()
+            corners = (particles.pos[:n] * scale - radius[:, None]).tolist()
+        else:
+            particles = list(particles)
+            levels = [alpha_level(int(255 * (p['life'] / p['max_life']))) for p in particles]
+            colors = [p['color'] for p in particles]
+            sizes = [max(1, int(p['radius'] * scale)) for p in particles]
+            corners = [(p['pos'].x * scale - p['radius'] * scale, p['pos'].y * scale - p['radius'] * scale)
+                       for p in particles]
+
+        particle = sprite_cache.particle
+        if additive:
+            blits = [
+                (particle(color, r, level, True), corner, None, pygame.BLEND_RGB_ADD)
+                for color, r, level, corner in zip(colors, sizes, levels, corners)
+            ]
+        else:
+            blits = [
+                (particle(color, r, level), corner)
+                for color, r, level, corner in zip(colors, sizes, levels, corners)
+            ]
+        target = self.screen if surface is None else surface
+        target.blits(blits, doreturn=False)
 
     def draw_damage_texts(self, damage_texts: list) -> None:
         """
         Vykreslí plovoucí texty poškození nad zasaženými nepřáteli.
 
+        Všechny texty se složí ze znaků atlasu (vyblednutí = úroveň
+        průhlednosti znaku) a vykreslí jedním voláním Surface.blits().
+
         Args:
             damage_texts: Seznam slovníků textů z HelperFunctions.spawn_damage_text().
         """
+        blits = []
         for t in damage_texts:
             alpha = int(255 * (t['life'] / t['max_life']))
-            txt_surf = self.font.render(str(t['text']), True, Colors.DAMAGE_TEXT)
-            txt_surf.set_alpha(alpha)
-            self.screen.blit(txt_surf, (t['pos'].x, t['pos'].y))
+            self.glyphs.blits(str(t['text']), (t['pos'].x, t['pos'].y),
+                              Colors.DAMAGE_TEXT, alpha, blits)
+        self.screen.blits(blits, doreturn=False)
 
     def draw_projectiles(self, projectiles: list) -> None:
         """
@@ -106,13 +176,48 @@ class Renderer:
         for projectile in projectiles:
             projectile.draw(self.screen)
 
+    # =========================================================================
+    # HUD — RETAINED PANELY
+    # =========================================================================
+
+    def draw_hud(self, player, stats: dict, elapsed_time: float, dt: float) -> None:
+        """
+        Aktualizuje retained panely HUD a vykreslí je jedním voláním blits().
+
+        Health/stamina bar a statistiky se kreslí do vlastních povrchů
+        a každý widget se překreslí jen tehdy, když se změní jeho
+        zobrazená hodnota (šířka baru v px, číslo, čas po sekundách).
+        Snímek beze změny stojí jen blit dvou malých panelů.
+
+        Args:
+            player: Instance Player.
+            stats: Slovník se statistikami aktuální hry.
+            elapsed_time: Uplynulý čas hry v sekundách.
+            dt: Delta time pro interpolaci barů.
+        """
+        self.draw_health_bar(player, dt)
+        self.draw_stamina_bar(player, dt)
+        self.draw_game_stats(stats, elapsed_time)
+        self.screen.blits((
+            (self._hud_bars, self.HUD_BARS_RECT),
+            (self._hud_stats, self.hud_stats_rect),
+        ), doreturn=False)
+
+    def _hud_changed(self, widget: str, key) -> bool:
+        """Vrátí True (a zapamatuje si key), pokud se hodnota widgetu změnila."""
+        if self._hud_keys.get(widget) == key:
+            return False
+        self._hud_keys[widget] = key
+        self.hud_redraws += 1
+        return True
+
     # =========================================================================
     # HUD — ZDRAVÍ A STAMINA
     # =========================================================================
 
     def draw_health_bar(self, player, dt: float) -> None:
         """
-        Vykreslí health bar hráče s plynulou interpolací.
+        Aktualizuje health bar hráče s plynulou interpolací (panel barů).
 
         Barva se mění dle procentuálního zdraví:
           >60 %: zelená, 30–60 %: žlutá, <30 %: červená.
@@ -124,8 +229,6 @@ class Renderer:
         self.smooth_hp += (player.health - self.smooth_hp) * 10 * dt
         hp_percent = max(0, self.smooth_hp / player.max_health)
 
-        pygame.draw.rect(self.screen, Colors.UI_BG, (20, 50, 220, 22), border_radius=5)
-
         if hp_percent > 0.6:
             color = Colors.GREEN
         elif hp_percent > 0.3:
@@ -133,15 +236,18 @@ class Renderer:
         else:
             color = Colors.RED
 
-        pygame.draw.rect(
-            self.screen, color,
-            (20, 50, 220 * hp_percent, 22),
-            border_radius=5
-        )
+        bar = pygame.Rect(0, 0, 220 * hp_percent, 22)
+        if not self._hud_changed("health", (bar.width, color)):
+            return
+
+        panel = self._hud_bars
+        panel.fill((0, 0, 0, 0), (0, 0, 220, 22))
+        pygame.draw.rect(panel, Colors.UI_BG, (0, 0, 220, 22), border_radius=5)
+        pygame.draw.rect(panel, color, bar, border_radius=5)
 
     def draw_stamina_bar(self, player, dt: float) -> None:
         """
-        Vykreslí stamina bar pod health barem.
+        Aktualizuje stamina bar pod health barem (panel barů).
 
         Args:
             player: Instance Player.
@@ -150,12 +256,14 @@ class Renderer:
         self.smooth_st += (player.stamina - self.smooth_st) * 10 * dt
         st_percent = self.smooth_st / GameConfig.MAX_STAMINA
 
-        pygame.draw.rect(self.screen, Colors.UI_BG, (20, 80, 220, 18), border_radius=5)
-        pygame.draw.rect(
-            self.screen, Colors.STAMINA,
-            (20, 80, 220 * st_percent, 18),
-            border_radius=5
-        )
+        bar = pygame.Rect(0, 30, 220 * st_percent, 18)
+        if not self._hud_changed("stamina", bar.width):
+            return
+
+        panel = self._hud_bars
+        panel.fill((0, 0, 0, 0), (0, 30, 220, 18))
+        pygame.draw.rect(panel, Colors.UI_BG, (0, 30, 220, 18), border_radius=5)
+        pygame.draw.rect(panel, Colors.STAMINA, bar, border_radius=5)
 
     # =========================================================================
     # HUD — DASH COOLDOWN
@@ -191,12 +299,11 @@ class Renderer:
             )
 
             remaining_secs = int((1 - dash_cooldown_progress) * (GameConfig.DASH_COOLDOWN / 1000))
-            cd_text = self.font.render(f"{remaining_secs}s", True, Colors.WHITE)
-            self.screen.blit(cd_text, (center_x - 8, center_y - 6))
+            self.glyphs.draw(self.screen, f"{remaining_secs}s",
+                             (center_x - 8, center_y - 6), Colors.WHITE)
         else:
             pygame.draw.circle(self.screen, Colors.GREEN, (center_x, center_y), radius)
-            ready_text = self.font.render("D", True, Colors.WHITE)
-            self.screen.blit(ready_text, (center_x - 5, center_y - 6))
+            self.glyphs.draw(self.screen, "D", (center_x - 5, center_y - 6), Colors.WHITE)
 
     # =========================================================================
     # HUD — STATISTIKY
@@ -204,7 +311,10 @@ class Renderer:
 
     def draw_game_stats(self, stats: dict, elapsed_time: float = 0.0) -> None:
         """
-        Vykreslí herní statistiky v pravém horním rohu obrazovky.
+        Aktualizuje herní statistiky v pravém horním rohu (panel statistik).
+
+        Každý řádek je samostatný widget; přesnost se přepočítá jen při
+        změně zásahů nebo výstřelů a čas se překreslí jednou za sekundu.
 
         Args:
             stats: Slovník se statistikami aktuální hry.
@@ -212,48 +322,70 @@ class Renderer:
         """
         hits  = stats.get("projectiles_hit", 0)
         shots = stats.get("projectiles_fired", 0)
-        accuracy = calculate_hit_accuracy(hits, shots)
-
-        minutes = int(elapsed_time // 60)
-        seconds = int(elapsed_time % 60)
-        time_str = f"Čas: {minutes}:{seconds:02d}"
-
-        stats_text = [
-            f"Kills: {stats.get('enemies_killed', 0)}",
-            f"Accuracy: {accuracy:.1f}%",
-            f"Projectiles: {shots}",
-            f"Hits: {hits}",
-            f"Collisions: {stats.get('player_collisions', 0)}",
-            time_str,
-        ]
-
-        for i, text in enumerate(stats_text):
-            stat_surf = self.font.render(text, True, Colors.WHITE)
-            self.screen.blit(stat_surf, (GameConfig.WIDTH - 200, 50 + i * 25))
+        if self._accuracy_key != (hits, shots):
+            self._accuracy_key = (hits, shots)
+            self._accuracy = calculate_hit_accuracy(hits, shots)
+
+        widgets = (
+            ("kills",       stats.get('enemies_killed', 0)),
+            ("accuracy",    self._accuracy),
+            ("projectiles", shots),
+            ("hits",        hits),
+            ("collisions",  stats.get('player_collisions', 0)),
+            ("time",        int(elapsed_time)),
+        )
+        for i, (widget, value) in enumerate(widgets):
+            if self._hud_changed(widget, value):
+                self._draw_stat_line(i, self._stat_text(widget, value))
+
+    @staticmethod
+    def _stat_text(widget: str, value) -> str:
+        """Vrátí text řádku statistik pro widget a jeho hodnotu."""
+        if widget == "kills":
+            return f"Kills: {value}"
+        if widget == "accuracy":
+            return f"Accuracy: {value:.1f}%"
+        if widget == "projectiles":
+            return f"Projectiles: {value}"
+        if widget == "hits":
+            return f"Hits: {value}"
+        if widget == "collisions":
+            return f"Collisions: {value}"
+        minutes, seconds = divmod(value, 60)
+        return f"Čas: {minutes}:{seconds:02d}"
+
+    def _draw_stat_line(self, row: int, text: str) -> None:
+        """Překreslí jeden řádek panelu statistik."""
+        panel = self._hud_stats
+        y = row * self.HUD_LINE_HEIGHT
+        panel.fill((0, 0, 0, 0), (0, y, panel.get_width(), self.HUD_LINE_HEIGHT))
+        self.glyphs.draw(panel, text, (0, y), Colors.WHITE)
 
     # =========================================================================
     # HUD — FPS ČÍTAČ
     # =========================================================================
 
     def draw_fps_counter(self, current_fps: float, show_fps: bool,
-                         fps_history: list) -> None:
+                         frame_times, counts: dict = None) -> None:
         """
-        Vykreslí FPS čítač v levém horním rohu (přepínatelný klávesou F1).
+        Vykreslí FPS čítač a panel délek snímků (přepínatelné klávesou F1).
 
-        Barva: ≥60 FPS zelená, 30–59 žlutá, <30 červená.
+        Panel obsahuje graf posledních snímků s čarou rozpočtu snímku
+        (1000 / GameConfig.FPS ms), percentily p50/p95/p99 a maximum za
+        posledních FRAME_STATS_SECONDS sekund, počet snímků nad rozpočtem
+        a počty živých entit a velikost cache spritů.
+
+        Barva FPS: ≥60 FPS zelená, 30–59 žlutá, <30 červená.
 
         Args:
-            current_fps: Aktuální FPS z clock.get_fps().
+            current_fps: Aktuální FPS vypočítané z dt.
             show_fps: True = FPS se zobrazuje.
-            fps_history: Seznam historických FPS hodnot.
+            frame_times: FrameTimeRing s délkami snímků.
+            counts: Počty entit (Simulation.entity_counts()); None = nezobrazí se.
         """
         if not show_fps:
             return
 
-        fps_history.append(current_fps)
-        if len(fps_history) > 100:
-            fps_history.pop(0)
-
         if current_fps >= 60:
             color = Colors.GREEN
         elif current_fps >= 30:
@@ -261,8 +393,49 @@ class Renderer:
         else:
             color = Colors.RED
 
-        fps_text = self.font.render(f"FPS: {int(current_fps)}", True, color)
-        self.screen.blit(fps_text, (20, 20))
+        self.glyphs.draw(self.screen, f"FPS: {int(current_fps)}", (20, 20), color)
+
+        # ── Panel délek snímků ────────────────────────────────────────────────
+        x, y = 20, 160
+        width, graph_h = self.FRAME_PANEL_WIDTH, 80
+        if self._frame_panel is None:
+            self._frame_panel = pygame.Surface((width, graph_h + 100), pygame.SRCALPHA)
+            self._frame_panel.fill((0, 0, 0, 150))
+        self.screen.blit(self._frame_panel, (x, y))
+
+        budget = 1000.0 / GameConfig.FPS
+        scale = graph_h / (budget * 3)          # Graf sahá do trojnásobku rozpočtu
+        bottom = y + graph_h
+
+        # Čára rozpočtu snímku
+        budget_y = bottom - budget * scale
+        pygame.draw.line(self.screen, Colors.YELLOW, (x, budget_y), (x + width, budget_y), 1)
+
+        samples = frame_times.latest(width)
+        if len(samples) > 1:
+            heights = bottom - np.minimum(samples, budget * 3) * scale
+            points = list(zip(range(x + width - len(samples), x + width), heights.tolist()))
+            pygame.draw.lines(self.screen, Colors.FPS_TEXT, False, points)
+
+        stats = frame_times.stats(GameConfig.FRAME_STATS_SECONDS, budget)
+        lines = [
+            f"p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  "
+            f"p99 {stats['p99']:.1f}  max {stats['max']:.1f} ms",
+            f"Over budget: {stats['over_budget']}/{stats['frames']} "
+            f"({GameConfig.FRAME_STATS_SECONDS} s)",
+        ]
+        if counts is not None:
+            lines.append(
+                f"Enemies {counts.get('enemies', 0)}  Proj {counts.get('projectiles', 0)}  "
+                f"Particles {counts.get('particles', 0)}"
+            )
+        sprites = sprite_cache.stats()
+        lines.append(f"Sprites {sprites['sprites']} ({sprites['bytes'] / 1024:.0f} KiB)  "
+                     f"Glyphs {self.glyphs.stats()['glyphs']}")
+        blits = []
+        for i, text in enumerate(lines):
+            self.glyphs.blits(text, (x + 6, bottom + 6 + i * 22), Colors.FPS_TEXT, out=blits)
+        self.screen.blits(blits, doreturn=False)
 
     # =========================================================================
     # OVERLAY — PAUZA A GAME OVER
@@ -0,0 +1,241 @@
+"""
+replay.py
+=========
+Nahrávání a přehrávání vstupu hráče v kompaktním binárním formátu.
+
+Záznam obsahuje seed proudů náhody (rng.py), nastavení kroku simulace
+a pro každý snímek jeho dt a vstup (držené klávesy, pozice myši,
+počet kliknutí). Simulace je při stejném seedu a vstupu deterministická,
+takže přehrání záznamu zopakuje celou hru včetně stats — výkonnostní
+špičku nebo chybu z reálné hry lze pak zkoumat znovu a bez okna.
+
+Formát souboru (little-endian):
+    hlavička  HEADER   — magic, verze, seed, Hz, max. kroků dohánění,
+                         příznaky, výsledné stats, počet snímků
+    tělo      zlib     — sloupec dt (float64) následovaný sloupcem vstupů
+                         FRAME (x, y myši int16, maska kláves, kliknutí)
+
+Přehrání bez okna (rychleji než v reálném čase):
+    python replay.py hra.bsr
+"""
+
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+from simulation import Simulation, FrameInput, KeyState, PygameInput
+from timestep import FixedStepper
+
+
+MAGIC = b"BSRP"
+VERSION = 1
+
+# magic, verze, seed, SIMULATION_HZ, MAX_CATCHUP_STEPS, příznaky,
+# enemies_killed, player_collisions, projectiles_fired, projectiles_hit, počet snímků
+HEADER = struct.Struct("<4sBQHBB4II")
+FRAME = struct.Struct("<hhBB")
+
+FLAG_FIXED_TIMESTEP = 0x01
+
+STAT_KEYS = ("enemies_killed", "player_collisions", "projectiles_fired", "projectiles_hit")
+
+# Pořadí bitů masky kláves
+KEY_BITS = PygameInput.GAME_KEYS
+
+
+def _clamp16(v: float) -> int:
+    """Zaokrouhlí souřadnici a omezí ji na rozsah int16."""
+    return max(-32768, min(32767, int(round(v))))
+
+
+class Replay:
+    """
+    Záznam jedné hry — hlavička a seznam snímků.
+
+    Attributes:
+        seed (int): Seed proudů náhody simulace.
+        hz (int): Frekvence simulace (SIMULATION_HZ) při nahrávání.
+        max_steps (int): MAX_CATCHUP_STEPS při nahrávání.
+        fixed_timestep (bool): Režim kroku simulace při nahrávání.
+        stats (dict): Statistiky na konci nahrávání (pro ověření přehrání).
+        dts (array): Délky snímků v sekundách (float64).
+        inputs (list): Vstupy snímků jako n-tice (x, y, maska_kláves, kliknutí).
+    """
+
+    def __init__(self, seed: int, hz: int, max_steps: int, fixed_timestep: bool):
+        self.seed = seed
+        self.hz = hz
+        self.max_steps = max_steps
+        self.fixed_timestep = fixed_timestep
+        self.stats = dict.fromkeys(STAT_KEYS, 0)
+        self.dts = array("d")
+        self.inputs = []
+
+    def __len__(self) -> int:
+        return len(self.dts)
+
+    # =========================================================================
+    # SOUBOR
+    # =========================================================================
+
+    def save(self, path: str) -> None:
+        """Uloží záznam do binárního souboru."""
+        flags = FLAG_FIXED_TIMESTEP if self.fixed_timestep else 0
+        header = HEADER.pack(
+            MAGIC, VERSION, self.seed, self.hz, self.max_steps, flags,
+            *(self.stats[k] for k in STAT_KEYS), len(self.dts)
+        )
+        body = self.dts.tobytes() + b"".join(FRAME.pack(*f) for f in self.inputs)
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(body, 9))
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """
+        Načte záznam ze souboru.
+
+        Raises:
+            ValueError: Soubor není záznam hry nebo má nepodporovanou verzi.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        (magic, version, seed, hz, max_steps, flags,
+         *stats, count) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} není záznam hry")
+        if version != VERSION:
+            raise ValueError(f"Nepodporovaná verze záznamu: {version}")
+
+        replay = cls(seed, hz, max_steps, bool(flags & FLAG_FIXED_TIMESTEP))
+        replay.stats = dict(zip(STAT_KEYS, stats))
+
+        body = zlib.decompress(data[HEADER.size:])
+        split = count * 8
+        replay.dts.frombytes(body[:split])
+        replay.inputs = list(FRAME.iter_unpack(body[split:]))
+        return replay
+
+
+# =============================================================================
+# NAHRÁVÁNÍ A PŘEHRÁVÁNÍ
+# =============================================================================
+class ReplayRecorder:
+    """
+    Zaznamenává vstup simulace snímek po snímku.
+
+    Připojí se jako Simulation.recorder hned po reset(). Vstup se
+    zaokrouhlí na přesnost formátu ještě před předáním simulaci, takže
+    nahrávaná hra i její přehrání vidí bit po bitu stejná data.
+
+    Attributes:
+        replay (Replay): Nahrávaný záznam.
+        sim (Simulation): Nahrávaná simulace (zdroj výsledných stats).
+    """
+
+    def __init__(self, sim: Simulation):
+        self.sim = sim
+        self.replay = Replay(
+            sim.rng.seed, round(1.0 / sim.stepper.step),
+            sim.stepper.max_steps, sim.fixed_timestep
+        )
+
+    def record(self, dt: float, frame_input: FrameInput) -> FrameInput:
+        """
+        Zapíše snímek a vrátí vstup v přesnosti záznamu.
+
+        Args:
+            dt: Délka snímku (s).
+            frame_input: Vstup ze zdroje simulace.
+
+        Returns:
+            FrameInput: Vstup, který má simulace skutečně použít.
+        """
+        mask = 0
+        for bit, key in enumerate(KEY_BITS):
+            if frame_input.keys[key]:
+                mask |= 1 << bit
+        x, y = frame_input.mouse_pos
+        frame = (_clamp16(x), _clamp16(y), mask, min(frame_input.clicks, 255))
+
+        self.replay.dts.append(dt)
+        self.replay.inputs.append(frame)
+        return _frame_input(frame)
+
+    def save(self, path: str) -> None:
+        """Uloží záznam i s aktuálními stats simulace."""
+        self.replay.stats = {k: self.sim.stats[k] for k in STAT_KEYS}
+        self.replay.save(path)
+
+
+def _frame_input(frame: tuple) -> FrameInput:
+    """Převede n-tici snímku ze záznamu na FrameInput."""
+    x, y, mask, clicks = frame
+    keys = KeyState(key for bit, key in enumerate(KEY_BITS) if mask & (1 << bit))
+    return FrameInput(keys, (x, y), clicks)
+
+
+class ReplayInput:
+    """
+    Zdroj vstupu přehrávající snímky ze záznamu.
+
+    Attributes:
+        frames (list): Vstupy snímků ze záznamu.
+        index (int): Index dalšího snímku.
+    """
+
+    def __init__(self, replay: Replay):
+        self.frames = replay.inputs
+        self.index = 0
+
+    def poll(self, sim) -> FrameInput:
+        frame = self.frames[self.index]
+        self.index += 1
+        return _frame_input(frame)
+
+
+def play(replay: Replay) -> Simulation:
+    """
+    Přehraje záznam bez okna tak rychle, jak to procesor zvládne.
+
+    Args:
+        replay: Načtený záznam.
+
+    Returns:
+        Simulation: Simulace ve stavu po posledním snímku.
+    """
+    sim = Simulation(
+        input_source=ReplayInput(replay),
+        fixed_timestep=replay.fixed_timestep, seed=replay.seed
+    )
+    sim.stepper = FixedStepper(replay.hz, replay.max_steps)
+    for dt in replay.dts:
+        sim.advance(dt)
+    return sim
+
+
+def main() -> None:
+    """Přehraje záznam zadaný na příkazové řádce a ověří výsledné stats."""
+    if len(sys.argv) < 2:
+        print("Použití: python replay.py <záznam.bsr>")
+        sys.exit(1)
+
+    replay = Replay.load(sys.argv[1])
+    start = time.perf_counter()
+    sim = play(replay)
+    wall = time.perf_counter() - start
+
+    print(f"Přehráno {len(replay)} snímků ({sim.elapsed_time:.1f} s hry) za {wall:.2f} s")
+    print("Statistiky:", sim.stats)
+    if sim.stats == replay.stats:
+        print("Shodné se záznamem.")
+    else:
+        print("ROZDÍL oproti záznamu:", replay.stats)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+rng.py
+======
+Oddělené proudy náhody odvozené z jednoho seedu.
+
+Spawn nepřátel, rozptyl a barva projektilů i částice dřív sdílely
+globální modul random — jakákoli změna v jednom systému (např. víc
+částic) posunula náhodu všem ostatním a hru nešlo zopakovat.
+RandomStreams dá každému subsystému vlastní generátor odvozený ze
+společného seedu, takže stejný seed a stejný vstup vedou ke stejné hře
+(viz replay.py) a částice neovlivní, kde se objeví další nepřítel.
+"""
+
+import random
+
+import numpy as np
+
+
+class RandomStreams:
+    """
+    Sada nezávislých generátorů náhody pro jednotlivé subsystémy.
+
+    Seed proudu se odvodí z hlavního seedu a názvu proudu — přidání
+    nového proudu nezmění posloupnosti těch existujících.
+
+    Attributes:
+        seed (int): Hlavní seed (0 až 2**64 - 1).
+        spawn (random.Random): Strana a zdraví nových nepřátel.
+        weapon (random.Random): Rozptyl a barva (efekt) projektilů.
+        particles (np.random.Generator): Směr, rychlost a velikost částic.
+    """
+
+    def __init__(self, seed: int = None):
+        """
+        Args:
+            seed: Hlavní seed. None = náhodný seed ze systémového zdroje.
+        """
+        self.reseed(seed)
+
+    def reseed(self, seed: int = None) -> None:
+        """
+        Znovu vytvoří všechny proudy z nového seedu.
+
+        Args:
+            seed: Hlavní seed. None = náhodný seed ze systémového zdroje.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = int(seed) % 2 ** 64
+        self.spawn = random.Random(self.derive("spawn"))
+        self.weapon = random.Random(self.derive("weapon"))
+        self.particles = np.random.default_rng(self.derive("particles"))
+
+    def derive(self, name: str) -> int:
+        """Vrátí 64bitový seed proudu odvozený z hlavního seedu a názvu."""
+        return random.Random(f"{self.seed}:{name}").getrandbits(64)
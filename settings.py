@@ -27,6 +27,15 @@ BACKGROUND = os.path.join("Assets", "back_1.png")
 # Při příštím startu serveru se data automaticky importují do databáze.
 JSON_SAVE = "game_stats.json"
 
+# Složka pro záznamy her (replay.py) — používá se při GameConfig.RECORD_REPLAYS.
+REPLAY_DIR = "replays"
+
+# Složka pro výstupy profileru (Chrome trace JSON a CSV souhrn, klávesa F10).
+PROFILE_DIR = "profiles"
+
+# Složka s předpečenými pozadími menu (background.py), jeden BMP na (rozlišení, seed).
+BACKGROUND_CACHE_DIR = os.path.join("cache", "backgrounds")
+
 
 # =============================================================================
 # KONFIGURACE UŽIVATELSKÉHO NASTAVENÍ
@@ -41,6 +50,9 @@ DEFAULT_CONFIG = {
     "fullscreen": False,          # Celoobrazovkový režim (zatím nevyužito)
     "last_user": None,            # Uživatelské jméno naposledy přihlášeného uživatele
                                   # — předvyplní se v LoginState pro rychlejší přihlášení
+    "render_scale": 1.0,          # Měřítko vnitřního rozlišení herní scény (GameConfig.RENDER_SCALE)
+    "background_seed": None,      # Seed vesmírného pozadí menu (None = vylosuje se
+                                  # při prvním startu a uloží, viz background.py)
 }
 
 
@@ -53,7 +65,8 @@ def load_config() -> dict:
     Pokud soubor neexistuje nebo je poškozený, vrátí DEFAULT_CONFIG.
 
     Returns:
-        dict: Konfigurační slovník s klíči 'resolution', 'fullscreen', 'last_user'.
+        dict: Konfigurační slovník s klíči 'resolution', 'fullscreen', 'last_user',
+              'render_scale', 'background_seed'.
     """
     if os.path.exists(CONFIG_FILE):
         try:
@@ -0,0 +1,663 @@
+"""
+simulation.py
+=============
+Herní simulace oddělená od okna, skutečného vstupu a reálného času.
+
+Simulation obsahuje veškerou herní logiku, která dřív žila přímo
+v PlayingState.update(): pohyb hráče, spawn nepřátel, kolize, efekty
+projektilů, částice a statistiky. Čas a vstup do ní přicházejí zvenku:
+
+  - clock        — hodiny s get_ticks() a advance(dt); výchozí SimClock
+                   běží jen s kroky simulace, ne s reálným časem,
+  - input_source — objekt s poll(sim) → FrameInput; PygameInput čte
+                   klávesnici a myš okna, AutoInput je jednoduchý bot.
+
+Simulace nepotřebuje okno ani pygame.init() — pygame se používá jen
+pro Vector2 a konstanty kláves. Lze ji proto spustit v jiném procesu,
+v testech nebo rychleji než v reálném čase:
+
+    python simulation.py --minutes 10          # 10 minut hry během pár sekund
+    python simulation.py --minutes 10 --idle   # hráč bez vstupu (soak test)
+    python simulation.py --seed 42 --record hra.bsr   # nahrání hry pro replay.py
+
+PlayingState (states_game.py) simulaci pouze řídí a vykresluje.
+"""
+
+import argparse
+import math
+import os
+import time
+
+import pygame
+from config import GameConfig
+from visuals import Colors
+from player import Player
+from enemy import EnemySwarm
+from projectiles import ProjectileBatch
+from particles import ParticleSystem
+from utils import HelperFunctions, damage_text_pool
+from spatial import SpatialGrid
+from timestep import FixedStepper
+from rng import RandomStreams
+from profiler import profiler
+
+
+# =============================================================================
+# HODINY
+# =============================================================================
+class SimClock:
+    """
+    Simulační hodiny — čas se posouvá pouze voláním advance().
+
+    Stejné rozhraní (get_ticks, advance, reset) může implementovat
+    jakýkoli jiný zdroj času předaný do Simulation.
+
+    Attributes:
+        ticks (float): Aktuální simulační čas v milisekundách.
+    """
+
+    def __init__(self):
+        self.ticks = 0.0
+
+    def reset(self) -> None:
+        """Vrátí hodiny na nulu."""
+        self.ticks = 0.0
+
+    def advance(self, dt: float) -> None:
+        """Posune čas o dt sekund."""
+        self.ticks += dt * 1000.0
+
+    def get_ticks(self) -> float:
+        """Vrátí aktuální čas v ms (obdoba pygame.time.get_ticks())."""
+        return self.ticks
+
+
+# =============================================================================
+# VSTUP
+# =============================================================================
+class KeyState:
+    """
+    Stisknuté klávesy indexovatelné jako výsledek pygame.key.get_pressed().
+
+    Player.move() a Player.fly() čtou keys[pygame.K_d] apod. — KeyState
+    odpovídá True pro klávesy v množině pressed, jinak False.
+
+    Attributes:
+        pressed (frozenset): Kódy stisknutých kláves.
+    """
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class FrameInput:
+    """
+    Vstup hráče pro jeden snímek.
+
+    Attributes:
+        keys (KeyState): Držené klávesy.
+        mouse_pos (tuple): Pozice kurzoru (px) — cíl výstřelu.
+        clicks (int): Počet kliknutí levým tlačítkem od minulého snímku.
+    """
+
+    def __init__(self, keys: KeyState = None, mouse_pos=(0, 0), clicks: int = 0):
+        self.keys = keys if keys is not None else KeyState()
+        self.mouse_pos = mouse_pos
+        self.clicks = clicks
+
+    def held(self) -> 'FrameInput':
+        """Vrátí kopii bez kliknutí (pro další kroky téhož snímku)."""
+        return FrameInput(self.keys, self.mouse_pos, 0)
+
+
+# Vstup bez stisknutých kláves a kliknutí
+NO_INPUT = FrameInput()
+
+
+class IdleInput:
+    """Zdroj vstupu, který nic nemačká (výchozí pro Simulation)."""
+
+    def poll(self, sim) -> FrameInput:
+        return NO_INPUT
+
+
+class PygameInput:
+    """
+    Zdroj vstupu z okna — klávesnice přes pygame.key, myš přes pygame.mouse.
+
+    Kliknutí se sbírají z událostí v handle_event() a předají se
+    v nejbližším poll(), takže se neztratí ani ve snímku bez kroku simulace.
+
+    Attributes:
+        clicks (int): Kliknutí nasbíraná od posledního poll().
+    """
+
+    # Klávesy, které herní logika čte
+    GAME_KEYS = (pygame.K_a, pygame.K_d, pygame.K_LCTRL, pygame.K_SPACE)
+
+    def __init__(self):
+        self.clicks = 0
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Započítá kliknutí levým tlačítkem myši."""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.clicks += 1
+
+    def poll(self, sim) -> FrameInput:
+        """Přečte aktuální stav kláves a myši."""
+        pressed = pygame.key.get_pressed()
+        keys = KeyState(k for k in self.GAME_KEYS if pressed[k])
+        frame = FrameInput(keys, pygame.mouse.get_pos(), self.clicks)
+        self.clicks = 0
+        return frame
+
+
+class AutoInput:
+    """
+    Jednoduchý bot pro běh bez okna — míří na nejbližšího nepřítele a střílí.
+
+    Hráč stojí na místě; kadenci omezuje PROJECTILE_DELAY stejně
+    jako u skutečného hráče.
+    """
+
+    def poll(self, sim) -> FrameInput:
+        player_pos = sim.player.pos
+        target = None
+        best = float("inf")
+        for x, y in sim.enemies.positions():
+            d = (x - player_pos.x) ** 2 + (y - player_pos.y) ** 2
+            if d < best:
+                best, target = d, (x, y)
+        if target is None:
+            target = (player_pos.x, player_pos.y - 100)
+        return FrameInput(KeyState(), target, 1)
+
+
+# =============================================================================
+# SIMULACE
+# =============================================================================
+class Simulation:
+    """
+    Kompletní herní logika jedné hry bez vazby na okno a reálný čas.
+
+    Attributes:
+        clock: Zdroj času (get_ticks, advance, reset) — výchozí SimClock.
+        input: Zdroj vstupu s metodou poll(sim) → FrameInput.
+        player (Player): Instance hráče.
+        enemies (EnemySwarm): Aktivní nepřátelé.
+        projectiles (ProjectileBatch): Aktivní projektily.
+        particles (ParticleSystem): Aktivní částice efektů.
+        damage_texts (list): Aktivní plovoucí texty poškození.
+        coalesce_texts (bool): True = zásah blízko čerstvého textu poškození
+                               přičte hodnotu do něj místo nového textu
+                               (zapíná regulátor kvality, viz quality.py).
+        stats (dict): Statistiky aktuální hry.
+        rng (RandomStreams): Proudy náhody (spawn, zbraň, částice) z jednoho seedu.
+        recorder: Volitelný záznamník vstupu (replay.ReplayRecorder) — None = nenahrává se.
+        start_time (float): Čas hodin na začátku hry (ms).
+        elapsed_time (float): Uplynulý simulační čas hry (s).
+        game_over (bool): True = hráč zemřel, simulace se zastavila.
+        pending_clicks (int): Kliknutí ze snímků, v nichž neproběhl žádný krok.
+        fixed_timestep (bool): True = advance() simuluje v pevných krocích.
+        stepper (FixedStepper): Akumulátor pevného časového kroku.
+        alpha (float): Interpolační faktor pozic pro vykreslení (0–1).
+        enemy_grid (SpatialGrid): Prostorový index nepřátel pro broadphase kolizí.
+        use_spatial_grid (bool): False = brute-force průchod všech nepřátel.
+    """
+
+    def __init__(self, clock=None, input_source=None,
+                 fixed_timestep: bool = GameConfig.FIXED_TIMESTEP, seed: int = None):
+        """
+        Args:
+            clock: Zdroj času; None = nový SimClock.
+            input_source: Zdroj vstupu; None = IdleInput.
+            fixed_timestep: True = advance() běží v krocích 1/SIMULATION_HZ.
+            seed: Seed první hry; None = náhodný.
+        """
+        self.clock = clock if clock is not None else SimClock()
+        self.input = input_source if input_source is not None else IdleInput()
+
+        self.fixed_timestep = fixed_timestep
+        self.stepper = FixedStepper(GameConfig.SIMULATION_HZ, GameConfig.MAX_CATCHUP_STEPS)
+        self.alpha = 1.0
+
+        self.enemy_grid = SpatialGrid(GameConfig.SPATIAL_CELL_SIZE)
+        self.use_spatial_grid = GameConfig.USE_SPATIAL_GRID
+
+        # Kontejnery entit žijí po celou dobu běhu — reset() je jen
+        # vyprázdní, takže pooly zůstanou zahřáté i mezi jednotlivými hrami
+        self.enemies      = EnemySwarm(GameConfig.POOL_ENEMIES, GameConfig.POOL_ENEMIES)
+        self.projectiles  = ProjectileBatch(GameConfig.POOL_PROJECTILES, GameConfig.POOL_PROJECTILES)
+        self.particles    = ParticleSystem(GameConfig.MAX_PARTICLES)
+        self.damage_texts = []
+        self.coalesce_texts = False
+
+        self.rng = RandomStreams(seed)
+        self.recorder = None
+        self.reset(self.rng.seed)
+
+    def reset(self, seed: int = None) -> None:
+        """
+        Připraví novou hru — vyprázdní kontejnery a vynuluje statistiky.
+
+        Args:
+            seed: Seed proudů náhody; None = náhodný. Stejný seed a stejný
+                  vstup vedou ke stejnému průběhu hry.
+        """
+        self.rng.reseed(seed)
+        self.particles.rng = self.rng.particles
+        self.recorder = None
+
+        if hasattr(self.clock, "reset"):
+            self.clock.reset()
+        self.start_time = self.clock.get_ticks()
+        self.elapsed_time = 0.0
+        self.game_over = False
+        self.pending_clicks = 0
+        self.stepper.reset()
+        self.alpha = 1.0
+
+        self.player = Player()
+        self.enemies.clear()
+        self.projectiles.clear()
+        self.particles.clear()
+        for t in self.damage_texts:
+            damage_text_pool.release(t)
+        self.damage_texts = []
+        self.enemy_grid.clear()
+
+        # Hodiny simulace začínají na nule — cooldowny výstřelu a zásahu
+        # od -inf, aby na začátku hry neplatily (jako dřív u get_ticks())
+        self.last_projectile_time  = -math.inf
+        self.last_enemy_spawn_time = self.start_time
+        self.last_player_hit_time  = -math.inf
+
+        self.stats = {
+            "enemies_killed":    0,
+            "player_collisions": 0,
+            "projectiles_fired": 0,
+            "projectiles_hit":   0,
+        }
+
+    # =========================================================================
+    # ŘÍZENÍ ČASU
+    # =========================================================================
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Posune simulaci o čas jednoho snímku a vrátí počet provedených kroků.
+
+        Vstup se přečte jednou za snímek. V režimu pevného kroku se dt
+        nasčítá do akumulátoru a proběhne 0 až MAX_CATCHUP_STEPS kroků;
+        kliknutí dostane jen první z nich (ve snímku bez kroku se odloží).
+        Zbytek akumulátoru určuje alpha pro interpolaci vykreslení.
+        Jinak proběhne jeden krok s proměnným dt.
+
+        Args:
+            frame_dt: Délka snímku v sekundách.
+
+        Returns:
+            int: Počet provedených kroků simulace.
+        """
+        if self.game_over:
+            return 0
+
+        frame_input = self.input.poll(self)
+        if self.recorder is not None:
+            frame_input = self.recorder.record(frame_dt, frame_input)
+
+        if not self.fixed_timestep:
+            self.step(frame_dt, frame_input)
+            self.alpha = 1.0
+            return 1
+
+        steps = self.stepper.advance(frame_dt)
+        if steps == 0:
+            self.pending_clicks += frame_input.clicks
+        for i in range(steps):
+            self.step(self.stepper.step, frame_input if i == 0 else frame_input.held())
+            if self.game_over:
+                break
+        self.alpha = self.stepper.alpha
+        return steps
+
+    def _store_previous_positions(self) -> None:
+        """Uloží pozice entit před krokem simulace (pro interpolaci vykreslení)."""
+        self.player.snapshot()
+        self.enemies.snapshot()
+        self.projectiles.snapshot()
+
+    # =========================================================================
+    # KROK SIMULACE
+    # =========================================================================
+
+    def fire(self, target, current_time: float) -> bool:
+        """
+        Vystřelí projektil od hráče k cíli, pokud vypršel cooldown.
+
+        Args:
+            target: Cílový bod (typicky pozice kurzoru).
+            current_time: Aktuální čas hodin (ms).
+
+        Returns:
+            bool: True = projektil byl vystřelen.
+        """
+        if current_time - self.last_projectile_time < GameConfig.PROJECTILE_DELAY:
+            return False
+        HelperFunctions.spawn_projectile_instance(
+            self.player.pos, current_time, self.projectiles, target, self.rng.weapon
+        )
+        self.last_projectile_time = current_time
+        self.stats["projectiles_fired"] += 1
+        return True
+
+    def add_damage_text(self, pos: pygame.Vector2, damage) -> None:
+        """
+        Přidá plovoucí text poškození.
+
+        Při coalesce_texts se poškození přičte do textu, který vznikl
+        poblíž (GameConfig.DAMAGE_TEXT_COALESCE_RADIUS) a ještě neuplynula
+        polovina jeho životnosti; text se tím obnoví. Hodně zásahů za sebou
+        tak vykreslí jeden text místo desítek.
+        """
+        if self.coalesce_texts:
+            limit = GameConfig.DAMAGE_TEXT_COALESCE_RADIUS ** 2
+            for t in self.damage_texts:
+                if (t['life'] > t['max_life'] * 0.5
+                        and t['pos'].distance_squared_to(pos) <= limit):
+                    t['value'] += damage
+                    t['text'] = str(t['value'])
+                    t['life'] = t['max_life']
+                    return
+        self.damage_texts.append(HelperFunctions.spawn_damage_text(pos, damage))
+
+    def nearby_enemies(self, pos: pygame.Vector2, radius: float) -> list:
+        """
+        Vrátí nepřátele, kteří mohou kolidovat s kružnicí (pos, radius).
+
+        Při zapnuté mřížce se ptá enemy_grid, jinak vrátí celý seznam
+        (původní brute-force chování). Přesný test provádí volající.
+
+        Args:
+            pos: Střed dotazované kružnice.
+            radius: Poloměr dotazované kružnice (px).
+
+        Returns:
+            list: Kandidáti v pořadí seznamu self.enemies.
+        """
+        if self.use_spatial_grid:
+            return self.enemy_grid.query(pos, radius)
+        return self.enemies
+
+    def step(self, dt: float, frame_input: FrameInput = NO_INPUT) -> None:
+        """
+        Jeden krok herní logiky.
+
+        Pořadí:
+          1. Posun hodin, výstřely z kliknutí.
+          2. Pohyb a aktualizace hráče.
+          3. Kontrola smrti hráče — přechod do stavu game_over.
+          4. Spawn nepřátel (časovač).
+          5. Kolize hráč ↔ nepřátelé.
+          6. Aktualizace nepřátel, odstranění mrtvých.
+          7. Aktualizace projektilů, kolize s nepřáteli, aplikace efektů.
+          8. Aktualizace částic a textů poškození.
+
+        Kolize (kroky 5 a 7 včetně výbuchů) se ptají prostorové mřížky,
+        která se přestaví po spawnu a znovu po pohybu nepřátel.
+
+        Args:
+            dt: Délka kroku v sekundách.
+            frame_input: Vstup hráče pro tento krok.
+        """
+        if self.game_over:
+            return
+
+        # Časování fází (profiler.py) — vypnuté stojí jednu podmínku na fázi
+        prof = profiler
+        if prof.enabled:
+            prof.mark()
+
+        self._store_previous_positions()
+        self.clock.advance(dt)
+        current_time = self.clock.get_ticks()
+        self.elapsed_time = (current_time - self.start_time) / 1000.0
+
+        # ── Výstřely ──────────────────────────────────────────────────────
+        if frame_input.clicks or self.pending_clicks:
+            self.pending_clicks = 0
+            self.fire(frame_input.mouse_pos, current_time)
+        if prof.enabled:
+            prof.lap("sim.input")
+
+        # ── Hráč ──────────────────────────────────────────────────────────
+        keys = frame_input.keys
+        self.player.move(dt, keys, current_time)
+        self.player.fly(dt, keys)
+        self.player.update(dt)
+        self.player.enforce_boundaries()
+        if prof.enabled:
+            prof.lap("sim.player")
+
+        if self.player.health <= 0:
+            self.player.health = 0   # Zabrání záporným hodnotám v HUD
+            self.game_over = True
+            return
+
+        # ── Spawn nepřátel ────────────────────────────────────────────────
+        if current_time - self.last_enemy_spawn_time >= GameConfig.ENEMY_SPAWN_INTERVAL:
+            HelperFunctions.spawn_enemy_improved(self.enemies, self.rng.spawn)
+            self.last_enemy_spawn_time = current_time
+
+        if self.use_spatial_grid:
+            self.enemy_grid.rebuild(self.enemies, self.enemies.positions())
+        if prof.enabled:
+            prof.lap("sim.spawn")
+
+        # ── Kolize hráč ↔ nepřítel (cooldown 500 ms) ─────────────────────
+        for enemy in self.nearby_enemies(self.player.pos, self.player.radius):
+            dist = (self.player.pos - enemy.pos).length()
+            if dist < (self.player.radius + enemy.radius):
+                if current_time - self.last_player_hit_time > 500:
+                    direction = self.player.pos - enemy.pos
+                    self.player.take_damage(15, direction)
+                    self.stats["player_collisions"] += 1
+                    self.last_player_hit_time = current_time
+        if prof.enabled:
+            prof.lap("sim.contact")
+
+        # ── Aktualizace nepřátel (jeden vektorizovaný krok pro celý roj) ──
+        for enemy in self.enemies.update(dt, self.player.pos):
+            self.particles.spawn(
+                enemy.pos, Colors.DEATH_PARTICLES,
+                count=20, speed=400, lifetime=0.7
+            )
+            self.stats["enemies_killed"] += 1
+        self.enemies.remove_dead()
+
+        # Nepřátelé se pohnuli — mřížku je nutné postavit znovu
+        if self.use_spatial_grid:
+            self.enemy_grid.rebuild(self.enemies, self.enemies.positions())
+        if prof.enabled:
+            prof.lap("sim.enemies")
+
+        # ── Aktualizace projektilů (fyzika jedním průchodem pro celou dávku) ──
+        self.projectiles.update(dt)
+
+        for proj in self.projectiles:
+            if not proj.is_alive:
+                continue
+
+            proj_pos = proj.pos   # Kopie z pole dávky — načte se jednou
+            for enemy in self.nearby_enemies(proj_pos, proj.radius):
+                if HelperFunctions.check_collision(
+                    proj_pos, enemy.pos, proj.radius, enemy.radius
+                ):
+                    first_hit = False
+                    if proj.effect_type == "pierce":
+                        if enemy.uid in proj.hit_targets:
+                            continue
+                        if len(proj.hit_targets) == 0:
+                            first_hit = True
+                        proj.hit_targets.append(enemy.uid)
+                    else:
+                        proj.is_alive = False
+                        first_hit = True
+
+                    enemy.take_damage(proj.damage)
+
+                    if first_hit:
+                        self.stats["projectiles_hit"] += 1
+
+                    self.particles.spawn(
+                        enemy.pos, Colors.HIT_PARTICLES,
+                        count=10, speed=220, lifetime=0.4
+                    )
+                    self.add_damage_text(
+                        enemy.pos - pygame.Vector2(0, enemy.radius + 10), proj.damage
+                    )
+
+                    # Speciální efekty dle typu projektilu
+                    if proj.effect_type == "explosive":
+                        for e in self.nearby_enemies(enemy.pos, GameConfig.EXPLOSION_RADIUS):
+                            if (e is not enemy
+                                    and e.pos.distance_to(enemy.pos) <= GameConfig.EXPLOSION_RADIUS):
+                                e.take_damage(proj.damage // 2)
+                    elif proj.effect_type == "slow":
+                        enemy.apply_slow(GameConfig.SLOW_DURATION, GameConfig.SLOW_FACTOR)
+                    elif proj.effect_type == "dot":
+                        enemy.apply_dot(
+                            GameConfig.DOT_DURATION,
+                            proj.damage * GameConfig.DOT_DAMAGE_FACTOR
+                        )
+                    elif proj.effect_type == "heal":
+                        self.player.heal(GameConfig.HIT_HEAL)
+
+                    break
+
+        # Hromadné odstranění projektilů mimo obrazovku i těch, které zasáhly cíl
+        self.projectiles.remove_dead()
+        if prof.enabled:
+            prof.lap("sim.projectiles")
+
+        # ── Aktualizace částic (vektorizovaně, swap-remove mrtvých) ───────
+        self.particles.update(dt)
+        if prof.enabled:
+            prof.lap("sim.particles")
+
+        # ── Aktualizace textů poškození ───────────────────────────────────
+        # Vypršelé záznamy se vrací do poolu; seznam se přefiltruje jedním průchodem
+        live_texts = []
+        for t in self.damage_texts:
+            t["life"] -= dt
+            if t["life"] <= 0:
+                damage_text_pool.release(t)
+            else:
+                t["pos"] += t["vel"] * dt
+                t["vel"] *= 1 - 1.5 * dt
+                live_texts.append(t)
+        self.damage_texts[:] = live_texts
+        if prof.enabled:
+            prof.lap("sim.texts")
+
+    def entity_counts(self) -> dict:
+        """Vrátí počty živých entit (klíče profiler.COUNT_FIELDS)."""
+        return {
+            "enemies":      len(self.enemies),
+            "projectiles":  len(self.projectiles),
+            "particles":    len(self.particles),
+            "damage_texts": len(self.damage_texts),
+        }
+
+    def pool_stats(self) -> list:
+        """
+        Vrátí statistiky všech poolů entit (hits, misses, high-water mark).
+
+        Returns:
+            list: Slovníky z ObjectPool.stats().
+        """
+        return [
+            self.enemies.view_pool.stats(),
+            self.projectiles.view_pool.stats(),
+            damage_text_pool.stats(),
+        ]
+
+
+# =============================================================================
+# BĚH BEZ OKNA (RYCHLÉ PŘETOČENÍ)
+# =============================================================================
+def fast_forward(sim: Simulation, seconds: float) -> int:
+    """
+    Odsimuluje zadaný herní čas tak rychle, jak to procesor zvládne.
+
+    Snímky mají délku jednoho kroku 1/SIMULATION_HZ bez ohledu na reálný
+    čas (přes advance(), takže případný recorder nahrává i zde);
+    simulace skončí dříve, pokud hráč zemře.
+
+    Args:
+        sim: Simulace (typicky bez okna, se SimClock).
+        seconds: Herní čas k odsimulování (s).
+
+    Returns:
+        int: Počet provedených kroků.
+    """
+    dt = sim.stepper.step
+    steps = 0
+    while sim.elapsed_time < seconds and not sim.game_over:
+        profiler.begin_frame()
+        steps += sim.advance(dt)
+        if profiler.enabled:
+            profiler.end_frame(sim.entity_counts())
+    return steps
+
+
+def main() -> None:
+    """Spustí hru bez okna a vypíše statistiky a dosažené zrychlení."""
+    parser = argparse.ArgumentParser(description="Bubble Shooter — simulace bez okna")
+    parser.add_argument("--minutes", type=float, default=10.0,
+                        help="herní čas k odsimulování (min)")
+    parser.add_argument("--idle", action="store_true",
+                        help="hráč bez vstupu místo bota, který střílí")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed proudů náhody (výchozí náhodný)")
+    parser.add_argument("--record", metavar="SOUBOR",
+                        help="uloží záznam hry pro replay.py")
+    parser.add_argument("--profile", metavar="PREFIX",
+                        help="uloží profil posledních snímků do PREFIX.json a PREFIX.csv")
+    args = parser.parse_args()
+
+    # Simulace okno nepotřebuje; dummy ovladač pro případ, že se pygame inicializuje
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    sim = Simulation(input_source=IdleInput() if args.idle else AutoInput(), seed=args.seed)
+    if args.record:
+        from replay import ReplayRecorder
+        sim.recorder = ReplayRecorder(sim)
+    if args.profile:
+        profiler.set_enabled(True)
+
+    start = time.perf_counter()
+    steps = fast_forward(sim, args.minutes * 60)
+    wall = time.perf_counter() - start
+
+    print(f"Odsimulováno {sim.elapsed_time:.1f} s hry ({steps} kroků) za {wall:.2f} s "
+          f"— {sim.elapsed_time / wall if wall > 0 else 0:.0f}× rychleji než reálný čas")
+    if sim.game_over:
+        print("Hráč zemřel.")
+    print("Seed:", sim.rng.seed)
+    print("Statistiky:", sim.stats)
+
+    if args.record:
+        sim.recorder.save(args.record)
+        print("Záznam uložen:", args.record)
+    if args.profile:
+        profiler.dump_chrome_trace(args.profile + ".json")
+        profiler.dump_csv(args.profile + ".csv")
+        print("Profil uložen:", args.profile + ".json,", args.profile + ".csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+soa.py
+======
+Základ pro kontejnery typu structure-of-arrays (SoA).
+
+Místo seznamu objektů, z nichž každý drží vlastní atributy, drží
+kontejner pro každý atribut jedno souvislé NumPy pole. Aktualizace
+všech entit pak proběhne jednou vektorizovanou operací nad celým polem
+místo jednoho Python volání na entitu.
+
+Potomci deklarují pole ve třídní proměnné FIELDS a starají se
+o vlastní logiku (pohyb, fyzika, ...). ArrayStore řeší jen alokaci
+slotů, růst kapacity a odstraňování mrtvých záznamů. ViewStore k tomu
+přidává seznam objektových pohledů (Enemy, Projectile) nad jednotlivými
+sloty, takže zbytek hry s entitami pracuje jako dřív. Objekty pohledů
+se recyklují přes ObjectPool — po zahřátí spawn nic nealokuje.
+"""
+
+from functools import partial
+
+import numpy as np
+from pool import ObjectPool
+
+
+class ArrayStore:
+    """
+    Kontejner s poli pevné kapacity, která se podle potřeby zdvojnásobí.
+
+    Živé záznamy leží vždy v rozsahu [0, count) — pole se po odstranění
+    záznamů zhušťují, takže vektorizované operace pracují s řezem [:count].
+
+    Attributes:
+        FIELDS (dict): Deklarace polí {název: (tvar_za_indexem, dtype, výchozí)}.
+        capacity (int): Aktuální kapacita všech polí.
+        count (int): Počet obsazených slotů.
+    """
+
+    FIELDS = {}
+
+    def __init__(self, capacity: int = 64):
+        """
+        Args:
+            capacity: Počáteční kapacita polí (počet slotů).
+        """
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        for name, (shape, dtype, default) in self.FIELDS.items():
+            setattr(self, name, np.full((self.capacity,) + shape, default, dtype=dtype))
+
+    def __len__(self) -> int:
+        return self.count
+
+    # =========================================================================
+    # ALOKACE
+    # =========================================================================
+
+    def _grow(self, min_capacity: int) -> None:
+        """Zvětší všechna pole alespoň na min_capacity (zdvojnásobením)."""
+        new_capacity = self.capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+        for name, (shape, dtype, default) in self.FIELDS.items():
+            old = getattr(self, name)
+            new = np.full((new_capacity,) + shape, default, dtype=dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = new_capacity
+
+    def _alloc(self, n: int = 1) -> int:
+        """
+        Obsadí n slotů na konci a vrátí index prvního z nich.
+
+        Sloty se vyplní výchozími hodnotami z FIELDS.
+        """
+        start = self.count
+        if start + n > self.capacity:
+            self._grow(start + n)
+        for name, (shape, dtype, default) in self.FIELDS.items():
+            getattr(self, name)[start:start + n] = default
+        self.count = start + n
+        return start
+
+    # =========================================================================
+    # ODSTRAŇOVÁNÍ
+    # =========================================================================
+
+    def _compact(self, keep: np.ndarray) -> np.ndarray:
+        """
+        Hromadně odstraní záznamy, kde keep == False, se zachováním pořadí.
+
+        Jedna maskovaná kopie na pole místo opakovaného list.remove().
+
+        Args:
+            keep: Bool pole délky count — True = záznam zůstává.
+
+        Returns:
+            np.ndarray: Původní indexy zachovaných záznamů (v novém pořadí).
+        """
+        kept = np.flatnonzero(keep)
+        n = len(kept)
+        if n != self.count:
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[:n] = arr[kept]
+            self.count = n
+        return kept
+
+    def _swap_remove(self, i: int) -> int:
+        """
+        Odstraní záznam i v O(1) přesunutím posledního záznamu na jeho místo.
+
+        Nezachovává pořadí — vhodné pro entity, u nichž na pořadí nezáleží.
+
+        Returns:
+            int: Původní index záznamu, který se přesunul na i
+                 (rovný i, pokud se odstraňoval poslední záznam).
+        """
+        last = self.count - 1
+        if i != last:
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+        self.count = last
+        return last
+
+
+# =============================================================================
+# KONTEJNER S POHLEDY
+# =============================================================================
+def store_field(name: str, doc: str) -> property:
+    """
+    Vytvoří property pohledu, která čte/zapisuje skalár z pole kontejneru.
+
+    Args:
+        name: Název pole v FIELDS kontejneru.
+        doc: Popis atributu (docstring property).
+    """
+    def fget(self):
+        return getattr(self._store, name)[self._index].item()
+
+    def fset(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(fget, fset, doc=doc)
+
+
+class ViewStore(ArrayStore):
+    """
+    ArrayStore, jehož sloty jsou zpřístupněné jako objektové pohledy.
+
+    Pohled je běžný Python objekt s atributy _store a _index. Kontejner
+    se chová jako seznam pohledů (iterace, len, indexování) v pořadí
+    vložení. FIELDS potomka musí obsahovat bool pole 'alive'.
+
+    Odstraněné pohledy se vracejí do view_pool a při dalším spawnu se
+    použijí znovu — reference na odstraněnou entitu proto po remove_dead()
+    nebo clear() nesmí dál sloužit k její identifikaci.
+
+    Attributes:
+        view_class (type): Třída pohledů; nové pohledy vznikají přes
+                           view_class.__new__ bez volání __init__.
+        views (list): Pohledy pro sloty [0, count).
+        view_pool (ObjectPool): Recyklované objekty pohledů.
+    """
+
+    def __init__(self, view_class: type, capacity: int = 64, pool_size: int = 0):
+        """
+        Args:
+            view_class: Třída pohledů (např. Enemy, Projectile).
+            capacity: Počáteční kapacita polí.
+            pool_size: Počet objektů pohledů vytvořených předem.
+        """
+        super().__init__(capacity)
+        self.view_class = view_class
+        self.views = []
+        self.view_pool = ObjectPool(
+            partial(view_class.__new__, view_class), self._release_view,
+            pool_size, name=type(self).__name__
+        )
+
+    def _release_view(self, view) -> None:
+        """Reset hook volaný při vrácení pohledu do poolu (uvolnění referencí)."""
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __getitem__(self, i):
+        return self.views[i]
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    def _attach(self, view, index: int) -> None:
+        """Naváže pohled na slot a zařadí ho na konec seznamu pohledů."""
+        view._store = self
+        view._index = index
+        self.views.append(view)
+
+    def add(self, view):
+        """
+        Přesune existující pohled (např. ze samostatného kontejneru) sem.
+
+        Hodnoty se zkopírují do nového slotu a pohled se přenaváže,
+        takže reference na objekt zůstávají platné.
+
+        Returns:
+            Tentýž pohled.
+        """
+        src, j = view._store, view._index
+        i = self._alloc()
+        for name in self.FIELDS:
+            getattr(self, name)[i] = getattr(src, name)[j]
+        self._attach(view, i)
+        self.view_pool.adopt(view)
+        return view
+
+    def remove_dead(self) -> int:
+        """
+        Hromadně odstraní sloty s alive == False se zachováním pořadí.
+
+        Pohledy odstraněných slotů se vrátí do view_pool.
+
+        Returns:
+            int: Počet odstraněných záznamů.
+        """
+        keep = self.alive[:self.count].copy()
+        if keep.all():
+            return 0
+        views = self.views
+        for i in np.flatnonzero(~keep):
+            self.view_pool.release(views[i])
+        kept = self._compact(keep)
+        self.views = [views[j] for j in kept]
+        for i, view in enumerate(self.views):
+            view._index = i
+        return len(views) - len(kept)
+
+    def clear(self) -> None:
+        """Odstraní všechny záznamy a vrátí jejich pohledy do poolu."""
+        for view in self.views:
+            self.view_pool.release(view)
+        self.count = 0
+        self.views = []
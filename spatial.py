@@ -0,0 +1,122 @@
+"""
+spatial.py
+==========
+Prostorový index (uniformní mřížka / spatial hash) pro broadphase kolizí.
+
+Místo testování každého projektilu proti každému nepříteli (O(P×E))
+se nepřátelé každý snímek rozřadí do buněk pevné velikosti. Dotaz na
+kružnici pak prochází jen buňky, které kružnice (rozšířená o největší
+poloměr vloženého objektu) překrývá.
+
+Mřížka vrací pouze kandidáty — přesný test kolize (vzdálenost středů)
+provádí volající stejně jako v původní brute-force smyčce.
+"""
+
+import pygame
+
+
+class SpatialGrid:
+    """
+    Uniformní mřížka pro rychlé dotazy „kdo je poblíž".
+
+    Každý objekt se vkládá do jediné buňky podle svého středu. Aby dotaz
+    nezapomněl na objekty, jejichž kružnice do oblasti zasahuje ze
+    sousední buňky, rozšíří se oblast dotazu o největší vložený poloměr.
+
+    Výsledky dotazu jsou seřazené podle pořadí vložení — iterace přes
+    kandidáty tak odpovídá pořadí v původním seznamu a výsledky jsou
+    shodné s brute-force průchodem (první zásah vyhrává).
+
+    Attributes:
+        cell_size (float): Velikost hrany jedné buňky (px).
+        cells (dict): Slovník {(cx, cy): [(pořadí, objekt), ...]}.
+        max_radius (float): Největší poloměr vloženého objektu.
+        count (int): Počet vložených objektů od posledního clear().
+    """
+
+    def __init__(self, cell_size: float = 64):
+        """
+        Args:
+            cell_size: Velikost buňky v px. Ideálně zhruba průměr
+                       největšího objektu — menší buňky = více buněk k průchodu,
+                       větší buňky = více kandidátů v každé.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.max_radius = 0.0
+        self.count = 0
+
+    def clear(self) -> None:
+        """Vyprázdní mřížku (volá se před každým přestavěním)."""
+        self.cells.clear()
+        self.max_radius = 0.0
+        self.count = 0
+
+    def insert(self, item, x: float, y: float, radius: float) -> None:
+        """
+        Vloží objekt do buňky odpovídající jeho středu.
+
+        Args:
+            item: Libovolný objekt (typicky Enemy).
+            x, y: Střed objektu (px).
+            radius: Poloměr kolizní kružnice objektu (px).
+        """
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            bucket = self.cells[key] = []
+        bucket.append((self.count, item))
+        self.count += 1
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def rebuild(self, items, positions=None) -> None:
+        """
+        Přestaví mřížku z aktuálních pozic objektů.
+
+        Args:
+            items: Iterovatelná kolekce objektů s atributy pos a radius.
+            positions: Volitelně předpočítané pozice [(x, y), ...] ve stejném
+                       pořadí jako items — ušetří čtení item.pos po jednom.
+        """
+        self.clear()
+        if positions is None:
+            for item in items:
+                self.insert(item, item.pos.x, item.pos.y, item.radius)
+        else:
+            for item, (x, y) in zip(items, positions):
+                self.insert(item, x, y, item.radius)
+
+    def query(self, pos: pygame.Vector2, radius: float) -> list:
+        """
+        Vrátí kandidáty, jejichž kružnice může zasahovat do zadané kružnice.
+
+        Args:
+            pos: Střed dotazované kružnice.
+            radius: Poloměr dotazované kružnice (px).
+
+        Returns:
+            list: Objekty seřazené podle pořadí vložení.
+        """
+        if not self.cells:
+            return []
+
+        reach = radius + self.max_radius
+        cs = self.cell_size
+        x0 = int((pos.x - reach) // cs)
+        x1 = int((pos.x + reach) // cs)
+        y0 = int((pos.y - reach) // cs)
+        y1 = int((pos.y + reach) // cs)
+
+        found = []
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+
+        # Seřazení dle pořadí vložení — zachová pořadí původního seznamu.
+        # Pořadová čísla jsou unikátní, takže se objekty samotné nikdy neporovnávají.
+        found.sort()
+        return [item for _, item in found]
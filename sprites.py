@@ -0,0 +1,283 @@
+"""
+sprites.py
+==========
+Cache předkreslených spritů nepřátel, hráče, stop projektilů a částic.
+
+Enemy.draw() a Player.draw() dřív každý snímek pro každou entitu
+vytvořily nový SRCALPHA povrch záře a zavolaly 6–7× pygame.draw.circle;
+během bliknutí po zásahu navíc znovu počítaly barvy. Vzhled entity
+ale závisí jen na poloměru, úrovni bliknutí a fázi pulzování jádra.
+SpriteCache proto každou kombinaci vykreslí jednou a kreslení entity
+je pak jediný blit.
+
+Plynulé hodnoty se kvantují:
+  - bliknutí (hurt_timer / flash_time) na FLASH_LEVELS úrovní,
+  - fáze pulzování jádra na PULSE_LEVELS kroků za periodu,
+  - průhlednost kruhů stopy projektilů a částic na ALPHA_LEVELS úrovní.
+"""
+
+import math
+
+import pygame
+from visuals import Colors
+
+
+FLASH_LEVELS = 8    # Úrovně bliknutí po zásahu (0 = bez bliknutí, max = bílá)
+PULSE_LEVELS = 16   # Kroky fáze pulzování jádra za jednu periodu (2π)
+ALPHA_LEVELS = 32   # Úrovně průhlednosti kruhů stopy projektilů a částic
+
+
+def flash_level(t: float) -> int:
+    """Převede intenzitu bliknutí 0–1 na úroveň 0..FLASH_LEVELS-1."""
+    t = max(0.0, min(1.0, t))
+    return int(round(t * (FLASH_LEVELS - 1)))
+
+
+def alpha_level(alpha: float) -> int:
+    """Převede průhlednost 0–255 na úroveň 0..ALPHA_LEVELS-1."""
+    return int(round(alpha * (ALPHA_LEVELS - 1) / 255))
+
+
+def level_alpha(level: int) -> int:
+    """Vrátí průhlednost 0–255 reprezentující úroveň z alpha_level()."""
+    return int(round(level * 255 / (ALPHA_LEVELS - 1)))
+
+
+def scaled_radius(r: float, scale: float) -> int:
+    """Vrátí poloměr spritu pro vnitřní měřítko vykreslování (alespoň 1 px)."""
+    return max(1, int(round(r * scale)))
+
+
+def pulse_level(phase: float) -> int:
+    """Převede fázi pulzování (rad) na krok 0..PULSE_LEVELS-1."""
+    return int(phase * PULSE_LEVELS / (2 * math.pi)) % PULSE_LEVELS
+
+
+# =============================================================================
+# KRESLENÍ SPRITŮ
+# =============================================================================
+def _new_sprite(r: int) -> tuple:
+    """Vytvoří průhledný povrch pro entitu poloměru r (včetně záře)."""
+    glow_radius = r + 4
+    surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+    return surf, (glow_radius, glow_radius)
+
+
+def render_enemy(r: int, flash: int, pulse: int, glow: bool = True) -> pygame.Surface:
+    """
+    Vykreslí nepřítele jako stylizovaný energetický kruh s červenou tématikou.
+
+    Args:
+        r: Poloměr nepřítele (px).
+        flash: Úroveň bliknutí — barva se interpoluje od Colors.ENEMY k bílé.
+        pulse: Krok fáze pulzování jádra.
+        glow: False = bez vnější záře (nižší kvalita, viz quality.py).
+    """
+    surf, center = _new_sprite(r)
+
+    t = flash / (FLASH_LEVELS - 1)
+    base_color = Colors.ENEMY
+    flash_col = (
+        int(base_color[0] + (255 - base_color[0]) * t),
+        int(base_color[1] + (255 - base_color[1]) * t),
+        int(base_color[2] + (255 - base_color[2]) * t),
+    )
+
+    # 1. Vnější záře (jemně průhledná)
+    if glow:
+        pygame.draw.circle(surf, (*flash_col, 50), center, r + 4)
+
+    # 2. Hlavní tělo (tmavší varianta aktuální barvy)
+    dark_body = (
+        max(flash_col[0] - 50, 20),
+        max(flash_col[1] - 50, 20),
+        max(flash_col[2] - 50, 20)
+    )
+    pygame.draw.circle(surf, dark_body, center, r)
+
+    # 3. Vnitřní prstenec (světlejší okraj)
+    ring_color = (
+        min(flash_col[0] + 40, 255),
+        min(flash_col[1] + 40, 255),
+        min(flash_col[2] + 40, 255)
+    )
+    pygame.draw.circle(surf, ring_color, center, r - 3, 3)
+
+    # 4. Pulzující jádro (při blikání bílé)
+    phase = pulse * 2 * math.pi / PULSE_LEVELS
+    core_radius = int(r * (0.5 + 0.2 * (1 + math.sin(phase)) / 2))
+    pygame.draw.circle(surf, flash_col, center, core_radius)
+
+    # 5. Odlesk (malý bílý bod)
+    _draw_highlight(surf, center, r)
+
+    # 6. Obrys pro kontrast
+    pygame.draw.circle(surf, ring_color, center, r, width=1)
+    return surf
+
+
+def render_player(r: int, pulse: int, glow: bool = True) -> pygame.Surface:
+    """
+    Vykreslí hráče jako energetický kruh s vnitřním prstencem a pulzujícím jádrem.
+
+    Args:
+        r: Poloměr hráče (px).
+        pulse: Krok fáze pulzování jádra.
+        glow: False = bez vnější záře (nižší kvalita, viz quality.py).
+    """
+    surf, center = _new_sprite(r)
+
+    # 1. Vnější záře – světle modrá s nízkou alfa
+    if glow:
+        pygame.draw.circle(surf, (100, 150, 255, 50), center, r + 4)
+
+    # 2. Hlavní tělo – tmavě modrá
+    pygame.draw.circle(surf, (30, 40, 80), center, r)
+
+    # 3. Vnitřní prstenec – světle modrá
+    pygame.draw.circle(surf, (80, 180, 255), center, r - 3, 3)
+
+    # 4. Pulzující jádro – velikost se mění sinusově mezi 0.6 a 0.8 poloměru
+    phase = pulse * 2 * math.pi / PULSE_LEVELS
+    core_radius = int(r * (0.6 + 0.2 * (1 + math.sin(phase)) / 2))
+    pygame.draw.circle(surf, (200, 220, 255), center, core_radius)
+
+    # 5. Odlesk
+    _draw_highlight(surf, center, r)
+
+    # 6. Obrys pro kontrast
+    pygame.draw.circle(surf, (200, 200, 255), center, r, width=1)
+    return surf
+
+
+def render_trail_dot(color: tuple, size: int, alpha: int) -> pygame.Surface:
+    """Vykreslí průhledný kruh stopy projektilu o poloměru size."""
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, alpha), (size, size), size)
+    return surf
+
+
+def render_particle(color: tuple, r: int, alpha: int, additive: bool = False) -> pygame.Surface:
+    """
+    Vykreslí kruh částice o poloměru r.
+
+    Args:
+        color: RGB barva částice.
+        r: Poloměr (px).
+        alpha: Průhlednost 0–255.
+        additive: True = neprůhledný povrch s barvou přednásobenou alpha
+                  na černém pozadí, určený pro blit s BLEND_RGB_ADD.
+    """
+    if additive:
+        surf = pygame.Surface((r * 2, r * 2))
+        pygame.draw.circle(surf, tuple(c * alpha // 255 for c in color), (r, r), r)
+        return surf
+    surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, alpha), (r, r), r)
+    return surf
+
+
+def _draw_highlight(surf: pygame.Surface, center: tuple, r: int) -> None:
+    """Nakreslí malý bílý odlesk vlevo nahoře od středu."""
+    highlight_radius = max(1, r // 6)
+    highlight_offset = r // 3
+    pygame.draw.circle(
+        surf, (255, 255, 255),
+        (center[0] - highlight_offset, center[1] - highlight_offset),
+        highlight_radius
+    )
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+class SpriteCache:
+    """
+    Cache předkreslených spritů podle druhu a kvantovaných parametrů
+    (poloměr, bliknutí, pulz; u stopy a částic barva, velikost a průhlednost).
+
+    Attributes:
+        sprites (dict): Slovník {klíč: pygame.Surface}.
+        glow (bool): True = sprity nepřátel a hráče mají vnější záři
+                     (vypíná ji regulátor kvality, viz quality.py).
+        hits (int): Počet vrácení již vykresleného spritu.
+        misses (int): Počet nově vykreslených spritů.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+        self.glow = True
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, key: tuple, surf: pygame.Surface) -> pygame.Surface:
+        # Převod do formátu displeje zrychlí blit; bez okna (simulace) se přeskočí
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+        self.sprites[key] = surf
+        self.misses += 1
+        return surf
+
+    def enemy(self, r: int, flash: int, pulse: int) -> pygame.Surface:
+        """Vrátí sprite nepřítele pro danou úroveň bliknutí a krok pulzu."""
+        key = ("enemy", r, flash, pulse, self.glow)
+        surf = self.sprites.get(key)
+        if surf is None:
+            return self._store(key, render_enemy(r, flash, pulse, self.glow))
+        self.hits += 1
+        return surf
+
+    def player(self, r: int, pulse: int) -> pygame.Surface:
+        """Vrátí sprite hráče pro daný krok pulzu."""
+        key = ("player", r, pulse, self.glow)
+        surf = self.sprites.get(key)
+        if surf is None:
+            return self._store(key, render_player(r, pulse, self.glow))
+        self.hits += 1
+        return surf
+
+    def trail_dot(self, color: tuple, size: int, alpha: int) -> pygame.Surface:
+        """Vrátí kruh stopy pro barvu, velikost a průhlednost (zaokrouhlenou na úroveň)."""
+        level = alpha_level(alpha)
+        key = ("trail", color, size, level)
+        surf = self.sprites.get(key)
+        if surf is None:
+            return self._store(key, render_trail_dot(color, size, level_alpha(level)))
+        self.hits += 1
+        return surf
+
+    def particle(self, color: tuple, r: int, level: int, additive: bool = False) -> pygame.Surface:
+        """Vrátí kruh částice pro barvu, poloměr a úroveň průhlednosti (alpha_level)."""
+        key = ("particle", color, r, level, additive)
+        surf = self.sprites.get(key)
+        if surf is None:
+            return self._store(key, render_particle(color, r, level_alpha(level), additive))
+        self.hits += 1
+        return surf
+
+    def warm(self, enemy_radius: int, player_radius: int) -> None:
+        """Předkreslí všechny úrovně pro dané poloměry a aktuální glow (bez záseků ve hře)."""
+        for pulse in range(PULSE_LEVELS):
+            self.player(player_radius, pulse)
+            for flash in range(FLASH_LEVELS):
+                self.enemy(enemy_radius, flash, pulse)
+
+    def stats(self) -> dict:
+        """
+        Vrátí velikost cache.
+
+        Returns:
+            dict: Klíče 'sprites', 'bytes' (paměť pixelů), 'hits', 'misses'.
+        """
+        size = sum(s.get_width() * s.get_height() * s.get_bytesize()
+                   for s in self.sprites.values())
+        return {
+            "sprites": len(self.sprites),
+            "bytes":   size,
+            "hits":    self.hits,
+            "misses":  self.misses,
+        }
+
+
+# Globální cache — sdílí ji všichni nepřátelé i hráč
+sprite_cache = SpriteCache()
@@ -53,10 +53,30 @@ class BaseState:
     Implementuje prázdné verze všech metod — potomci přepíší
     jen ty metody, které potřebují.
 
+    render() vrací seznam obdélníků, do kterých kreslil — Compositor
+    (compositor.py) podle nich posílá na displej jen změněné oblasti.
+    None (výchozí) znamená, že stav obdélníky neurčuje a snímek se
+    překreslí celý.
+
     Attributes:
         manager: Reference na StateManager pro přechody mezi stavy.
+        opaque (bool): True = render() pokryje celou obrazovku; pod stavem
+            se nic nekreslí a sdílené vrstvy se ani neaktualizují.
+        background_color (tuple | None): None = stav se kreslí přes sdílené
+            vesmírné pozadí; RGB = stav má vlastní jednobarevné pozadí
+            přes celou obrazovku (vyplní ho Compositor).
+        backdrop_layers (tuple): Sdílené animované vrstvy pod stavem
+            ("meteors", "stars"); ostatní Compositor přeskočí.
+        pacing (str): Limit FPS stavu (pacing.py) — "menu" = MenuConfig.MENU_FPS
+            (bez backdrop_layers po nečinnosti PACING_IDLE_FPS),
+            "game" = GameConfig.FPS.
     """
 
+    opaque = False
+    background_color = None
+    backdrop_layers = ("meteors", "stars")
+    pacing = "menu"
+
     def __init__(self, manager):
         self.manager = manager
 
@@ -64,7 +84,11 @@ class BaseState:
     def exit(self):                pass
     def handle_event(self, event): pass
     def update(self, dt):          pass
-    def render(self, surface):     pass
+    def render(self, surface):     return None
+
+    def entity_counts(self) -> dict:
+        """Počty entit pro profiler (profiler.COUNT_FIELDS) — stavy bez entit vrací {}."""
+        return {}
 
 
 # =============================================================================
@@ -107,15 +131,18 @@ class ButtonMenuState(BaseState):
         for b in self.buttons:
             b.update(dt, pos)
 
-    def render(self, surface: pygame.Surface):
+    def render(self, surface: pygame.Surface) -> list:
         """Vykreslí titulek stavu a všechna tlačítka.
         
         Rozměry se čtou dynamicky — respektuje rozlišení z config.json.
+
+        Returns:
+            list: Obdélníky titulku a tlačítek.
         """
         # Rozměry se čtou dynamicky — respektuje rozlišení z config.json
         width, height = pygame.display.get_surface().get_size()
-        title_font    = font_cache.get(72)
-        title_surface = title_font.render(self.title, True, (255, 255, 255))
-        surface.blit(title_surface, title_surface.get_rect(center=(width // 2, height // 4)))
+        title_surface = font_cache.render(self.title, 72, (255, 255, 255))
+        rects = [surface.blit(title_surface, title_surface.get_rect(center=(width // 2, height // 4)))]
         for b in self.buttons:
-            b.render(surface)
\ No newline at end of file
+            rects.append(b.render(surface))
+        return rects
\ No newline at end of file
@@ -3,71 +3,97 @@ states_game.py
 ==============
 Herní stav — PlayingState.
 
-Obsahuje veškerou herní logiku: pohyb hráče, spawn nepřátel,
-detekci kolizí, aplikaci efektů projektilů, sledování statistik
-a jejich odeslání na Flask server po skončení hry.
+Propojuje herní simulaci (simulation.py — pohyb hráče, spawn nepřátel,
+kolize, efekty projektilů, statistiky) s oknem: předává jí vstup a čas
+snímku, vykresluje scénu a HUD a po skončení hry odesílá statistiky
+na Flask server.
 
 Menu stavy jsou odděleny v states_menu.py.
 Sdílené základní třídy jsou v states.py.
 """
 
+import os
+import time
+
 import pygame
 import requests
 import json
 from threading import Thread
 
 from config import GameConfig, AppConfig
-from visuals import Colors
 from states import BaseState, GameState
-from player import Player
 from render import Renderer, RenderState
-from utils import HelperFunctions
-from settings import JSON_SAVE
+from simulation import Simulation, PygameInput
+from replay import ReplayRecorder
+from profiler import profiler, FrameTimeRing
+from sprites import sprite_cache, scaled_radius
+from quality import quality
+from settings import JSON_SAVE, REPLAY_DIR
 
 
 class PlayingState(BaseState):
     """
-    Hlavní herní stav — obsahuje celou herní logiku.
-
-    Zodpovídá za:
-      - Inicializaci herních objektů (hráč, nepřátelé, projektily, částice).
-      - Zpracování vstupu (pohyb, střelba).
-      - Fyzikální simulaci a detekci kolizí.
-      - Spawn nepřátel a aplikaci efektů projektilů.
-      - Sledování statistik a jejich odeslání po skončení hry.
+    Hlavní herní stav — propojuje simulaci s oknem.
+
+    Herní logika (pohyb, spawn, kolize, efekty, statistiky) je
+    v Simulation (simulation.py). PlayingState:
+      - předává simulaci vstup z okna (PygameInput) a čas snímku,
+      - vykresluje scénu a HUD,
+      - řeší klávesy mimo hru (ESC, F1, R) a odeslání statistik.
+
+    Měřítko vykreslování (GameConfig.RENDER_SCALE): při hodnotě < 1 se
+    herní scéna (pozadí, částice, projektily, nepřátelé, hráč) skládá do
+    menšího povrchu frame a na okno se jednou za snímek roztáhne; HUD,
+    texty poškození a overlay se kreslí až potom v plném rozlišení.
+    Simulace i myš zůstávají v souřadnicích okna — entity se jen kreslí
+    s pozicemi a poloměry vynásobenými měřítkem a roztažení je vrátí
+    zpět, takže pozice z pygame.mouse.get_pos() odpovídají scéně bez
+    přepočtu.
 
     Attributes:
-        player (Player): Instance hráče.
-        enemies (list): Aktivní nepřátelé.
-        projectiles (list): Aktivní projektily.
-        particles (list): Aktivní částice efektů.
-        damage_texts (list): Aktivní plovoucí texty poškození.
-        stats (dict): Statistiky aktuální hry.
+        sim (Simulation): Herní simulace (hráč, nepřátelé, projektily, statistiky).
+        input (PygameInput): Zdroj vstupu simulace — sbírá kliknutí z událostí.
         renderer (Renderer): Vykresluje HUD.
-        elapsed_time (float): Uplynulý čas hry v sekundách.
-        start_time (int): Pygame timestamp začátku hry (ms).
         last_dt (float): DT z posledního update() — pro render().
-        game_over (bool): True = hráč zemřel, zobrazuje se Game Over overlay.
         show_fps (bool): True = zobrazuje se FPS čítač (přepínáno klávesou F1).
-        fps_history (list): Historie FPS hodnot pro draw_fps_counter().
+        frame_times (FrameTimeRing): Kruhový buffer délek snímků pro F1 panel.
         current_fps (float): Aktuální FPS vypočítané z dt.
+        start_ticks (int): pygame.time.get_ticks() při vstupu do hry (ms).
+        time_played (float): Reálný čas od vstupu do hry po odchod (s) —
+                             včetně Game Over obrazovky, jako dřív; herní
+                             čas simulace je sim.elapsed_time.
+        render_scale (float): Aktuální měřítko vnitřního rozlišení scény.
+        frame (pygame.Surface | None): Povrch scény ve vnitřním rozlišení
+                                       (None = kreslí se přímo do okna).
     """
 
+    # Neprůhledný obrázek pozadí pokryje celé okno — vesmírné pozadí menu,
+    # meteory ani hvězdy se během hry neaktualizují ani nekreslí
+    opaque = True
+    backdrop_layers = ()
+    pacing = "game"     # Plný limit GameConfig.FPS, bez přechodu do nečinnosti
+
     def __init__(self, manager):
         super().__init__(manager)
         self.base_url = AppConfig.SERVER_URL
 
-        self.elapsed_time = 0.0
         self.last_dt = 1 / 60
-        self.game_over = False
         self.show_fps = False
-        self.fps_history = []
+        self.frame_times = FrameTimeRing(GameConfig.FRAME_HISTORY)
+        self._skip_frame = True     # První snímek po vstupu obsahuje přechod z menu
         self.current_fps = 0.0
+        self.start_ticks = 0
+        self.time_played = 0.0
+
+        # Simulace žije po celou dobu běhu aplikace — enter() ji jen resetuje,
+        # takže pooly entit zůstanou zahřáté i mezi jednotlivými hrami
+        self.input = PygameInput()
+        self.sim = Simulation(input_source=self.input)
 
         # Načtení obrázku pozadí — provede se jednou při inicializaci
         try:
             from settings import BACKGROUND
-            self.background_image = pygame.image.load(BACKGROUND).convert_alpha()
+            self.background_image = pygame.image.load(BACKGROUND).convert()
             self.background_image = pygame.transform.scale(
                 self.background_image, (GameConfig.WIDTH, GameConfig.HEIGHT)
             )
@@ -75,36 +101,94 @@ class PlayingState(BaseState):
             self.background_image = pygame.Surface((GameConfig.WIDTH, GameConfig.HEIGHT))
             self.background_image.fill((50, 50, 80))
 
+        # Renderer (fonty a atlas znaků) vzniká jednou — enter() jen resetuje HUD
+        self.renderer = Renderer(self.manager.screen)
+
+        self.render_scale = None
+        self.frame = None
+        self.set_render_scale(GameConfig.RENDER_SCALE)
+
+    def set_render_scale(self, scale: float) -> None:
+        """
+        Nastaví měřítko vnitřního rozlišení herní scény.
+
+        Args:
+            scale: Poměr vnitřního rozlišení k oknu (0.25–1.0); 1.0 = scéna
+                   se kreslí přímo do okna bez mezikroku.
+        """
+        scale = max(0.25, min(1.0, float(scale)))
+        if scale != self.render_scale:
+            self.render_scale = scale
+            if scale == 1.0:
+                self.frame = None
+                self._frame_background = self.background_image
+            else:
+                size = (round(GameConfig.WIDTH * scale), round(GameConfig.HEIGHT * scale))
+                self.frame = pygame.Surface(size).convert()
+                self._frame_background = pygame.transform.smoothscale(self.background_image, size)
+
+        # Předkreslení všech úrovní bliknutí a pulzu pro poloměry v daném
+        # měřítku (i při stejném měřítku — mohla se změnit záře sprite_cache)
+        sprite_cache.warm(scaled_radius(GameConfig.ENEMY_RADIUS, scale),
+                          scaled_radius(GameConfig.PLAYER_RADIUS, scale))
+
+    # ── Regulátor kvality ─────────────────────────────────────────────────────
+
+    def apply_quality(self) -> None:
+        """
+        Promítne aktuální úroveň regulátoru kvality (quality.py) do efektů.
+
+        Mění jen vizuální stránku (počet částic v burstu, délku vykreslené
+        stopy, záři, slučování textů poškození a měřítko scény) — průběh
+        simulace zůstává stejný.
+        """
+        level = quality.settings
+        sim = self.sim
+        sim.particles.burst_scale = level["particles"]
+        sim.projectiles.trail_draw = max(1, round(sim.projectiles.TRAIL * level["trail"]))
+        sim.coalesce_texts = level["coalesce"]
+        sprite_cache.glow = level["glow"]
+        self.set_render_scale(min(GameConfig.RENDER_SCALE, level["render_scale"]))
+
+    def report_frame_time(self, work_ms: float, dt: float) -> None:
+        """
+        Předá regulátoru kvality práci snímku; při změně úrovně ji použije.
+
+        Args:
+            work_ms: Čas práce snímku bez čekání na limit FPS (ms).
+            dt: Délka snímku (s).
+        """
+        if quality.push(work_ms, dt):
+            self.apply_quality()
+
+    @property
+    def stats(self) -> dict:
+        """Statistiky aktuální hry (ze simulace)."""
+        return self.sim.stats
+
+    @property
+    def game_over(self) -> bool:
+        """True = hráč zemřel, zobrazuje se Game Over overlay."""
+        return self.sim.game_over
+
     def enter(self, payload=None):
         """
-        Inicializuje/resetuje všechny herní objekty při vstupu do hry.
+        Resetuje simulaci při vstupu do hry.
 
         Volá se pokaždé při přechodu z menu — zajišťuje čistý stav.
         """
-        self.start_time = pygame.time.get_ticks()
-        self.elapsed_time = 0.0
-        self.game_over = False
-        self.fps_history = []
+        quality.reset()
+        self.apply_quality()
+        self.frame_times.clear()
+        self._skip_frame = True
         self.current_fps = 0.0
-
-        self.player       = Player()
-        self.enemies      = []
-        self.projectiles  = []
-        self.particles    = []
-        self.damage_texts = []
-
-        self.last_projectile_time  = 0
-        self.last_enemy_spawn_time = pygame.time.get_ticks()
-        self.last_player_hit_time  = 0
-
-        self.stats = {
-            "enemies_killed":    0,
-            "player_collisions": 0,
-            "projectiles_fired": 0,
-            "projectiles_hit":   0,
-        }
-
-        self.renderer = Renderer(self.manager.screen)
+        self.input.clicks = 0
+        self.start_ticks = pygame.time.get_ticks()
+        self.time_played = 0.0
+        self.sim.reset()
+        if GameConfig.RECORD_REPLAYS:
+            self.sim.recorder = ReplayRecorder(self.sim)
+        self.renderer.reset()
 
     def exit(self):
         """
@@ -113,7 +197,11 @@ class PlayingState(BaseState):
         Odesílání na server běží v samostatném vlákně, aby neblokoval
         přechod zpět do menu. Do JSON se ukládá pouze při selhání serveru,
         aby nedocházelo k duplicitám při pozdějším importu.
+        Při zapnutém nahrávání se uloží i záznam hry.
         """
+        self.time_played = (pygame.time.get_ticks() - self.start_ticks) / 1000.0
+        if self.sim.recorder is not None:
+            self.save_replay()
         Thread(target=self._send_and_backup, daemon=True).start()
 
     def _send_and_backup(self):
@@ -129,7 +217,8 @@ class PlayingState(BaseState):
         ESC → návrat do menu.
         R (po Game Over) → návrat do menu.
         F1 → přepnutí FPS čítače.
-        Levé tlačítko myši → výstřel (pouze pokud hra běží).
+        Levé tlačítko myši → výstřel v nejbližším kroku simulace
+        (pouze pokud hra běží).
         """
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -148,189 +237,91 @@ class PlayingState(BaseState):
 
         # Střelba je blokována po Game Over
         if not self.game_over:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                current_time = pygame.time.get_ticks()
-                if current_time - self.last_projectile_time >= GameConfig.PROJECTILE_DELAY:
-                    proj = HelperFunctions.spawn_projectile_instance(
-                        self.player.pos, current_time
-                    )
-                    self.projectiles.append(proj)
-                    self.last_projectile_time = current_time
-                    self.stats["projectiles_fired"] += 1
+            self.input.handle_event(event)
 
     def update(self, dt: float):
         """
-        Hlavní herní logika — volá se každý snímek.
-
-        Pořadí:
-          1. Pohyb a aktualizace hráče.
-          2. Kontrola smrti hráče — přechod do Game Over stavu.
-          3. Spawn nepřátel (časovač).
-          4. Kolize hráč ↔ nepřátelé.
-          5. Aktualizace nepřátel, odstranění mrtvých.
-          6. Aktualizace projektilů, kolize s nepřáteli, aplikace efektů.
-          7. Aktualizace částic a textů poškození.
+        Posune simulaci o čas snímku — volá se každý snímek.
+
+        Pevný krok, dohánění i interpolační faktor řeší Simulation.advance().
         """
         self.last_dt = dt
         self.current_fps = 1.0 / dt if dt > 0 else 0.0
-
-        # Pokud je hra ve stavu Game Over, dál se neaktualizuje herní logika
-        if self.game_over:
-            return
-
-        current_time = pygame.time.get_ticks()
-        self.elapsed_time = (current_time - self.start_time) / 1000.0
-
-        # ── Hráč ──────────────────────────────────────────────────────────
-        keys = pygame.key.get_pressed()
-        self.player.move(dt, keys)
-        self.player.fly(dt, keys)
-        self.player.update(dt)
-        self.player.enforce_boundaries()
-
-        # Místo okamžitého přechodu do menu se zobrazí Game Over overlay
-        if self.player.health <= 0:
-            self.player.health = 0   # Zabrání záporným hodnotám v HUD
-            self.game_over = True
-            return
-
-        # ── Spawn nepřátel ────────────────────────────────────────────────
-        if current_time - self.last_enemy_spawn_time >= GameConfig.ENEMY_SPAWN_INTERVAL:
-            self.enemies.append(HelperFunctions.spawn_enemy_improved())
-            self.last_enemy_spawn_time = current_time
-
-        # ── Kolize hráč ↔ nepřítel (cooldown 500 ms) ─────────────────────
-        for enemy in self.enemies:
-            dist = (self.player.pos - enemy.pos).length()
-            if dist < (self.player.radius + enemy.radius):
-                if current_time - self.last_player_hit_time > 500:
-                    direction = self.player.pos - enemy.pos
-                    self.player.take_damage(15, direction)
-                    self.stats["player_collisions"] += 1
-                    self.last_player_hit_time = current_time
-
-        # ── Aktualizace nepřátel ──────────────────────────────────────────
-        for enemy in self.enemies[:]:
-            enemy.update(dt, self.player.pos)
-            if not enemy.is_alive:
-                self.particles.extend(
-                    HelperFunctions.spawn_hit_particles(
-                        enemy.pos, Colors.DEATH_PARTICLES,
-                        count=20, speed=400, lifetime=0.7
-                    )
-                )
-                self.enemies.remove(enemy)
-                self.stats["enemies_killed"] += 1
-
-        # ── Aktualizace projektilů ────────────────────────────────────────
-        for proj in self.projectiles[:]:
-            proj.update(dt)
-
-            if not proj.is_alive:
-                self.projectiles.remove(proj)
-                continue
-
-            for enemy in self.enemies:
-                if HelperFunctions.check_collision(
-                    proj.pos, enemy.pos, proj.radius, enemy.radius
-                ):
-                    first_hit = False
-                    if proj.effect_type == "pierce":
-                        if enemy in proj.hit_targets:
-                            continue
-                        if len(proj.hit_targets) == 0:
-                            first_hit = True
-                        proj.hit_targets.append(enemy)
-                    else:
-                        proj.is_alive = False
-                        first_hit = True
-
-                    enemy.take_damage(proj.damage)
-
-                    if first_hit:
-                        self.stats["projectiles_hit"] += 1
-
-                    self.particles.extend(
-                        HelperFunctions.spawn_hit_particles(
-                            enemy.pos, Colors.HIT_PARTICLES,
-                            count=10, speed=220, lifetime=0.4
-                        )
-                    )
-                    self.damage_texts.append(
-                        HelperFunctions.spawn_damage_text(
-                            enemy.pos - pygame.Vector2(0, enemy.radius + 10),
-                            proj.damage
-                        )
-                    )
-
-                    # Speciální efekty dle typu projektilu
-                    if proj.effect_type == "explosive":
-                        for e in self.enemies:
-                            if e is not enemy and e.pos.distance_to(enemy.pos) <= 50:
-                                e.take_damage(proj.damage // 2)
-                    elif proj.effect_type == "slow":
-                        enemy.apply_slow(GameConfig.SLOW_DURATION, GameConfig.SLOW_FACTOR)
-                    elif proj.effect_type == "dot":
-                        enemy.apply_dot(
-                            GameConfig.DOT_DURATION,
-                            proj.damage * GameConfig.DOT_DAMAGE_FACTOR
-                        )
-                    elif proj.effect_type == "heal":
-                        self.player.heal(GameConfig.HIT_HEAL)
-
-                    break
-
-        # ── Aktualizace částic ────────────────────────────────────────────
-        for p in self.particles[:]:
-            p["life"] -= dt
-            if p["life"] <= 0:
-                self.particles.remove(p)
-            else:
-                p["pos"] += p["vel"] * dt
-                p["vel"] *= 1 - 3 * dt
-
-        # ── Aktualizace textů poškození ───────────────────────────────────
-        for t in self.damage_texts[:]:
-            t["life"] -= dt
-            if t["life"] <= 0:
-                self.damage_texts.remove(t)
-            else:
-                t["pos"] += t["vel"] * dt
-                t["vel"] *= 1 - 1.5 * dt
+        if self._skip_frame:
+            self._skip_frame = False    # Dlouhý snímek přechodu nepatří do statistik
+        else:
+            self.frame_times.push(dt)
+        self.sim.advance(dt)
 
     def render(self, surface: pygame.Surface):
         """
         Vykreslí celou herní scénu (painter's algorithm).
 
-        Pořadí vrstev: pozadí → dash stopa → částice → texty →
-        projektily → nepřátelé → hráč → HUD → FPS → overlay.
+        Pořadí vrstev: pozadí → dash stopa → částice → projektily →
+        nepřátelé → hráč → (roztažení scény na okno) → texty → HUD →
+        FPS → overlay.
         """
-        surface.blit(self.background_image, (0, 0))
-
-        self.player.draw_dash_trail(surface)
-        self.renderer.draw_particles(self.particles)
-        self.renderer.draw_damage_texts(self.damage_texts)
-
-        for proj in self.projectiles:
-            proj.draw(surface)
-
-        for enemy in self.enemies:
-            enemy.draw(surface)
-
-        self.player.draw(surface)
+        sim = self.sim
+        prof = profiler
+        if prof.enabled:
+            prof.mark()
+
+        # Scéna se kreslí do frame ve vnitřním rozlišení, nebo přímo do okna
+        scale = self.render_scale
+        target = surface if self.frame is None else self.frame
+
+        target.blit(self._frame_background, (0, 0))
+        sim.player.draw_dash_trail(target, scale)
+        if prof.enabled:
+            prof.lap("render.background")
+
+        self.renderer.draw_particles(sim.particles, surface=target, scale=scale)
+        if prof.enabled:
+            prof.lap("render.particles")
+
+        # Entity se vykreslí v interpolované pozici mezi dvěma kroky simulace
+        alpha = sim.alpha
+        sim.projectiles.draw(target, alpha, scale)
+        if prof.enabled:
+            prof.lap("render.projectiles")
+
+        for enemy in sim.enemies:
+            enemy.draw(target, alpha, scale)
+        if prof.enabled:
+            prof.lap("render.enemies")
+
+        sim.player.draw(target, alpha, scale)
+        if prof.enabled:
+            prof.lap("render.player")
+
+        if self.frame is not None:
+            pygame.transform.scale(self.frame, surface.get_size(), surface)
+            if prof.enabled:
+                prof.lap("render.upscale")
+
+        # Texty poškození v plném rozlišení (čitelné i při zmenšené scéně)
+        self.renderer.draw_damage_texts(sim.damage_texts)
+        if prof.enabled:
+            prof.lap("render.texts")
 
         dt_ui = self.last_dt
-        self.renderer.draw_health_bar(self.player, dt_ui)
-        self.renderer.draw_stamina_bar(self.player, dt_ui)
-        self.renderer.draw_dash_cooldown(self.player, pygame.time.get_ticks())
-        self.renderer.draw_game_stats(self.stats, self.elapsed_time)
+        self.renderer.draw_hud(sim.player, sim.stats, sim.elapsed_time, dt_ui)
+        self.renderer.draw_dash_cooldown(sim.player, sim.clock.get_ticks())
 
         # FPS čítač — přepínatelný klávesou F1
-        self.renderer.draw_fps_counter(self.current_fps, self.show_fps, self.fps_history)
+        self.renderer.draw_fps_counter(
+            self.current_fps, self.show_fps, self.frame_times, sim.entity_counts()
+        )
 
         # Game Over overlay — zobrazí se po smrti hráče
-        if self.game_over:
+        if sim.game_over:
             self.renderer.draw_game_overlay(RenderState.GAME_OVER)
+        if prof.enabled:
+            prof.lap("render.hud")
+
+    def entity_counts(self) -> dict:
+        """Počty entit aktuální hry (pro profiler)."""
+        return self.sim.entity_counts()
 
     # ── Ukládání statistik ────────────────────────────────────────────────────
 
@@ -350,7 +341,7 @@ class PlayingState(BaseState):
         if not user_id:
             return False
 
-        elapsed = (pygame.time.get_ticks() - self.start_time) / 1000.0
+        elapsed = self.time_played
 
         data = {
             "user_id":           user_id,
@@ -373,6 +364,16 @@ class PlayingState(BaseState):
             print(f"Chyba připojení k serveru: {e}")
             return False
 
+    def save_replay(self):
+        """Uloží záznam hry do REPLAY_DIR (název podle data a času)."""
+        path = os.path.join(REPLAY_DIR, time.strftime("replay_%Y%m%d_%H%M%S.bsr"))
+        try:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            self.sim.recorder.save(path)
+            print("Záznam hry uložen:", path)
+        except Exception as e:
+            print("Chyba při ukládání záznamu:", e)
+
     def save_stats_to_json(self):
         """
         Záložní uložení statistik do game_stats.json (append mód).
@@ -381,7 +382,7 @@ class PlayingState(BaseState):
         """
         stats_copy = self.stats.copy()
         stats_copy["timestamp"]   = pygame.time.get_ticks()
-        stats_copy["time_played"] = (pygame.time.get_ticks() - self.start_time) / 1000.0
+        stats_copy["time_played"] = self.time_played
 
         if self.manager.user_data:
             user_info = self.manager.user_data.get('user', {})
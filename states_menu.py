@@ -18,15 +18,17 @@ Sdílené základní třídy jsou v states.py.
 """
 
 import math
+import numpy as np
 import pygame
 import requests
 from threading import Thread
 
-from config import MenuConfig, AppConfig
+from config import GameConfig, MenuConfig, AppConfig
 from visuals import font_cache
 from button import Button, InputBox
 from states import BaseState, ButtonMenuState, GameState
 from settings import load_config, save_config
+from background import bake_space_background
 
 
 # =============================================================================
@@ -42,18 +44,30 @@ class IntroState(BaseState):
       2. Hyperspace (po 4 s nebo stisku klávesy): sinusová deformace textu,
          fade to black, přechod do MainMenu.
 
+    Hyperspace deformace posouvá řádky titulku (po 2 px) sinusově do stran
+    a titulek roztahuje. Dřív se každý řádek ořízl přes subsurface(),
+    zvlášť škáloval a blitoval a fade povrch se alokoval každý snímek.
+    Protože všechny řádky mají ve snímku stejné měřítko, stačí titulek
+    škálovat jednou, posuny řádků spočítat najednou v NumPy a řádky
+    vykreslit jedním blits() s oblastí (area) ze škálovaného titulku;
+    výsledek je shodný po pixelech.
+
     Attributes:
         timer (float): Uplynulý čas od vstupu do stavu (s).
         hyperspace (bool): True = aktivní hyperspace animace.
         hyperspace_timer (float): Uplynulý čas hyperspace animace (s).
     """
 
+    WARP_SLICE_H = 2    # Výška řádku hyperspace deformace (px)
+
     def __init__(self, manager):
         super().__init__(manager)
         self.timer = 0.0
         self.hyperspace = False
         self.hyperspace_timer = 0.0
         self.title = "Bubble Shooter"
+        self._title_surface = None    # Titulek vykreslený jednou (96 pt)
+        self._fade = None             # Trvalý povrch pro fade to black
 
     def enter(self, payload=None):
         """Resetuje všechny timery při každém vstupu."""
@@ -80,53 +94,57 @@ class IntroState(BaseState):
                 self.manager.change_state(GameState.MAIN_MENU)
 
     def render(self, surface: pygame.Surface):
-        """Vykreslí titulek s pulzujícím jasem nebo hyperspace deformací."""
+        """
+        Vykreslí titulek s pulzujícím jasem nebo hyperspace deformací.
+
+        Returns:
+            list | None: Obdélníky titulku a nápovědy; None během
+                         hyperspace (fade přes celou obrazovku).
+        """
         width, height = pygame.display.get_surface().get_size()
         center_x = width // 2
         center_y = height // 2
 
-        title_font = font_cache.get(96)
-        base_surface = title_font.render(self.title, True, (255, 255, 255))
+        if self._title_surface is None:
+            self._title_surface = font_cache.get(96).render(self.title, True, (255, 255, 255))
+        base_surface = self._title_surface
         text_w, text_h = base_surface.get_size()
 
         if not self.hyperspace:
             pulse = math.sin(self.timer * 1.5) * 20
             alpha = max(0, min(255, int(200 + pulse)))
             base_surface.set_alpha(alpha)
-            surface.blit(base_surface, base_surface.get_rect(center=(center_x, center_y)))
+            rects = [surface.blit(base_surface, base_surface.get_rect(center=(center_x, center_y)))]
 
             if self.timer > 2.0:
-                font = font_cache.get(24)
-                hint = font.render("Press any key to skip", True, (120, 120, 120))
-                surface.blit(hint, hint.get_rect(center=(center_x, height - 80)))
-            return
+                hint = font_cache.render("Press any key to skip", 24, (120, 120, 120))
+                rects.append(surface.blit(hint, hint.get_rect(center=(center_x, height - 80))))
+            return rects
 
-        # Hyperspace deformace
+        # Hyperspace deformace — titulek se škáluje jednou pro všechny řádky
+        base_surface.set_alpha(255)
         warp_power    = min(1.0, self.hyperspace_timer / 1.5)
         warp_strength = int(70 * warp_power)
-        slice_h = 2
-
-        for y in range(0, text_h, slice_h):
-            current_h = min(slice_h, text_h - y)
-            if current_h <= 0:
-                continue
-
-            slice_rect = pygame.Rect(0, y, text_w, current_h)
-            slice_surf = base_surface.subsurface(slice_rect)
-
-            offset_x = int(math.sin(y * 0.15 + self.hyperspace_timer * 25) * warp_strength)
-            scale = 1 + warp_power * 0.8
-            warped_slice = pygame.transform.scale(slice_surf, (int(text_w * scale), current_h))
-
-            draw_x = center_x - warped_slice.get_width() // 2 + offset_x
-            draw_y = center_y - text_h // 2 + y
-            surface.blit(warped_slice, (draw_x, draw_y))
+        scale = 1 + warp_power * 0.8
+        warped = pygame.transform.scale(base_surface, (int(text_w * scale), text_h))
+        warped_w = warped.get_width()
+
+        rows = np.arange(0, text_h, self.WARP_SLICE_H)
+        offsets = (np.sin(rows * 0.15 + self.hyperspace_timer * 25) * warp_strength).astype(np.int64)
+        left = center_x - warped_w // 2
+        top = center_y - text_h // 2
+        surface.blits([
+            (warped, (left + offset_x, top + y), (0, y, warped_w, self.WARP_SLICE_H))
+            for y, offset_x in zip(rows.tolist(), offsets.tolist())
+        ], doreturn=False)
 
         fade_alpha = min(255, int(self.hyperspace_timer * 180))
-        fade = pygame.Surface((width, height))
-        fade.fill((0, 0, 0))
-        fade.set_alpha(fade_alpha)
-        surface.blit(fade, (0, 0))
+        if self._fade is None or self._fade.get_size() != (width, height):
+            self._fade = pygame.Surface((width, height))
+            self._fade.fill((0, 0, 0))
+        self._fade.set_alpha(fade_alpha)
+        surface.blit(self._fade, (0, 0))
+        return None
 
 
 # =============================================================================
@@ -219,9 +237,14 @@ class SettingsState(ButtonMenuState):
 
 class GraphicsState(ButtonMenuState):
     """
-    Obrazovka pro výběr rozlišení okna.
+    Obrazovka pro výběr rozlišení okna a měřítka vykreslování.
 
     Výběr se uloží do config.json a projeví se po restartu aplikace.
+    Vesmírné pozadí pro nové rozlišení se hned předpeče do cache na disku
+    (background.py) ve vedlejším vlákně.
+
+    Tlačítko měřítka vykreslování přepíná GameConfig.RENDER_SCALE mezi
+    volbami GameConfig.RENDER_SCALES; změna platí hned od další hry.
 
     Attributes:
         resolutions (list): Dostupná rozlišení [(šířka, výška), ...].
@@ -257,6 +280,10 @@ class GraphicsState(ButtonMenuState):
                 lambda res=(w, h): self.set_resolution(res)
             )
             self.buttons.append(btn)
+        scale_text = f"Render scale: {round(GameConfig.RENDER_SCALE * 100)}%"
+        self.buttons.append(Button(
+            scale_text, (width // 2, y_start + len(self.resolutions) * 80), self.cycle_render_scale
+        ))
         self.buttons.append(Button("Back", (width // 2, height // 2 + 200), self.on_back))
 
     def set_resolution(self, res: tuple):
@@ -268,17 +295,38 @@ class GraphicsState(ButtonMenuState):
         self.current_resolution = res
         self.create_buttons()
 
+        # Předpeče pozadí pro nové rozlišení, aby další start jen načetl cache
+        if config["background_seed"] is not None:
+            Thread(target=bake_space_background,
+                   args=(res[0], res[1], config["background_seed"]),
+                   daemon=True).start()
+
+    def cycle_render_scale(self):
+        """Přepne měřítko vykreslování na další volbu a uloží ho do config.json."""
+        scales = GameConfig.RENDER_SCALES
+        current = GameConfig.RENDER_SCALE
+        index = scales.index(current) if current in scales else -1
+        GameConfig.RENDER_SCALE = scales[(index + 1) % len(scales)]
+
+        config = load_config()
+        config["render_scale"] = GameConfig.RENDER_SCALE
+        save_config(config)
+        self.message = f"Měřítko vykreslování nastaveno na {round(GameConfig.RENDER_SCALE * 100)} %."
+        self.create_buttons()
+
     def on_back(self):
         self.manager.change_state(GameState.SETTINGS)
 
-    def render(self, surface: pygame.Surface):
+    def render(self, surface: pygame.Surface) -> list:
         """Vykreslí titulek, tlačítka a informační zprávu."""
-        super().render(surface)
+        rects = super().render(surface)
         if self.message:
             width, height = pygame.display.get_surface().get_size()
-            msg_font    = font_cache.get(24)
-            msg_surface = msg_font.render(self.message, True, (255, 255, 0))
-            surface.blit(msg_surface, msg_surface.get_rect(center=(width // 2, height // 2 + 300)))
+            msg_surface = font_cache.render(self.message, 24, (255, 255, 0))
+            rects.append(surface.blit(
+                msg_surface, msg_surface.get_rect(center=(width // 2, height // 2 + 300))
+            ))
+        return rects
 
 
 # =============================================================================
@@ -306,6 +354,9 @@ class LoginState(BaseState):
         is_loading (bool): True = čeká se na server, vstup blokován.
     """
 
+    background_color = (30, 30, 30)   # Vlastní pozadí — vyplní ho Compositor
+    backdrop_layers = ()              # Hvězdy ani meteory nejsou pod formulářem vidět
+
     def __init__(self, manager):
         super().__init__(manager)
         self.title    = "Login Screen"
@@ -371,40 +422,44 @@ class LoginState(BaseState):
         self.login_button.update(dt, mouse_pos)
         self.back_button.update(dt, mouse_pos)
 
-    def render(self, surface: pygame.Surface):
-        """Vykreslí přihlašovací formulář."""
-        surface.fill((30, 30, 30))
+    def render(self, surface: pygame.Surface) -> list:
+        """
+        Vykreslí přihlašovací formulář.
+
+        Pozadí (background_color) vyplní Compositor před voláním render().
 
+        Returns:
+            list: Obdélníky všech prvků formuláře.
+        """
         width, height = pygame.display.get_surface().get_size()
 
-        title_font = font_cache.get(48)
-        title_text = title_font.render("Přihlášení", True, (255, 255, 255))
-        surface.blit(title_text, title_text.get_rect(center=(width // 2, height // 4)))
+        title_text = font_cache.render("Přihlášení", 48, (255, 255, 255))
+        rects = [surface.blit(title_text, title_text.get_rect(center=(width // 2, height // 4)))]
 
-        label_font = font_cache.get(24)
-        surface.blit(
-            label_font.render("Uživatelské jméno:", True, (200, 200, 200)),
+        rects.append(surface.blit(
+            font_cache.render("Uživatelské jméno:", 24, (200, 200, 200)),
             (width // 2 - 200, height // 2 - 70)
-        )
-        surface.blit(
-            label_font.render("Heslo:", True, (200, 200, 200)),
+        ))
+        rects.append(surface.blit(
+            font_cache.render("Heslo:", 24, (200, 200, 200)),
             (width // 2 - 200, height // 2)
-        )
+        ))
 
-        self.username_box.draw(surface)
-        self.password_box.draw(surface)
-        self.login_button.render(surface)
-        self.back_button.render(surface)
+        rects.append(self.username_box.draw(surface))
+        rects.append(self.password_box.draw(surface))
+        rects.append(self.login_button.render(surface))
+        rects.append(self.back_button.render(surface))
 
         if self.message:
-            msg_font = font_cache.get(24)
-            msg_text = msg_font.render(self.message, True, self.message_color)
-            surface.blit(msg_text, msg_text.get_rect(center=(width // 2, height // 2 + 220)))
+            msg_text = font_cache.render(self.message, 24, self.message_color)
+            rects.append(surface.blit(msg_text, msg_text.get_rect(center=(width // 2, height // 2 + 220))))
 
         if self.is_loading:
-            loading_font = font_cache.get(20)
-            loading_text = loading_font.render("Probíhá přihlašování...", True, (255, 255, 0))
-            surface.blit(loading_text, loading_text.get_rect(center=(width // 2, height // 2 + 260)))
+            loading_text = font_cache.render("Probíhá přihlašování...", 20, (255, 255, 0))
+            rects.append(surface.blit(
+                loading_text, loading_text.get_rect(center=(width // 2, height // 2 + 260))
+            ))
+        return rects
 
     def attempt_login(self):
         """Validuje pole a spustí přihlašovací Thread."""
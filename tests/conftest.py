@@ -0,0 +1,9 @@
+"""
+Společné nastavení testů — testy běží bez okna z kořene projektu.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
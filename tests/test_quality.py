@@ -0,0 +1,109 @@
+"""
+Hystereze regulátoru kvality (quality.py) a nezávislost simulace na úrovni.
+"""
+
+import pytest
+
+from config import GameConfig
+from quality import QualityGovernor, QUALITY_LEVELS
+from simulation import Simulation, AutoInput, fast_forward
+
+
+FPS = 100       # Rozpočet 10 ms
+WINDOW = 10
+DT = 1.0 / FPS
+
+
+@pytest.fixture
+def governor():
+    gov = QualityGovernor(fps=FPS, window=WINDOW)
+    gov.enabled = True
+    return gov
+
+
+def fill(gov: QualityGovernor, work_ms: float) -> None:
+    """Naplní okno průměru (během plnění se úroveň nemění)."""
+    for _ in range(WINDOW):
+        assert not gov.push(work_ms, DT)
+
+
+def hold_time(gov: QualityGovernor, work_ms: float, limit: float = 30.0):
+    """Posílá snímky s work_ms po naplnění okna; vrátí čas (s) do změny úrovně, nebo None."""
+    fill(gov, work_ms)
+    elapsed = 0.0
+    while elapsed < limit:
+        elapsed += DT
+        if gov.push(work_ms, DT):
+            return elapsed
+    return None
+
+
+def test_steps_down_after_down_hold(governor):
+    work = governor.budget_ms * (GameConfig.QUALITY_DOWN_RATIO + 0.2)
+    t = hold_time(governor, work)
+    assert t == pytest.approx(GameConfig.QUALITY_DOWN_HOLD, abs=2 * DT)
+    assert governor.level == 1
+    assert governor.changes[-1][1:3] == (0, 1)
+
+
+def test_steps_up_only_after_up_hold(governor):
+    governor.level = 2
+    work = governor.budget_ms * (GameConfig.QUALITY_UP_RATIO - 0.2)
+    t = hold_time(governor, work)
+    assert t == pytest.approx(GameConfig.QUALITY_UP_HOLD, abs=2 * DT)
+    assert governor.level == 1
+
+
+def test_up_hold_is_longer_than_down_hold():
+    assert GameConfig.QUALITY_UP_HOLD > GameConfig.QUALITY_DOWN_HOLD
+    assert GameConfig.QUALITY_UP_RATIO < GameConfig.QUALITY_DOWN_RATIO
+
+
+def test_dead_band_keeps_level(governor):
+    governor.level = 1
+    ratio = (GameConfig.QUALITY_UP_RATIO + GameConfig.QUALITY_DOWN_RATIO) / 2
+    assert hold_time(governor, governor.budget_ms * ratio) is None
+    assert governor.level == 1
+    assert governor.changes == []
+
+
+def test_short_spike_does_not_step_down(governor):
+    fill(governor, governor.budget_ms * 0.7)
+    # Tlak kratší než QUALITY_DOWN_HOLD, pak průměr zpět v mrtvém pásmu
+    spike = int(GameConfig.QUALITY_DOWN_HOLD / DT) // 2
+    for _ in range(spike):
+        assert not governor.push(governor.budget_ms * 3, DT)
+    for _ in range(int(GameConfig.QUALITY_DOWN_HOLD / DT) * 4):
+        assert not governor.push(governor.budget_ms * 0.7, DT)
+    assert governor.level == 0
+
+
+def test_level_bounds(governor):
+    governor.level = len(QUALITY_LEVELS) - 1
+    assert hold_time(governor, governor.budget_ms * 3, limit=5.0) is None
+    governor.level = 0
+    governor.reset()
+    assert hold_time(governor, 0.0, limit=10.0) is None
+
+
+def test_disabled_never_changes(governor):
+    governor.enabled = False
+    assert hold_time(governor, governor.budget_ms * 3, limit=5.0) is None
+    assert governor.level == 0
+
+
+def test_quality_does_not_change_simulation():
+    # Nejnižší úroveň mění jen vizuální stránku — hra musí dopadnout stejně
+    low = QUALITY_LEVELS[-1]
+    full = Simulation(input_source=AutoInput(), seed=99)
+    reduced = Simulation(input_source=AutoInput(), seed=99)
+    reduced.particles.burst_scale = low["particles"]
+    reduced.projectiles.trail_draw = max(1, round(reduced.projectiles.TRAIL * low["trail"]))
+    reduced.coalesce_texts = low["coalesce"]
+
+    fast_forward(full, 30.0)
+    fast_forward(reduced, 30.0)
+    assert full.stats == reduced.stats
+    assert full.player.pos == reduced.player.pos
+    assert full.enemies.pos[:full.enemies.count].tolist() == \
+        reduced.enemies.pos[:reduced.enemies.count].tolist()
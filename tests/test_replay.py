@@ -0,0 +1,73 @@
+"""
+Determinismus simulace a round-trip záznamu .bsr (replay.py).
+
+Stejný seed a stejný vstup musí vést ke stejné hře — na tom stojí
+přehrávání záznamů i to, že regulátor kvality (quality.py) smí měnit
+jen vizuální stránku.
+"""
+
+import numpy as np
+
+from replay import Replay, ReplayRecorder, play
+from simulation import Simulation, AutoInput, fast_forward
+
+
+SEED = 1234
+SECONDS = 30.0
+
+
+def snapshot(sim: Simulation) -> dict:
+    """Stav simulace, který se musí při přehrání shodovat."""
+    n = sim.enemies.count
+    m = sim.projectiles.count
+    return {
+        "stats":       dict(sim.stats),
+        "elapsed":     sim.elapsed_time,
+        "game_over":   sim.game_over,
+        "player":      (sim.player.pos.x, sim.player.pos.y, sim.player.health),
+        "enemies":     sim.enemies.pos[:n].tolist(),
+        "enemy_hp":    sim.enemies.health[:n].tolist(),
+        "projectiles": sim.projectiles.pos[:m].tolist(),
+    }
+
+
+def record(tmp_path, dts=None) -> tuple:
+    """Odehraje hru s botem, uloží záznam a vrátí (cesta, snímek stavu)."""
+    sim = Simulation(input_source=AutoInput(), seed=SEED)
+    sim.recorder = ReplayRecorder(sim)
+    if dts is None:
+        fast_forward(sim, SECONDS)
+    else:
+        for dt in dts:
+            sim.advance(dt)
+    path = str(tmp_path / "hra.bsr")
+    sim.recorder.save(path)
+    return path, snapshot(sim)
+
+
+def test_replay_round_trip(tmp_path):
+    path, recorded = record(tmp_path)
+    assert recorded["stats"]["projectiles_fired"] > 0
+
+    replay = Replay.load(path)
+    assert replay.seed == SEED
+    assert replay.stats == recorded["stats"]
+
+    assert snapshot(play(replay)) == recorded
+
+
+def test_replay_round_trip_variable_dt(tmp_path):
+    # Nepravidelné snímky — dohánění i odložená kliknutí ve FixedStepper
+    rng = np.random.default_rng(7)
+    dts = rng.uniform(0.001, 0.05, 1500).tolist()
+    path, recorded = record(tmp_path, dts)
+
+    assert snapshot(play(Replay.load(path))) == recorded
+
+
+def test_same_seed_same_game():
+    a = Simulation(input_source=AutoInput(), seed=SEED)
+    b = Simulation(input_source=AutoInput(), seed=SEED)
+    fast_forward(a, SECONDS)
+    fast_forward(b, SECONDS)
+    assert snapshot(a) == snapshot(b)
@@ -0,0 +1,34 @@
+"""
+Začátek hry v Simulation — cooldowny nesmí platit od prvního kroku.
+"""
+
+import pygame
+
+from config import GameConfig
+from simulation import Simulation, FrameInput, KeyState
+
+
+def test_fire_on_first_step():
+    sim = Simulation(seed=1)
+    sim.step(sim.stepper.step, FrameInput(mouse_pos=(500, 300), clicks=1))
+    assert sim.stats["projectiles_fired"] == 1
+
+
+def test_fire_at_time_zero():
+    sim = Simulation(seed=1)
+    assert sim.fire(sim.player.pos + pygame.Vector2(100, 0), 0)
+    assert not sim.fire(sim.player.pos + pygame.Vector2(100, 0), GameConfig.PROJECTILE_DELAY - 1)
+
+
+def test_contact_damage_on_first_step():
+    sim = Simulation(seed=1)
+    pos = sim.player.pos
+    sim.enemies.spawn(pos.x + 5, pos.y, 60)
+    sim.step(sim.stepper.step)
+    assert sim.stats["player_collisions"] == 1
+
+
+def test_dash_ready_on_first_step():
+    sim = Simulation(seed=1)
+    sim.step(sim.stepper.step, FrameInput(KeyState({pygame.K_LCTRL, pygame.K_d})))
+    assert sim.player.dashing
@@ -0,0 +1,68 @@
+"""
+timestep.py
+===========
+Akumulátor pevného časového kroku pro herní simulaci.
+
+Proměnné dt z clock.tick() způsobovalo, že fyzika závisela na FPS
+a jediný pomalý snímek nechal projektily "protunelovat" nepřáteli.
+FixedStepper sčítá skutečně uplynulý čas a vydává ho simulaci
+v krocích pevné délky (např. 1/120 s). Zbytek, který nestačí na celý
+krok, určuje interpolační faktor alpha pro vykreslení mezi posledními
+dvěma stavy simulace.
+"""
+
+
+class FixedStepper:
+    """
+    Převádí proměnné dt snímků na počet pevných simulačních kroků.
+
+    Attributes:
+        step (float): Délka jednoho simulačního kroku (s).
+        max_steps (int): Maximální počet kroků za jeden snímek — po delším
+                         záseku se přebytečný čas zahodí, aby simulace
+                         nedoháněla donekonečna ("spiral of death").
+        accumulator (float): Nasbíraný čas, který ještě nebyl odsimulován (s).
+        alpha (float): Podíl nedokončeného kroku (0–1) pro interpolaci vykreslení.
+        dropped_time (float): Celkový zahozený čas kvůli limitu max_steps (s).
+    """
+
+    def __init__(self, hz: float, max_steps: int):
+        """
+        Args:
+            hz: Frekvence simulace (kroky za sekundu).
+            max_steps: Maximální počet kroků dohánění za snímek.
+        """
+        self.step = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_time = 0.0
+
+    def reset(self) -> None:
+        """Vynuluje akumulátor (např. při začátku nové hry)."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Přičte čas snímku a vrátí počet simulačních kroků k provedení.
+
+        Args:
+            frame_dt: Skutečná délka snímku v sekundách.
+
+        Returns:
+            int: Počet kroků délky self.step (0 až max_steps).
+        """
+        self.accumulator += frame_dt
+        steps = int(self.accumulator // self.step)
+
+        if steps > self.max_steps:
+            excess = (steps - self.max_steps) * self.step
+            self.accumulator -= excess
+            self.dropped_time += excess
+            steps = self.max_steps
+
+        self.accumulator -= steps * self.step
+        # Zaokrouhlovací chyby mohou alpha posunout těsně mimo 0–1
+        self.alpha = min(max(self.accumulator / self.step, 0.0), 1.0)
+        return steps
@@ -18,6 +18,28 @@ from config import GameConfig
 from visuals import Colors
 from projectiles import Projectile
 from enemy import Enemy
+from pool import ObjectPool
+
+
+# =============================================================================
+# POOL TEXTŮ POŠKOZENÍ
+# =============================================================================
+def _new_damage_text() -> dict:
+    """Vytvoří prázdný záznam plovoucího textu (factory pro pool)."""
+    return {
+        'pos':      pygame.Vector2(),
+        'text':     '',
+        'value':    0,
+        'life':     0.0,
+        'max_life': 0.0,
+        'vel':      pygame.Vector2(),
+    }
+
+
+# Globální pool — záznamy vrací PlayingState po vypršení jejich životnosti
+damage_text_pool = ObjectPool(
+    _new_damage_text, capacity=GameConfig.POOL_DAMAGE_TEXTS, name="DamageText"
+)
 
 
 # =============================================================================
@@ -53,7 +75,7 @@ class HelperFunctions:
     @staticmethod
     def spawn_hit_particles(pos: pygame.Vector2, color: tuple,
                             count: int = 12, speed: float = 200,
-                            lifetime: float = 0.5) -> list:
+                            lifetime: float = 0.5, rng=random) -> list:
         """
         Vytvoří seznam částic explodujících z dané pozice.
 
@@ -63,16 +85,17 @@ class HelperFunctions:
             count: Počet vygenerovaných částic.
             speed: Maximální rychlost částice (px/s).
             lifetime: Životnost každé částice (s).
+            rng: Zdroj náhody (random.Random nebo modul random).
 
         Returns:
             list: Seznam slovníků částic.
         """
         new_particles = []
         for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
+            angle = rng.uniform(0, math.pi * 2)
             vel = pygame.Vector2(
                 math.cos(angle), math.sin(angle)
-            ) * random.uniform(speed * 0.3, speed)
+            ) * rng.uniform(speed * 0.3, speed)
 
             new_particles.append({
                 'pos':      pos.copy(),
@@ -80,7 +103,7 @@ class HelperFunctions:
                 'life':     lifetime,
                 'max_life': lifetime,
                 'color':    color,
-                'radius':   random.uniform(2, 5)
+                'radius':   rng.uniform(2, 5)
             })
         return new_particles
 
@@ -91,6 +114,10 @@ class HelperFunctions:
         """
         Vytvoří plovoucí text zobrazující způsobené poškození.
 
+        Záznam se vydá z damage_text_pool a vyplní na místě (bez alokace
+        nových Vector2) — po vypršení ho volající vrátí přes
+        damage_text_pool.release().
+
         Args:
             pos: Počáteční pozice textu.
             text: Hodnota k zobrazení (typicky číslo poškození).
@@ -98,55 +125,70 @@ class HelperFunctions:
             life: Životnost textu v sekundách.
 
         Returns:
-            dict: Slovník s klíči 'pos','text','life','max_life','vel'.
+            dict: Slovník s klíči 'pos','text','value','life','max_life','vel'.
         """
-        return {
-            'pos':      pos.copy(),
-            'text':     str(text),
-            'life':     life,
-            'max_life': life,
-            'vel':      pygame.Vector2(0, -40)
-        }
+        t = damage_text_pool.acquire()
+        t['pos'].update(pos)
+        t['text'] = str(text)
+        t['value'] = text
+        t['life'] = life
+        t['max_life'] = life
+        t['vel'].update(0, -40)
+        return t
 
     @staticmethod
-    def spawn_enemy_improved() -> 'Enemy':
+    def spawn_enemy_improved(swarm=None, rng=random) -> 'Enemy':
         """
         Vytvoří nového nepřítele na náhodné straně obrazovky.
 
+        Args:
+            swarm: EnemySwarm, do kterého se nepřítel rovnou vloží.
+                   None = samostatný nepřítel (testy, jednotlivé použití).
+            rng: Zdroj náhody pro stranu a zdraví (random.Random nebo modul random).
+
         Returns:
             Enemy: Nová instance nepřítele.
         """
-        side = random.choice(["left", "right"])
+        side = rng.choice(["left", "right"])
         x = (-GameConfig.ENEMY_RADIUS if side == "left"
              else GameConfig.WIDTH + GameConfig.ENEMY_RADIUS)
-        hp = random.randint(GameConfig.ENEMY_MIN_HP, GameConfig.ENEMY_MAX_HP)
+        hp = rng.randint(GameConfig.ENEMY_MIN_HP, GameConfig.ENEMY_MAX_HP)
+        if swarm is not None:
+            return swarm.spawn(x, GameConfig.GROUND_LEVEL, hp)
         from enemy import Enemy
         return Enemy(x, GameConfig.GROUND_LEVEL, hp=hp)
 
     @staticmethod
     def spawn_projectile_instance(player_pos: pygame.Vector2,
-                                  current_time: int) -> 'Projectile':
+                                  current_time: int, batch=None,
+                                  target=None, rng=random) -> 'Projectile':
         """
         Vytvoří nový projektil namířený od hráče ke kurzoru myši.
 
         Args:
             player_pos: Aktuální pozice hráče.
             current_time: Aktuální pygame timestamp (ms).
+            batch: ProjectileBatch, do které se projektil rovnou vloží.
+                   None = samostatný projektil.
+            target: Cílový bod výstřelu. None = aktuální pozice kurzoru
+                    (pygame.mouse.get_pos()).
+            rng: Zdroj náhody pro rozptyl a barvu (random.Random nebo modul random).
 
         Returns:
             Projectile: Nová instance projektilu.
         """
-        mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
-        direction = mouse_pos - player_pos
+        if target is None:
+            target = pygame.mouse.get_pos()
+        direction = pygame.Vector2(target) - player_pos
 
         if direction.length() > 0:
             direction = direction.normalize()
 
         direction = direction.rotate_rad(
-            random.uniform(-GameConfig.SPREAD, GameConfig.SPREAD)
+            rng.uniform(-GameConfig.SPREAD, GameConfig.SPREAD)
         )
 
-        color = random.choice(GameConfig.PROJECTILE_COLORS)
+        color = rng.choice(GameConfig.PROJECTILE_COLORS)
 
         effect_map = {
             Colors.RED:    "explosive",
@@ -157,6 +199,12 @@ class HelperFunctions:
         }
         effect_type = effect_map.get(color, "none")
 
+        if batch is not None:
+            return batch.spawn(
+                player_pos, direction * GameConfig.PROJECTILE_SPEED,
+                color, effect_type
+            )
+
         from projectiles import Projectile
         return Projectile(
             pos=player_pos.copy(),
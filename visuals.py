@@ -5,12 +5,15 @@ Vizuální konstanty, cache fontů a hvězdné pozadí menu.
 
 Modul sdružuje tři nezávislé části:
   1. Colors  — centrální paleta barev pro celou hru
-  2. FontCache — LRU-like cache fontu, zamezuje opakovanému načítání
-  3. Star systém — 3vrstvé parallax hvězdné pozadí s hyperspace efektem
+  2. FontCache — omezená LRU cache fontů a vykreslených textů
+  3. StarField — 3vrstvé parallax hvězdné pozadí s hyperspace efektem
+                (pole NumPy, kreslení sprity čar ze streak())
 """
 
 import math
-import random
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 from config import MenuConfig
 
@@ -56,44 +59,79 @@ class Colors:
 # =============================================================================
 class FontCache:
     """
-    Cache pro pygame fonty různých velikostí.
+    Omezená LRU cache pro pygame fonty a vykreslené texty.
 
     Pygame vytváří nový font objekt pro každou velikost. Opakované
     volání pygame.font.Font() při každém snímku by bylo výkonnostně
     nákladné. FontCache udrží jednu instanci fontu pro každou použitou
     velikost a vrátí ji při opakovaném dotazu.
 
+    Button animuje velikost písma plynule (lerp mezi základní a 1.25×
+    velikostí), proto se velikost zaokrouhlí na násobek size_step
+    a počet fontů i vykreslených textů je shora omezen — nejdéle
+    nepoužité položky se zahodí.
+
     Attributes:
-        fonts (dict): Slovník {velikost: pygame.font.Font}.
+        fonts (OrderedDict): {velikost: pygame.font.Font} v pořadí použití.
+        texts (OrderedDict): {(text, velikost, barva): pygame.Surface} v pořadí použití.
         font_path (str | None): Cesta k TTF souboru vlastního fontu.
         fallback (str): Název systémového fontu jako záloha.
+        size_step (int): Krok kvantizace velikosti písma.
+        max_fonts (int): Max. počet fontů v cache.
+        max_texts (int): Max. počet vykreslených textů v cache.
+        font_hits, font_misses (int): Čítače cache fontů (get()).
+        text_hits, text_misses (int): Čítače cache vykreslených textů (render()).
+        evictions (int): Počet zahozených položek (fonty i texty).
     """
 
-    def __init__(self, font_path: str = None):
+    def __init__(self, font_path: str = None,
+                 size_step: int = MenuConfig.FONT_SIZE_STEP,
+                 max_fonts: int = MenuConfig.FONT_CACHE_SIZE,
+                 max_texts: int = MenuConfig.TEXT_CACHE_SIZE):
         """
         Inicializuje cache.
 
         Args:
             font_path: Cesta k TTF souboru vlastního fontu.
                        Pokud None nebo soubor neexistuje, použije se fallback.
+            size_step: Krok kvantizace velikosti (1 = jen zaokrouhlení na celé body).
+            max_fonts: Max. počet fontů v cache.
+            max_texts: Max. počet vykreslených textů v cache.
         """
-        self.fonts = {}
+        self.fonts = OrderedDict()
+        self.texts = OrderedDict()
         self.font_path = font_path
         self.fallback = 'arial'
+        self.size_step = max(1, size_step)
+        self.max_fonts = max_fonts
+        self.max_texts = max_texts
+        self.font_hits = 0
+        self.font_misses = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        self.evictions = 0
+
+    def quantize(self, size: float) -> int:
+        """Zaokrouhlí velikost písma na nejbližší násobek size_step (min. 1)."""
+        step = self.size_step
+        return max(1, int(round(size / step)) * step)
 
     def get(self, size: int) -> pygame.font.Font:
         """
         Vrátí font zadané velikosti. Pokud ještě není v cache, vytvoří ho.
 
         Args:
-            size: Velikost fontu v bodech.
+            size: Velikost fontu v bodech (float se kvantizuje).
 
         Returns:
             pygame.font.Font: Instance fontu připravená k vykreslování.
         """
-        size = int(size)  # Zajistí celočíselnou velikost (lerp vrací float)
-        if size in self.fonts:
-            return self.fonts[size]  # Cache hit — vrátíme existující instanci
+        size = self.quantize(size)  # lerp vrací float — zaokrouhlí se na krok
+        font = self.fonts.get(size)
+        if font is not None:
+            self.fonts.move_to_end(size)
+            self.font_hits += 1
+            return font  # Cache hit — vrátíme existující instanci
 
         # Cache miss — vytvoříme nový font a uložíme do cache
         try:
@@ -106,115 +144,225 @@ class FontCache:
             # Vlastní font se nepodařilo načíst (chybí soubor) — fallback
             font = pygame.font.SysFont(self.fallback, size)
 
+        self.font_misses += 1
         self.fonts[size] = font
+        self._evict(self.fonts, self.max_fonts)
         return font
 
+    def render(self, text: str, size: float, color: tuple,
+               antialias: bool = True) -> pygame.Surface:
+        """
+        Vrátí vykreslený text z cache (při prvním dotazu ho vykreslí).
+
+        Vrácený povrch je sdílený — volající ho nesmí měnit
+        (např. set_alpha); pro úpravy si musí udělat kopii.
+
+        Args:
+            text: Text k vykreslení.
+            size: Velikost fontu (kvantizuje se jako v get()).
+            color: RGB barva textu.
+            antialias: Vyhlazování hran.
+
+        Returns:
+            pygame.Surface: Vykreslený text.
+        """
+        key = (text, self.quantize(size), tuple(color), antialias)
+        surf = self.texts.get(key)
+        if surf is not None:
+            self.texts.move_to_end(key)
+            self.text_hits += 1
+            return surf
+
+        # Font pro text se počítá jen do čítačů fontů (get()), text jako miss
+        surf = self.get(size).render(text, antialias, color)
+        self.text_misses += 1
+        self.texts[key] = surf
+        self._evict(self.texts, self.max_texts)
+        return surf
+
+    def _evict(self, cache: OrderedDict, limit: int) -> None:
+        """Zahodí nejdéle nepoužité položky nad limit."""
+        while len(cache) > limit:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """
+        Vrátí stav cache.
+
+        Returns:
+            dict: Klíče 'fonts', 'texts', 'font_hits', 'font_misses',
+                  'text_hits', 'text_misses', 'evictions'.
+        """
+        return {
+            "fonts":       len(self.fonts),
+            "texts":       len(self.texts),
+            "font_hits":   self.font_hits,
+            "font_misses": self.font_misses,
+            "text_hits":   self.text_hits,
+            "text_misses": self.text_misses,
+            "evictions":   self.evictions,
+        }
+
 
 # Globální instance cache — používají ji všechny moduly přes `from visuals import font_cache`
 font_cache = FontCache(MenuConfig.MENU_FONT_PATH)
 
 
+# =============================================================================
+# SPRITY ČAR (hvězdy, meteory)
+# =============================================================================
+# Svislá čára tloušťky 2 px z pygame.draw.line je plný obdélník 2×(délka+1),
+# takže se dá nahradit blitem předkresleného povrchu. Cache podle
+# (barva, délka, hyperspace faktor) sdílí hvězdy i meteory z menu.py.
+_streaks = {}
+
+
+def streak(color: tuple, length: int, factor: float = 1.0) -> pygame.Surface:
+    """
+    Vrátí (při prvním volání vykreslí) svislou čáru 2 px pro blit.
+
+    Args:
+        color: RGB barva čáry.
+        length: Základní délka čáry (px).
+        factor: Prodloužení (hyperspace); vykreslí se délka length * factor.
+    """
+    key = (color, length, factor)
+    surf = _streaks.get(key)
+    if surf is None:
+        surf = pygame.Surface((2, int(length * factor) + 1))
+        surf.fill(color)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        _streaks[key] = surf
+    return surf
+
+
 # =============================================================================
 # HVĚZDNÉ POZADÍ (parallax, 3 vrstvy)
 # =============================================================================
-class Star:
+class StarField:
     """
-    Jedna hvězda v parallax hvězdném pozadí.
+    Parallax hvězdné pozadí uložené v polích NumPy.
 
     Hvězdy se pohybují shora dolů (simulace pohledu do vesmíru ze shora).
     Různé rychlosti v různých vrstvách vytvářejí hloubkový (parallax) efekt.
-    Při hyperspace módu se rychlost znásobí 5×.
+    Při hyperspace módu se rychlost i délka čáry znásobí HYPERSPACE_FACTOR×.
+
+    Dřív byla každá hvězda objekt Star s vlastním update() a voláním
+    pygame.draw.line. Pohyb se teď počítá najednou pro celá pole a
+    kreslení je jedno Surface.blits() se sprity čar ze streak(), takže
+    počet hvězd (MenuConfig.MENU_NUM_STARS) jde zvednout na tisíce.
 
     Attributes:
-        x, y (float): Aktuální pozice hvězdy.
-        speed (float): Rychlost pohybu dolů (px/s).
-        length (int): Délka čáry hvězdy (px) — delší = vypadá blíž.
-        color (tuple): RGB barva hvězdy.
+        w, h (int): Rozměry obrazovky pro výpočet hranic.
+        x, y (np.ndarray): Aktuální pozice hvězd.
+        speed (np.ndarray): Rychlost pohybu dolů (px/s), včetně faktoru vrstvy.
+        length (np.ndarray): Délka čáry hvězdy (px) — delší = vypadá blíž.
+        color (np.ndarray): Index barvy do MenuConfig.MENU_STAR_COLORS.
+        rng (np.random.Generator): Zdroj náhody pro pozice a vlastnosti hvězd.
     """
 
-    def __init__(self, w: int, h: int, color: tuple, speed: float,
-                 length: int, layer_factor: float):
+    # 3 vrstvy s různou rychlostí — parallax hloubkový efekt:
+    #   Vrstva 1 (pomalá)  → vzdálené hvězdy, jemné pohyby
+    #   Vrstva 2 (střední) → střední vzdálenost
+    #   Vrstva 3 (rychlá)  → blízké hvězdy, výrazný pohyb
+    LAYER_FACTORS = (0.5, 1.0, 1.5)
+    LENGTHS = range(5, 16)          # Možné délky čar (px)
+    HYPERSPACE_FACTOR = 5.0         # Zrychlení a prodloužení čar v hyperspace
+
+    def __init__(self, w: int, h: int, count: int = MenuConfig.MENU_NUM_STARS):
         """
         Args:
-            w, h: Rozměry obrazovky pro výpočet hranic.
-            color: RGB barva hvězdy.
-            speed: Základní rychlost pohybu (px/s).
-            length: Délka vizuální čáry hvězdy (px).
-            layer_factor: Faktor vrstvy (pomalejší vrstvy = vzdálenější hvězdy).
+            w, h: Rozměry obrazovky.
+            count: Celkový počet hvězd (rozdělí se rovnoměrně do vrstev).
         """
         self.w = w
         self.h = h
-        self.color = color
-        self.speed = speed
-        self.length = length
-        self.layer_factor = layer_factor
-        self.reset()
-
-    def reset(self):
-        """Přemístí hvězdu na náhodnou pozici na horní části obrazovky."""
-        self.x = random.uniform(0, self.w)
-        self.y = random.uniform(-self.h, self.h)  # Záporné Y = nad obrazovkou
-
-    def update(self, dt: float, hyperspace: bool):
+        self.rng = np.random.default_rng()
+        rng = self.rng
+
+        per_layer = count // len(self.LAYER_FACTORS)
+        n = per_layer * len(self.LAYER_FACTORS)
+        layer_factor = np.repeat(self.LAYER_FACTORS, per_layer)
+        self.speed = rng.uniform(50, 200, n) * layer_factor  # Náhodná rychlost * faktor vrstvy
+        self.length = rng.integers(self.LENGTHS.start, self.LENGTHS.stop, n)
+        self.color = rng.integers(0, len(MenuConfig.MENU_STAR_COLORS), n)
+        self.x = np.empty(n)
+        self.y = np.empty(n)
+        self.reset(np.arange(n))
+
+        # Index spritu hvězdy (barva × délka) a tabulky spritů podle (pulz, faktor)
+        self._kind = self.color * len(self.LENGTHS) + (self.length - self.LENGTHS.start)
+        self._tables = {}
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def reset(self, idx: np.ndarray) -> None:
+        """Přemístí hvězdy s indexy idx na náhodnou pozici na horní části obrazovky."""
+        self.x[idx] = self.rng.uniform(0, self.w, len(idx))
+        self.y[idx] = self.rng.uniform(-self.h, self.h, len(idx))  # Záporné Y = nad obrazovkou
+
+    def update(self, dt: float, hyperspace: bool) -> None:
         """
-        Posune hvězdu dolů. V hyperspace režimu 5× rychleji.
+        Posune hvězdy dolů. V hyperspace režimu HYPERSPACE_FACTOR× rychleji.
 
         Args:
             dt: Delta time v sekundách.
             hyperspace: True = aktivní warp/hyperspace animace.
         """
-        factor = 5.0 if hyperspace else 1.0
-        self.y += self.speed * factor * dt
-
-        # Hvězda zmizela pod obrazovkou — přemístíme ji zpět nahoru
-        if self.y > self.h:
-            self.reset()
-
-    def draw(self, surface: pygame.Surface, global_pulse: float, hyperspace: bool):
+        factor = self.HYPERSPACE_FACTOR if hyperspace else 1.0
+        self.y += self.speed * (factor * dt)
+
+        # Hvězdy, které zmizely pod obrazovkou, přemístíme zpět nahoru
+        gone = np.flatnonzero(self.y > self.h)
+        if len(gone):
+            self.reset(gone)
+
+    def _table(self, pulse: int, factor: float) -> list:
+        """Vrátí sprity pro všechny indexy _kind při daném kroku pulzu a faktoru."""
+        table = self._tables.get((pulse, factor))
+        if table is None:
+            table = self._tables[(pulse, factor)] = [
+                # Přidáme pulz k barvě (clamp na 0–255 zabrání přetečení)
+                streak(tuple(min(255, max(0, c + pulse)) for c in color), length, factor)
+                for color in MenuConfig.MENU_STAR_COLORS
+                for length in self.LENGTHS
+            ]
+        return table
+
+    def draw(self, surface: pygame.Surface, hyperspace: bool) -> list:
         """
-        Vykreslí hvězdu jako svislou čáru s pulzující jasností.
+        Vykreslí všechny hvězdy na zadaný povrch.
+
+        Globální pulz (sinusová funkce) způsobuje synchronizované mírné
+        blikání všech hvězd — simuluje třpytění vesmírné oblohy.
 
         Args:
-            surface: Cílový pygame povrch.
-            global_pulse: Globální sinusová hodnota (-15 až +15) pro blikání.
-            hyperspace: V hyperspace režimu se délka čáry zvětší 5×.
+            surface: Cílový pygame povrch (hlavní okno).
+            hyperspace: True = hyperspace vizuální efekty (5× delší čáry).
+
+        Returns:
+            list: Obdélníky vykreslených hvězd (pro dirty-rect překreslení).
         """
-        factor = 5.0 if hyperspace else 1.0
-        length_draw = self.length * factor
+        # Sinusový pulz -10 až +10 synchronizovaný s herním časem; barvy jsou
+        # celočíselné, takže int(c + pulz) = c + floor(pulz)
+        pulse = math.floor(math.sin(pygame.time.get_ticks() / 1000.0 * math.pi) * 10)
+        factor = self.HYPERSPACE_FACTOR if hyperspace else 1.0
+        table = self._table(pulse, factor)
 
-        # Přidáme pulz k barvě (clamp na 0–255 zabrání přetečení)
-        color = tuple(min(255, max(0, int(c + global_pulse))) for c in self.color)
-        pygame.draw.line(
-            surface, color,
-            (self.x, self.y),
-            (self.x, self.y + length_draw),
-            2  # Tloušťka čáry v pixelech
-        )
+        # Jen hvězdy, jejichž čára zasahuje do obrazovky (zbytek čeká nad ní)
+        top = np.floor(self.y)
+        idx = np.flatnonzero(top + self.length * factor >= 0)
+        xs = self.x[idx].astype(np.int64).tolist()
+        ys = top[idx].astype(np.int64).tolist()
+        sprites = map(table.__getitem__, self._kind[idx].tolist())
+        return surface.blits(list(zip(sprites, zip(xs, ys))))
 
 
-# =============================================================================
-# INICIALIZACE HVĚZDNÝCH VRSTEV
-# =============================================================================
-# 3 vrstvy s různou hustotou a rychlostí — parallax hloubkový efekt:
-#   Vrstva 1 (pomalá)  → vzdálené hvězdy, jemné pohyby
-#   Vrstva 2 (střední) → střední vzdálenost
-#   Vrstva 3 (rychlá)  → blízké hvězdy, výrazný pohyb
-stars_layers = []
-layer_params = [(50, 0.5), (50, 1.0), (50, 1.5)]  # (počet hvězd, rychlostní faktor)
-
-for num, speed_factor in layer_params:
-    layer = [
-        Star(
-            MenuConfig.MENU_SCREEN_WIDTH,
-            MenuConfig.MENU_SCREEN_HEIGHT,
-            random.choice(MenuConfig.MENU_STAR_COLORS),
-            random.uniform(50, 200) * speed_factor,  # Náhodná rychlost * faktor vrstvy
-            random.randint(5, 15),                    # Náhodná délka čáry
-            speed_factor
-        )
-        for _ in range(num)
-    ]
-    stars_layers.append(layer)
+# Globální hvězdné pozadí menu
+starfield = StarField(MenuConfig.MENU_SCREEN_WIDTH, MenuConfig.MENU_SCREEN_HEIGHT)
 
 
 def update_stars(dt: float, hyperspace: bool) -> None:
@@ -225,25 +373,14 @@ def update_stars(dt: float, hyperspace: bool) -> None:
         dt: Delta time v sekundách od posledního snímku.
         hyperspace: True = zvýšit rychlost pro hyperspace animaci.
     """
-    for layer in stars_layers:
-        for s in layer:
-            s.update(dt, hyperspace)
+    starfield.update(dt, hyperspace)
 
 
-def draw_stars(surface: pygame.Surface, hyperspace: bool) -> None:
+def draw_stars(surface: pygame.Surface, hyperspace: bool) -> list:
     """
     Vykreslí všechny hvězdy na zadaný povrch.
 
-    Globální pulz (sinusová funkce) způsobuje synchronizované mírné
-    blikání všech hvězd — simuluje třpytění vesmírné oblohy.
-
-    Args:
-        surface: Cílový pygame povrch (hlavní okno).
-        hyperspace: True = hyperspace vizuální efekty.
+    Returns:
+        list: Obdélníky vykreslených hvězd (pro dirty-rect překreslení).
     """
-    # Sinusový pulz -10 až +10 synchronizovaný s herním časem
-    global_pulse = math.sin(pygame.time.get_ticks() / 1000.0 * math.pi) * 10
-
-    for layer in stars_layers:
-        for s in layer:
-            s.draw(surface, global_pulse, hyperspace)
\ No newline at end of file
+    return starfield.draw(surface, hyperspace)